@@ -0,0 +1,193 @@
+# 기사 본문 추출 벤치마크: 기존(html.parser 전체 파싱) vs 레지스트리(lxml + SoupStrainer)
+# 실행: python -m benchmarks.bench_article_extract
+#       python -m benchmarks.bench_article_extract --save <기사 URL> [<기사 URL> ...]   (실제 기사 HTML 저장)
+#       python -m benchmarks.bench_article_extract --synthetic   (저장한 페이지가 없는 언론사는 합성 페이지로 대신 측정)
+#
+# benchmarks/fixtures/<언론사>_<번호>.html 에 저장한 실제 기사 페이지를 측정 (언론사마다 여러 개 권장)
+# 파일 첫 줄의 <!-- source: URL content-type: ... --> 로 원래 URL과 응답 헤더를 기록 (URL로 추출 규칙이 정해지므로)
+# 그 뒤는 받은 그대로의 바이트 → 불러올 때 서비스와 같은 decode_html(헤더 → meta → 추정)로 디코딩
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+from statistics import median
+
+import requests
+from bs4 import BeautifulSoup
+
+from crawling.article_extractors import extract_article_text
+from crawling.news_content import decode_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+_SOURCE_LINE = re.compile(rb"^<!-- source: (\S+)(?: content-type: (.*?))? -->\n")
+
+# 언론사 → (도메인, 합성 페이지용 URL, 본문 컨테이너 HTML 템플릿)
+SITES = {
+    "naver": (
+        "naver.com",
+        "https://n.news.naver.com/mnews/article/001/0014000000",
+        '<article id="dic_area" class="go_trans _article_content">{body}</article>',
+    ),
+    "yna": (
+        "yna.co.kr",
+        "https://www.yna.co.kr/view/AKR20250101000100001",
+        '<div id="articleWrap"><article class="story-news article">{body}</article></div>',
+    ),
+    "nocut": (
+        "nocutnews.co.kr",
+        "https://www.nocutnews.co.kr/news/6200000",
+        '<div id="pnlContent" class="viewcontent">{body}</div>',
+    ),
+    "mbn": (
+        "mbn.co.kr",
+        "https://www.mbn.co.kr/news/society/5000000",
+        '<div id="newsViewArea" class="detail">{body}</div>',
+    ),
+}
+
+SENTENCES = [
+    "정부는 오늘 오전 서울 정부청사에서 경제관계장관회의를 열고 하반기 경제정책방향을 발표했다.",
+    "한국은행은 기준금리를 연 3.5%로 동결하며 물가 상승세가 여전히 높다고 밝혔다.",
+    "기상청은 내일 전국에 비가 내리고 오후부터 차차 그칠 것으로 내다봤다.",
+    "지방자치단체는 노인 일자리 사업 예산을 늘려 어르신 2만 명을 추가로 지원하기로 했다.",
+]
+
+
+def legacy_extract(html: str, url: str) -> str:
+    """기존 구현: html.parser로 페이지 전체를 트리로 만든 뒤 선택자 탐색"""
+    soup = BeautifulSoup(html, "html.parser")
+    article = None
+    if "mbn.co.kr" in url:
+        meta_desc = soup.find("meta", attrs={"name": "description"})
+        if meta_desc and meta_desc.get("content"):
+            return meta_desc["content"].strip()
+    if "nocutnews.co.kr" in url:
+        article = soup.select_one("div#pnlContent")
+    elif "yna.co.kr" in url:
+        for sel in ("#articleFailoverContent", "#articleWrap", "#articleContent"):
+            article = soup.select_one(sel)
+            if article and article.get_text(strip=True):
+                break
+    if not article:
+        article = soup.select_one("#dic_area") or soup.find("article")
+    if not article:
+        article = soup.find("div", class_=lambda x: x and "content" in x)
+    if article:
+        for bad in article.select("script, style, aside, .ad"):
+            bad.decompose()
+        text = article.get_text(separator=" ", strip=True)
+        return text if text else "본문이 비어 있습니다."
+    return "본문을 불러올 수 없습니다."
+
+
+def synthetic_page(container: str, n_sentences: int = 40, n_links: int = 400) -> str:
+    """실제 언론사 페이지처럼 head 스크립트·메뉴·관련기사 목록이 본문보다 훨씬 큰 페이지"""
+    body = "".join(f"<p>{random.choice(SENTENCES)}</p>" for _ in range(n_sentences))
+    body += '<div class="ad">광고</div><script>var x = 1;</script>'
+    scripts = "".join(f"<script>window.cfg{i} = {{a: {i}}};</script>" for i in range(80))
+    menu = "".join(f'<li><a href="/section/{i}">메뉴 {i}</a></li>' for i in range(n_links))
+    related = "".join(
+        f'<li class="item"><a href="/news/{i}">{random.choice(SENTENCES)}</a></li>'
+        for i in range(n_links)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<meta name='description' content='{SENTENCES[0]}'>{scripts}</head><body>"
+        f"<nav><ul>{menu}</ul></nav><main>{container.format(body=body)}</main>"
+        f"<section class='related'><ul>{related}</ul></section>"
+        "<footer>Copyright</footer></body></html>"
+    )
+
+
+def site_of(url: str) -> str | None:
+    for name, (domain, _, _) in SITES.items():
+        if domain in url:
+            return name
+    return None
+
+
+def load_fixtures() -> dict[str, list[tuple[str, str]]]:
+    """언론사 → [(URL, 디코딩한 HTML), ...]"""
+    pages: dict[str, list[tuple[str, str]]] = {}
+    for path in sorted(FIXTURE_DIR.glob("*.html")):
+        raw = path.read_bytes()
+        match = _SOURCE_LINE.match(raw)
+        if not match:
+            print(f"⚠️ {path.name}: 첫 줄에 source URL이 없어 건너뜀")
+            continue
+        url = match.group(1).decode("utf-8")
+        content_type = match.group(2).decode("utf-8") if match.group(2) else None
+        name = site_of(url)
+        if name is None:
+            print(f"⚠️ {path.name}: 등록되지 않은 언론사 ({url})")
+            continue
+        pages.setdefault(name, []).append((url, decode_html(raw[match.end():], content_type)))
+    return pages
+
+
+def save_fixtures(urls: list[str]):
+    FIXTURE_DIR.mkdir(exist_ok=True)
+    for url in urls:
+        name = site_of(url)
+        if name is None:
+            print(f"❌ 등록되지 않은 언론사: {url}")
+            continue
+        try:
+            res = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+            res.raise_for_status()
+        except Exception as e:
+            print(f"❌ {url} 저장 실패: {e}")
+            continue
+        n = len(list(FIXTURE_DIR.glob(f"{name}_*.html"))) + 1
+        path = FIXTURE_DIR / f"{name}_{n}.html"
+        # res.text 는 requests 가 다시 디코딩한 문자열 → 받은 바이트와 Content-Type 을 그대로 저장
+        content_type = res.headers.get("content-type")
+        header = f"<!-- source: {url}" + (f" content-type: {content_type}" if content_type else "") + " -->\n"
+        path.write_bytes(header.encode("utf-8") + res.content)
+        print(f"💾 {path.name}: {len(res.content):,}바이트 저장 ({content_type or 'Content-Type 없음'}, {url})")
+
+
+def bench(fn, html, url, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(html, url)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+if __name__ == "__main__":
+    if "--save" in sys.argv:
+        save_fixtures([arg for arg in sys.argv[sys.argv.index("--save") + 1:] if not arg.startswith("--")])
+
+    pages = {name: [(url, html, "fixture") for url, html in items] for name, items in load_fixtures().items()}
+    missing = [name for name in SITES if name not in pages]
+    if missing and "--synthetic" in sys.argv:
+        random.seed(0)
+        for name in missing:
+            _, url, container = SITES[name]
+            pages[name] = [(url, synthetic_page(container), "synthetic")]
+    elif missing:
+        print(f"⚠️ 저장한 실제 페이지가 없는 언론사: {', '.join(missing)} (--save <URL> 로 저장하거나 --synthetic)")
+    if not pages:
+        sys.exit(1)
+
+    print(f"{'언론사':<8}{'출처':<11}{'페이지':>6}{'크기(KB)':>10}{'기존(ms)':>10}{'레지스트리(ms)':>15}{'배속':>7}  본문 일치")
+    for name, items in pages.items():
+        sizes, legacy_times, new_times, same = [], [], [], 0
+        for url, html, _ in items:
+            legacy_time, legacy_text = bench(legacy_extract, html, url)
+            new_time, new_text = bench(extract_article_text, html, url)
+            sizes.append(len(html.encode()) / 1024)
+            legacy_times.append(legacy_time)
+            new_times.append(new_time)
+            same += legacy_text == new_text
+        # 페이지별 최솟값의 중앙값
+        legacy_ms, new_ms = median(legacy_times) * 1000, median(new_times) * 1000
+        print(
+            f"{name:<8}{items[0][2]:<11}{len(items):>6}{median(sizes):>10.1f}"
+            f"{legacy_ms:>10.2f}{new_ms:>15.2f}"
+            f"{legacy_ms / new_ms:>6.1f}x  {same}/{len(items)}"
+        )
@@ -0,0 +1,71 @@
+# 청크 분할 마이크로 벤치마크: 기존(누적 텍스트 재인코딩) vs 선형 패커
+# 실행: python -m benchmarks.bench_chunk_packer
+
+import os
+import time
+import random
+import tiktoken
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")  # news_processor import용
+
+from utils.news_processor import chunk_url_text_pairs
+
+SENTENCES = [
+    "정부는 오늘 오전 서울 정부청사에서 경제관계장관회의를 열고 하반기 경제정책방향을 발표했다.",
+    "한국은행은 기준금리를 연 3.5%로 동결하며 물가 상승세가 여전히 높다고 밝혔다.",
+    "기상청은 내일 전국에 비가 내리고 오후부터 차차 그칠 것으로 내다봤다.",
+    "반도체 수출이 석 달 연속 증가하면서 무역수지 흑자 폭도 커졌다.",
+    "지방자치단체는 노인 일자리 사업 예산을 늘려 어르신 2만 명을 추가로 지원하기로 했다.",
+]
+
+
+def make_article(n_sentences: int) -> str:
+    return " ".join(random.choice(SENTENCES) for _ in range(n_sentences))
+
+
+def legacy_chunk(url_text_pairs, model="gpt-4o", max_tokens=28000):
+    """기존 구현: 블록마다 누적 텍스트 전체를 다시 인코딩 (인코더도 매번 조회)"""
+    def count_tokens(text):
+        enc = tiktoken.encoding_for_model(model)
+        return len(enc.encode(text))
+
+    blocks = [
+        f"=== 기사 {i} ({url}) ===\n{txt.strip()}\n"
+        for i, (url, txt) in enumerate(url_text_pairs, start=1)
+    ]
+    chunks, current_chunk, current_text = [], [], ""
+    for block in blocks:
+        if count_tokens(current_text + block) > max_tokens:
+            chunks.append(current_chunk)
+            current_chunk, current_text = [block], block
+        else:
+            current_chunk.append(block)
+            current_text += block
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def bench(fn, pairs, max_tokens, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = fn(pairs, "gpt-4o", max_tokens)
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    tiktoken.encoding_for_model("gpt-4o")  # 인코더 다운로드/로딩은 측정에서 제외
+
+    for n_articles, n_sentences, max_tokens in [(3, 200, 28000), (12, 400, 28000), (30, 400, 8000)]:
+        pairs = [(f"https://news.example.com/{i}", make_article(n_sentences)) for i in range(n_articles)]
+        legacy_t, legacy_chunks = bench(legacy_chunk, pairs, max_tokens)
+        new_t, new_chunks = bench(chunk_url_text_pairs, pairs, max_tokens)
+        print(
+            f"기사 {n_articles:>2}개 × {n_sentences}문장, 한도 {max_tokens}: "
+            f"기존 {legacy_t * 1000:8.1f}ms ({len(legacy_chunks)}청크) / "
+            f"선형 {new_t * 1000:8.1f}ms ({len(new_chunks)}청크) / "
+            f"{legacy_t / new_t:5.1f}배"
+        )
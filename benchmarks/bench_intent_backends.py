@@ -0,0 +1,123 @@
+# 의도 분류 백엔드 비교: PyTorch FP32 vs ONNX Runtime int8
+# 실행: python -m benchmarks.bench_intent_backends [--threads N] [--repeat N]
+#
+# 학습에 쓰지 않은 예문으로 단건 지연(p50/p99), 배치 처리량, PyTorch 결과와의 라벨 일치율,
+# 기대 라벨 정확도를 비교 (양자화 모델이 없으면 먼저 python -m utils.intent_model)
+
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+from utils.intent_model import (
+    MODEL_DIR,
+    ONNX_DIR,
+    ONNX_FP32_FILE,
+    ONNX_INT8_FILE,
+    TorchIntentClassifier,
+    OnnxIntentClassifier,
+)
+
+# (예문, 기대 라벨)
+SAMPLES = [
+    ("오늘 날씨 어때", "날씨"),
+    ("내일 서울에 비 온대?", "날씨"),
+    ("이번 주말에 우산 챙겨야 할까", "날씨"),
+    ("부산 지금 기온 몇 도야", "날씨"),
+    ("밖에 많이 추워?", "날씨"),
+    ("미세먼지 심한지 알려줘", "날씨"),
+    ("모레 눈 온다던데 맞아?", "날씨"),
+    ("동선동 날씨 알려줘", "날씨"),
+    ("오늘 오후에 바람 많이 불어?", "날씨"),
+    ("다음 주 날씨 어떻대", "날씨"),
+    ("요즘 경제 뉴스 알려줘", "뉴스"),
+    ("삼성전자 주가 소식 있어?", "뉴스"),
+    ("오늘 정치 기사 좀 읽어줘", "뉴스"),
+    ("손흥민 경기 결과 뉴스 보여줘", "뉴스"),
+    ("최근에 무슨 사건 있었어", "뉴스"),
+    ("금리 인상 관련 소식 알려줘", "뉴스"),
+    ("대통령 발표 내용이 뭐야", "뉴스"),
+    ("부동산 시장 뉴스 있어?", "뉴스"),
+    ("트럼프 관세 정책 기사 찾아줘", "뉴스"),
+    ("오늘 주요 뉴스 뭐 있어", "뉴스"),
+    ("내가 어제 있었던 일 얘기해줄게", "이야기"),
+    ("심심한데 재밌는 얘기 해줘", "이야기"),
+    ("오늘 손주가 놀러 왔었어", "이야기"),
+    ("옛날에 시장에서 장사하던 얘기 들어볼래", "이야기"),
+    ("노인정에서 친구들이랑 화투 쳤어", "이야기"),
+    ("다른 사람 이야기 들려줘", "이야기"),
+    ("외로워 나랑 얘기하자", "이야기"),
+    ("아침에 산책하다가 강아지를 만났어", "이야기"),
+    ("젊었을 때 군대 이야기 해줄까", "이야기"),
+    ("우리 딸이 이번에 승진했대", "이야기"),
+]
+
+BATCH_SIZE = 16
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def single_latency_ms(classifier, texts: list[str], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            classifier.predict_batch([text])
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def batch_throughput(classifier, texts: list[str], repeat: int) -> float:
+    batches = [texts[i:i + BATCH_SIZE] for i in range(0, len(texts), BATCH_SIZE)]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for batch in batches:
+            classifier.predict_batch(batch)
+    return repeat * len(texts) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=0, help="torch/onnxruntime 스레드 수 (0=기본값)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--onnx-dir", type=Path, default=ONNX_DIR)
+    args = parser.parse_args()
+
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    texts = [text for text, _ in SAMPLES]
+    expected = [label for _, label in SAMPLES]
+
+    backends = [("torch fp32", lambda: TorchIntentClassifier(args.model_dir))]
+    for name, model_file in (("onnx fp32", ONNX_FP32_FILE), ("onnx int8", ONNX_INT8_FILE)):
+        if (args.onnx_dir / model_file).exists():
+            backends.append((name, lambda f=model_file: OnnxIntentClassifier(args.onnx_dir, f, args.threads)))
+        else:
+            print(f"⚠️ {args.onnx_dir / model_file} 없음 → python -m utils.intent_model 로 먼저 내보내기")
+
+    reference = None
+    print(f"{'백엔드':<12}{'p50(ms)':>9}{'p99(ms)':>9}{'처리량(건/s)':>14}{'일치율':>8}{'정확도':>8}")
+    for name, factory in backends:
+        classifier = factory()
+        classifier.predict_batch(texts[:BATCH_SIZE])  # 워밍업
+        labels = [r["label"] for r in classifier.predict_batch(texts)]
+        if reference is None:
+            reference = labels
+
+        timings = single_latency_ms(classifier, texts, args.repeat)
+        throughput = batch_throughput(classifier, texts, args.repeat)
+        agreement = statistics.mean(a == b for a, b in zip(labels, reference))
+        accuracy = statistics.mean(a == b for a, b in zip(labels, expected))
+        print(
+            f"{name:<12}{percentile(timings, 0.5):>9.2f}{percentile(timings, 0.99):>9.2f}"
+            f"{throughput:>14.1f}{agreement:>8.1%}{accuracy:>8.1%}"
+        )
+        for text, label, ref in zip(texts, labels, reference):
+            if label != ref:
+                print(f"   ↳ 불일치: '{text}' → {label} (torch: {ref})")
@@ -0,0 +1,59 @@
+# 지역 계층 로딩 벤치마크: json.load(dict of list) vs mmap 이진 색인
+# 실행: python -m benchmarks.bench_location_index
+#
+# 로딩 방식마다 새 프로세스를 띄워 (import 캐시/페이지 공유 영향 없이) 로딩 시간과
+# 로딩 전후 RSS 증가량, 조회 속도를 잰다
+
+import sys
+import json
+import subprocess
+
+from crawling.location_index import LOCATION_JSON_PATH, LOCATION_INDEX_PATH, build_location_index
+
+CHILD = r"""
+import json, os, sys, time
+
+def rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+mode, json_path, index_path = sys.argv[1:4]
+if mode == "index":
+    from crawling.location_index import LocationIndex
+before = rss_kb()
+start = time.perf_counter()
+if mode == "json":
+    with open(json_path, encoding="utf-8") as f:
+        table = json.load(f)
+else:
+    table = LocationIndex(index_path)
+load_ms = (time.perf_counter() - start) * 1000
+after = rss_kb()
+
+with open(json_path, encoding="utf-8") as f:
+    names = list(json.load(f))[::7] + ["없는동", "서울", "강남구"]
+start = time.perf_counter()
+for _ in range(20):
+    for name in names:
+        table.get(name, [])
+lookup_us = (time.perf_counter() - start) / (20 * len(names)) * 1e6
+print(json.dumps({"load_ms": load_ms, "rss_kb": after - before, "lookup_us": lookup_us}))
+"""
+
+
+def run(mode: str, repeat: int = 5) -> dict:
+    results = [
+        json.loads(subprocess.check_output(
+            [sys.executable, "-c", CHILD, mode, LOCATION_JSON_PATH, LOCATION_INDEX_PATH]
+        ))
+        for _ in range(repeat)
+    ]
+    return {key: min(r[key] for r in results) for key in results[0]}
+
+
+if __name__ == "__main__":
+    build_location_index()
+    print(f"{'방식':<8}{'로딩(ms)':>10}{'RSS 증가(KB)':>14}{'조회(µs)':>10}")
+    for mode in ("json", "index"):
+        r = run(mode)
+        print(f"{mode:<8}{r['load_ms']:>10.2f}{r['rss_kb']:>14,}{r['lookup_us']:>10.2f}")
@@ -0,0 +1,115 @@
+# 파싱 오프로딩 벤치마크: 스레드(asyncio.to_thread) vs 파싱 프로세스 풀(run_parse)
+# 실행: python -m benchmarks.bench_parse_pool
+#
+# 한 워커에 기사/날씨/랭킹 파싱(무거운 요청)과 가벼운 요청(캐시 응답 등)이 섞여 들어올 때
+# 가벼운 요청의 응답 지연 p50/p99를 비교. 스레드 파싱은 GIL을 잡아 이벤트 루프가 밀림
+
+import time
+import random
+import asyncio
+import statistics
+
+import crawling.parse_pool as parse_pool
+from crawling.news_content import parse_article_bytes
+from crawling.weather_fetcher import parse_current_weather
+from crawling.rank_news import parse_trending_news
+from benchmarks.bench_article_extract import synthetic_page, SITES
+
+HEAVY_REQUESTS = 60      # 무거운 요청 수 (기사 3건 + 날씨 + 랭킹 중 하나)
+LIGHT_REQUESTS = 400     # 가벼운 요청 수
+LIGHT_INTERVAL = 0.005   # 가벼운 요청 도착 간격(초)
+
+
+def weather_page() -> bytes:
+    rows = "".join(
+        '<li class="item_today"><div class="box"><strong class="title">미세먼지</strong>'
+        '<span class="txt">좋음</span></div></li>'
+        for _ in range(2)
+    )
+    filler = "".join(f'<div class="ad"><a href="/{i}">링크 {i}</a></div>' for i in range(1500))
+    return (
+        "<html><body><div class='temperature_text'><span class='blind'>현재 온도</span>21.3°</div>"
+        "<dl><dt>체감</dt><dd>20.1°</dd></dl><i class='wt_icon'><span class='blind'>맑음</span></i>"
+        f"<ul class='today_chart_list'>{rows}</ul>{filler}</body></html>"
+    ).encode()
+
+
+def ranking_page() -> bytes:
+    boxes = "".join(
+        '<div class="rankingnews_box"><ul class="rankingnews_list">'
+        + "".join(f'<li><a href="/article/{b}/{i}">기사 제목 {b}-{i}</a></li>' for i in range(5))
+        + "</ul></div>"
+        for b in range(80)
+    )
+    return f"<html><body>{boxes}</body></html>".encode()
+
+
+def heavy_jobs():
+    """(함수, 인자) 목록: 기사 본문 3건 / 날씨 / 랭킹을 섞어서"""
+    articles = [
+        (synthetic_page(container).encode(), "text/html; charset=utf-8", url)
+        for _, url, container in SITES.values()
+    ]
+    weather, ranking = weather_page(), ranking_page()
+    jobs = []
+    for i in range(HEAVY_REQUESTS):
+        kind = i % 3
+        if kind == 0:
+            jobs.append([(parse_article_bytes, random.choice(articles)) for _ in range(3)])
+        elif kind == 1:
+            jobs.append([(parse_current_weather, (weather, "서울"))])
+        else:
+            jobs.append([(parse_trending_news, (ranking, 6))])
+    return jobs
+
+
+async def run_traffic(offload, jobs):
+    light_latencies = []
+
+    async def heavy(parses):
+        await asyncio.gather(*(offload(fn, *args) for fn, args in parses))
+
+    async def light():
+        start = time.perf_counter()
+        await asyncio.sleep(0)  # 이벤트 루프 한 바퀴 = 캐시 응답 같은 짧은 요청
+        light_latencies.append(time.perf_counter() - start)
+
+    async def light_stream():
+        tasks = []
+        for _ in range(LIGHT_REQUESTS):
+            tasks.append(asyncio.create_task(light()))
+            await asyncio.sleep(LIGHT_INTERVAL)
+        await asyncio.gather(*tasks)
+
+    start = time.perf_counter()
+    await asyncio.gather(light_stream(), *(heavy(parses) for parses in jobs))
+    elapsed = time.perf_counter() - start
+
+    ms = sorted(x * 1000 for x in light_latencies)
+    p99 = ms[int(len(ms) * 0.99) - 1]
+    return statistics.median(ms), p99, elapsed
+
+
+async def main():
+    random.seed(0)
+    jobs = heavy_jobs()
+
+    async def in_thread(fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+    print(f"무거운 요청 {HEAVY_REQUESTS}개 + 가벼운 요청 {LIGHT_REQUESTS}개 동시 처리")
+    print(f"{'방식':<16}{'가벼운 p50(ms)':>15}{'가벼운 p99(ms)':>15}{'전체(s)':>10}")
+
+    p50, p99, elapsed = await run_traffic(in_thread, jobs)
+    print(f"{'to_thread':<16}{p50:>15.2f}{p99:>15.2f}{elapsed:>10.2f}")
+
+    await asyncio.to_thread(parse_pool.start_parse_pool)
+    try:
+        p50, p99, elapsed = await run_traffic(parse_pool.run_parse, jobs)
+        print(f"{'process pool':<16}{p50:>15.2f}{p99:>15.2f}{elapsed:>10.2f}")
+    finally:
+        parse_pool.stop_parse_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+# 어휘 매칭 벤치마크: 기존(목록별 `kw in text` 선형 탐색) vs Aho–Corasick 한 번 훑기
+# 실행: python -m benchmarks.bench_vocabulary_match
+
+import re
+import time
+import random
+
+from utils.input_classifier import classify_user_input
+from utils.vocabulary import (
+    DOMAIN_VOCABULARY,
+    DOMAIN_CATEGORIES,
+    NEWS_INTENT_KEYWORDS,
+    WEATHER_INTENT_KEYWORDS,
+    STORY_INTENT_KEYWORDS,
+    person_keywords,
+    location_keywords,
+    economy_keywords,
+    environment_keywords,
+    find_vocabulary,
+    word_categories,
+)
+
+QUERIES = [
+    "오늘 서울 날씨 어때",
+    "삼성 주가 관련 최신 뉴스 알려줘",
+    "손흥민 경기 결과 기사 보여줘",
+    "재밌는 얘기 하나 해줘",
+    "부산 지역에 태풍 피해 소식 있어",
+    "요즘 금리 인상 때문에 부동산 어떻게 돼",
+    "초미세먼지 농도 알려줘",
+    "심심해 놀아줘",
+    "내일 비 와",
+    "말해줘",
+    "트럼프 대통령 관세 정책 발표 이후 나스닥 반응",
+    "우리 동네 노인정에서 있었던 일 들려줄까",
+]
+
+# Okt 없이 비교하기 위한 토큰 (공백 단위 + 어휘 단어)
+TOKENS = {
+    q: [w for w in q.split() if len(w) > 1] + [w for _, _, w, _ in find_vocabulary(q)]
+    for q in QUERIES
+}
+
+
+def legacy_classify(text: str) -> str:
+    """기존 구현: 호출마다 목록을 만들고 목록별로 선형 탐색"""
+    text = text.lower().strip()
+    weather_keywords = list(WEATHER_INTENT_KEYWORDS)
+    news_keywords = list(NEWS_INTENT_KEYWORDS)
+    story_keywords = list(STORY_INTENT_KEYWORDS)
+    if any(kw in text for kw in news_keywords):
+        return "news"
+    if any(kw in text for kw in weather_keywords):
+        return "weather"
+    story_only_keywords = [kw for kw in story_keywords if kw not in ["말해줘", "들려줘"]]
+    if any(kw in text for kw in story_only_keywords):
+        return "story"
+    if re.fullmatch(r"(.*\s)?(말해줘|들려줘)\s*", text):
+        return "invalid"
+    return "invalid"
+
+
+def legacy_domain(text: str, tokens: list[str]):
+    for domain, vocab in DOMAIN_VOCABULARY.items():
+        if any(tok in vocab for tok in tokens):
+            return domain, [tok for tok in tokens if tok in vocab and any(tok in seg for seg in text.split())]
+    return None, []
+
+
+def new_domain(text: str, tokens: list[str]):
+    token_categories = [word_categories(tok) for tok in tokens]
+    for domain, categories in DOMAIN_CATEGORIES.items():
+        if any(not cats.isdisjoint(categories) for cats in token_categories):
+            return domain, [
+                tok for tok, cats in zip(tokens, token_categories)
+                if not cats.isdisjoint(categories) and tok in text
+            ]
+    return None, []
+
+
+def legacy_refine_kind(keyword: str) -> str:
+    if keyword in person_keywords or '대통령' in keyword:
+        return "person"
+    if keyword in location_keywords:
+        return "location"
+    if keyword in economy_keywords:
+        return "economy"
+    if keyword in environment_keywords:
+        return "environment"
+    return "general"
+
+
+def new_refine_kind(keyword: str) -> str:
+    categories = word_categories(keyword)
+    if "person" in categories or '대통령' in keyword:
+        return "person"
+    for kind in ("location", "economy", "environment"):
+        if kind in categories:
+            return kind
+    return "general"
+
+
+def bench(fn, inputs, repeat=200):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for args in inputs:
+                fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / (repeat * len(inputs))
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    keywords = [w for ws in TOKENS.values() for w in ws] + ["없는단어", "경제 위기", "홍길동"]
+    cases = [
+        ("입력 분류", legacy_classify, classify_user_input, [(q,) for q in QUERIES]),
+        ("도메인 감지", legacy_domain, new_domain, [(q, TOKENS[q]) for q in QUERIES]),
+        ("검색어 종류", legacy_refine_kind, new_refine_kind, [(k,) for k in keywords]),
+    ]
+    print(f"{'항목':<10}{'기존(µs)':>10}{'매처(µs)':>10}{'배속':>7}  결과 일치")
+    for name, legacy, new, inputs in cases:
+        same = all(legacy(*args) == new(*args) for args in inputs)
+        t_legacy, t_new = bench(legacy, inputs), bench(new, inputs)
+        print(f"{name:<10}{t_legacy * 1e6:>10.2f}{t_new * 1e6:>10.2f}{t_legacy / t_new:>6.1f}x  {'✅' if same else '❌'}")
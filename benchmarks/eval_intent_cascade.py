@@ -0,0 +1,87 @@
+# 분류 캐스케이드 오프라인 평가: 규칙(빠른 경로)이 얼마나 자주 답하고, 답할 때 모델과 얼마나 일치하는지
+# 실행: python -m benchmarks.eval_intent_cascade [--file utterances.tsv] [--backend torch|onnx] [--rules-only]
+#
+# --file: 한 줄에 "문장<TAB>기대 라벨" (라벨은 생략 가능, 날씨/뉴스/이야기 또는 weather/news/story/invalid)
+#         없으면 bench_intent_backends 의 예문 + HARD_NEGATIVES 사용
+
+import argparse
+from collections import Counter
+
+from utils.input_classifier import classify_confident
+from utils.intent_model import LABEL_TO_TYPE, load_intent_classifier, result_to_type
+from benchmarks.bench_intent_backends import SAMPLES
+
+BATCH_SIZE = 32
+
+# 의도 키워드가 다른 뜻(부분 문자열·동음이의어)으로 들어 있는 문장 → 규칙이 답하면 안 됨
+HARD_NEGATIVES = [
+    ("택시 기사님이랑 싸웠어", "story"),
+    ("손주가 기사 자격증 땄어", "story"),
+    ("어제 보도블럭에 넘어졌어", "story"),
+    ("보도에 자전거가 다녀서 무서웠어", "story"),
+    ("우산동에 사는 친구가 놀러왔어", "story"),
+    ("딸이 사 준 우산을 잃어버렸어", "story"),
+    ("뉴스룸에서 일하는 조카가 전화했어", "story"),
+    ("비빔밥 먹으러 다녀왔어", "story"),
+]
+
+
+def load_utterances(path: str | None) -> list[tuple[str, str | None]]:
+    if path is None:
+        return [(text, LABEL_TO_TYPE[label]) for text, label in SAMPLES] + HARD_NEGATIVES
+    utterances = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            text, _, label = line.rstrip("\n").partition("\t")
+            label = label.strip() or None
+            utterances.append((text.strip(), LABEL_TO_TYPE.get(label, label)))
+    return utterances
+
+
+def model_types(texts: list[str], backend: str) -> list[str]:
+    classifier = load_intent_classifier(backend)
+    types = []
+    for i in range(0, len(texts), BATCH_SIZE):
+        types.extend(result_to_type(r) for r in classifier.predict_batch(texts[i:i + BATCH_SIZE]))
+    return types
+
+
+def ratio(num: int, den: int) -> str:
+    return f"{num}/{den} ({num / den:.1%})" if den else "-"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file")
+    parser.add_argument("--backend", default=None, help="기본값: CLASSIFIER_BACKEND")
+    parser.add_argument("--rules-only", action="store_true", help="모델 없이 규칙 적용률/정확도만")
+    args = parser.parse_args()
+
+    utterances = load_utterances(args.file)
+    texts = [text for text, _ in utterances]
+    expected = [label for _, label in utterances]
+    rules = [classify_confident(text) for text in texts]
+    covered = [i for i, r in enumerate(rules) if r is not None]
+    labelled = [i for i, e in enumerate(expected) if e is not None]
+
+    print(f"📊 문장 {len(texts)}개")
+    print(f"규칙 적용률        {ratio(len(covered), len(texts))}")
+    print(f"  의도별           {dict(Counter(rules[i] for i in covered))}")
+    covered_labelled = [i for i in covered if expected[i] is not None]
+    print(f"규칙 정확도(기대)  {ratio(sum(rules[i] == expected[i] for i in covered_labelled), len(covered_labelled))}")
+
+    if not args.rules_only:
+        model = model_types(texts, *([args.backend] if args.backend else []))
+        cascade = [rules[i] if rules[i] is not None else model[i] for i in range(len(texts))]
+        print(f"규칙-모델 일치율   {ratio(sum(rules[i] == model[i] for i in covered), len(covered))}")
+        print(f"모델 정확도(기대)  {ratio(sum(model[i] == expected[i] for i in labelled), len(labelled))}")
+        print(f"캐스케이드 정확도  {ratio(sum(cascade[i] == expected[i] for i in labelled), len(labelled))}")
+        for i in covered:
+            if rules[i] != model[i]:
+                print(f"   ↳ 불일치: '{texts[i]}' 규칙={rules[i]} 모델={model[i]} 기대={expected[i]}")
+    else:
+        for i in covered_labelled:
+            if rules[i] != expected[i]:
+                print(f"   ↳ 오답: '{texts[i]}' 규칙={rules[i]} 기대={expected[i]}")
@@ -0,0 +1,202 @@
+# 언론사별 기사 본문 추출기 레지스트리
+# crawling/article_extractors.py
+
+import re
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+# lxml 파서가 html.parser보다 훨씬 빠름 (requirements.txt에 포함)
+ARTICLE_PARSER = "lxml"
+
+# 도메인별 추출 규칙
+# - meta: 이 이름(name/property)의 meta content가 있으면 본문 대신 바로 사용
+# - selectors: 순서대로 시도해 텍스트가 있는 첫 요소를 본문으로 사용
+# - stream_until: 이 요소가 (텍스트를 가진 채) 닫히면 다운로드를 일찍 멈춰도 됨
+# 하위 도메인도 같은 규칙을 씀 (n.news.naver.com → naver.com)
+SITE_EXTRACTORS: dict[str, dict] = {
+    "naver.com": {
+        "selectors": ("#dic_area", "#newsct_article", "#newsEndContents"),
+        "stream_until": "#dic_area",
+    },
+    "yna.co.kr": {
+        "selectors": ("#articleFailoverContent", "#articleWrap", "#articleContent"),
+        "stream_until": "#articleWrap",
+    },
+    "nocutnews.co.kr": {
+        "selectors": ("div#pnlContent",),
+        "stream_until": "div#pnlContent",
+    },
+    "mbn.co.kr": {
+        "meta": ("description",),
+    },
+}
+
+# 등록되지 않은 언론사(또는 등록된 선택자가 모두 실패한 경우)의 fallback
+DEFAULT_SELECTORS = ("#dic_area", "article", "div[class*=content]")
+
+# 본문에서 제거할 요소
+NOISE_SELECTOR = "script, style, aside, .ad"
+
+# 지원하는 선택자 형태: tag / #id / tag#id / tag.class / [class*=부분]
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-z0-9]+)?"
+    r"(?:#(?P<id>[\w-]+))?"
+    r"(?:\.(?P<cls>[\w-]+))?"
+    r"(?:\[class\*=(?P<cls_part>[\w-]+)\])?$"
+)
+
+
+def _selector_target(selector: str) -> tuple[str | None, str | None, str | None, str | None]:
+    match = _SIMPLE_SELECTOR.match(selector)
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+    return match.group("tag"), match.group("id"), match.group("cls"), match.group("cls_part")
+
+
+def _matches_target(target: tuple, name: str, attrs) -> bool:
+    tag, id_, cls, cls_part = target
+    classes = attrs.get("class") or ""
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+
+    if tag and tag != name:
+        return False
+    if id_ and attrs.get("id") != id_:
+        return False
+    if cls and cls not in classes.split():
+        return False
+    if cls_part and cls_part not in classes:
+        return False
+    return True
+
+
+class TargetStrainer(SoupStrainer):
+    """
+    본문 후보가 될 수 있는 하위 트리(+ 필요한 meta 태그)만 트리로 만드는 SoupStrainer
+    - 여러 선택자를 OR 조건으로 묶기 위해 allow_tag_creation을 직접 구현
+    """
+
+    def __init__(self, selectors: tuple[str, ...], meta_names: tuple[str, ...] = ()):
+        super().__init__()
+        self.targets = [_selector_target(sel) for sel in selectors]
+        self.meta_names = set(meta_names)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        if name == "meta":
+            return bool(self.meta_names) and (
+                attrs.get("name") in self.meta_names or attrs.get("property") in self.meta_names
+            )
+        return any(_matches_target(target, name, attrs) for target in self.targets)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # 대상 하위 트리 밖의 텍스트는 버림
+        return False
+
+
+def site_key(url: str) -> str | None:
+    """URL의 호스트(및 상위 도메인) 중 레지스트리에 등록된 도메인, 없으면 None"""
+    host = urlparse(url).hostname or ""
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        domain = ".".join(parts[i:])
+        if domain in SITE_EXTRACTORS:
+            return domain
+    return None
+
+
+_strainers: dict[str | None, TargetStrainer] = {}
+
+
+def _strainer_for(domain: str | None) -> TargetStrainer:
+    # 도메인마다 한 번만 생성 (None = 기본 fallback용)
+    strainer = _strainers.get(domain)
+    if strainer is None:
+        rule = SITE_EXTRACTORS.get(domain, {})
+        strainer = _strainers[domain] = TargetStrainer(
+            tuple(rule.get("selectors", ())) + DEFAULT_SELECTORS,
+            tuple(rule.get("meta", ())),
+        )
+    return strainer
+
+
+class ArticleEndDetector:
+    """
+    스트리밍 다운로드 중 받은 바이트를 순서대로 넣으면서 본문을 다 받았는지 판별
+    - meta 바로가기 사이트: 해당 meta content가 나오면 끝
+    - stream_until 사이트: 해당 요소가 텍스트를 가진 채 닫히면 끝
+    - 규칙이 없는 사이트는 판별하지 않음 (항상 False → 크기 상한까지 받음)
+    """
+
+    def __init__(self, url: str):
+        rule = SITE_EXTRACTORS.get(site_key(url), {})
+        self.meta_names = set(rule.get("meta", ()))
+        self.target = _selector_target(rule["stream_until"]) if "stream_until" in rule else None
+        self.done = False
+        self._parser = (
+            etree.HTMLPullParser(events=("end",))
+            if self.meta_names or self.target else None
+        )
+
+    def feed(self, chunk: bytes) -> bool:
+        if self._parser is None or self.done:
+            return self.done
+        self._parser.feed(chunk)
+        for _, el in self._parser.read_events():
+            if not isinstance(el.tag, str):
+                continue  # 주석 등
+            if el.tag == "meta" and self.meta_names:
+                name = el.get("name") or el.get("property")
+                if name in self.meta_names and (el.get("content") or "").strip():
+                    self.done = True
+            elif self.target and _matches_target(self.target, el.tag, el.attrib):
+                if "".join(el.itertext()).strip():
+                    self.done = True
+            if self.done:
+                break
+        return self.done
+
+
+def extract_article_text(html: str | bytes, url: str) -> str:
+    """
+    HTML에서 기사 본문만 뽑아냅니다. (동기/비동기 수집 공통)
+    - 언론사 규칙의 meta → selectors → 기본 fallback 순서
+    - 페이지 전체가 아닌 후보 하위 트리만 lxml로 파싱
+    """
+    domain = site_key(url)
+    rule = SITE_EXTRACTORS.get(domain, {})
+    soup = BeautifulSoup(html, ARTICLE_PARSER, parse_only=_strainer_for(domain))
+
+    # ── 1) meta 바로가기 (예: MBN은 description에 본문 요약이 들어 있음) ──
+    for meta_name in rule.get("meta", ()):
+        meta = soup.find("meta", attrs={"name": meta_name}) or soup.find(
+            "meta", attrs={"property": meta_name}
+        )
+        if meta and meta.get("content", "").strip():
+            return meta["content"].strip()
+
+    # ── 2) 언론사 전용 선택자 (텍스트가 있는 첫 요소) ──
+    article = None
+    for sel in rule.get("selectors", ()):
+        candidate = soup.select_one(sel)
+        if candidate and candidate.get_text(strip=True):
+            article = candidate
+            break
+
+    # ── 3) 일반적인 fallback ──
+    if article is None:
+        for sel in DEFAULT_SELECTORS:
+            article = soup.select_one(sel)
+            if article is not None:
+                break
+
+    # ── 4) 불필요 요소 제거 및 텍스트 반환 ──
+    if article is not None:
+        for bad in article.select(NOISE_SELECTOR):
+            bad.decompose()
+        text = article.get_text(separator=" ", strip=True)
+        return text if text else "본문이 비어 있습니다."
+
+    return "본문을 불러올 수 없습니다."
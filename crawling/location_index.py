@@ -0,0 +1,192 @@
+# 행정구역 계층 이진 색인 (korea_location_hierarchy.json → korea_location_index.bin)
+# crawling/location_index.py
+#
+# 빌드:  python -m crawling.location_index   (색인이 없거나 JSON보다 오래되면 시작 시 자동 빌드)
+#
+# JSON을 dict of list로 올리면 '대한민국' 같은 같은 부모 문자열이 항목마다 따로 생기고,
+# 같은 이름의 동이 여러 구에 있으면 JSON 객체 특성상 마지막 것만 남음.
+# 색인은 문자열을 한 번씩만 저장하고 부모는 번호(uint32)로 가리키며, 이름 → 항목 여러 개를 허용함.
+# 파일을 mmap으로 읽기 전용으로 열어 워커 프로세스들이 같은 페이지 캐시를 공유.
+#
+# 파일 구조 (모두 uint32, 네이티브 바이트 순서)
+#   헤더      magic(8바이트) byteorder n_strings n_entries n_keys blob_len 예약
+#   offsets   [n_strings + 1]      문자열 i = blob[offsets[i]:offsets[i+1]] (0번은 빈 문자열)
+#   entries   [n_entries * 4]      (이름, 구, 시, 국가) 문자열 번호, JSON 순서 그대로
+#   keys      [n_keys]             이름 문자열 번호 (UTF-8 바이트 순 정렬 → 이진 탐색)
+#   key_start [n_keys + 1]         key_entries 범위
+#   key_entries [n_entries]        이름별 항목 번호
+#   blob      UTF-8 문자열들
+
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from cachetools import LRUCache
+
+LOCATION_JSON_PATH = os.getenv("LOCATION_JSON_PATH", "data/korea_location_hierarchy.json")
+LOCATION_INDEX_PATH = os.getenv("LOCATION_INDEX_PATH", "data/korea_location_index.bin")
+# 자주 묻는 지명 조회 결과 캐시 (없는 이름 포함)
+LOCATION_LOOKUP_CACHE_SIZE = int(os.getenv("LOCATION_LOOKUP_CACHE_SIZE", "2048"))
+
+_MAGIC = b"KLOCIDX1"
+_BYTEORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=8sIIIIII")  # 마지막 값은 예약(0) → 헤더 32바이트로 정렬
+
+
+def build_location_index(json_path: str = LOCATION_JSON_PATH, index_path: str = LOCATION_INDEX_PATH) -> str:
+    """JSON 계층 파일 → 이진 색인 (같은 이름 키가 여러 번 나와도 모두 보존)"""
+    with open(json_path, encoding="utf-8") as f:
+        pairs = json.load(f, object_pairs_hook=lambda pairs: pairs)
+
+    strings = [""]
+    string_ids = {"": 0}
+
+    def intern(s: str) -> int:
+        sid = string_ids.get(s)
+        if sid is None:
+            sid = string_ids[s] = len(strings)
+            strings.append(s)
+        return sid
+
+    entries = array("I")
+    by_name: dict[int, list[int]] = {}
+    for i, (name, parents) in enumerate(pairs):
+        parents = (list(parents) + ["", "", ""])[:3]
+        entries.extend([intern(name)] + [intern(p or "") for p in parents])
+        by_name.setdefault(string_ids[name], []).append(i)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    blob = b"".join(encoded)
+
+    keys = array("I", sorted(by_name, key=lambda sid: encoded[sid]))
+    key_start, key_entries = array("I", [0]), array("I")
+    for sid in keys:
+        key_entries.extend(by_name[sid])
+        key_start.append(len(key_entries))
+
+    header = _HEADER.pack(_MAGIC, _BYTEORDER_MARK, len(strings), len(pairs), len(keys), len(blob), 0)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for arr in (offsets, entries, keys, key_start, key_entries):
+            arr.tofile(f)
+        f.write(blob)
+    os.replace(tmp_path, index_path)  # 여러 워커가 동시에 빌드해도 완성된 파일만 보이도록
+    return index_path
+
+
+class LocationIndex:
+    """
+    mmap한 이진 색인을 dict처럼 조회
+    - get(name, default) / [name] / in / len / items() : 기존 LOCATION_MAP(dict)과 같은 사용법
+      (같은 이름이 여러 개면 get은 JSON에서 먼저 나온 항목)
+    - lookup(name): 같은 이름의 항목 전부 [[구, 시, 국가], ...]
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, mark, n_strings, n_entries, n_keys, blob_len, _ = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or mark != _BYTEORDER_MARK:
+            raise ValueError(f"지원하지 않는 색인 파일: {path}")
+
+        view = memoryview(self._mm)
+        pos = _HEADER.size
+
+        def take(count: int) -> memoryview:
+            nonlocal pos
+            arr = view[pos:pos + count * 4].cast("I")
+            pos += count * 4
+            return arr
+
+        self._offsets = take(n_strings + 1)
+        self._entries = take(n_entries * 4)
+        self._keys = take(n_keys)
+        self._key_start = take(n_keys + 1)
+        self._key_entries = take(n_entries)
+        self._blob = view[pos:pos + blob_len]
+        self._n_entries = n_entries
+        self._lookup_cache: LRUCache = LRUCache(maxsize=LOCATION_LOOKUP_CACHE_SIZE)
+
+    def _string_bytes(self, sid: int) -> bytes:
+        return bytes(self._blob[self._offsets[sid]:self._offsets[sid + 1]])
+
+    def _string(self, sid: int) -> str:
+        return self._string_bytes(sid).decode("utf-8")
+
+    def _find_key(self, name: str) -> int:
+        target = name.encode("utf-8")
+        lo, hi = 0, len(self._keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string_bytes(self._keys[mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._keys) and self._string_bytes(self._keys[lo]) == target:
+            return lo
+        return -1
+
+    def _parents(self, entry: int) -> list[str]:
+        base = entry * 4
+        return [self._string(self._entries[base + k]) for k in (1, 2, 3)]
+
+    def lookup(self, name: str) -> list[list[str]]:
+        chains = self._lookup_cache.get(name)
+        if chains is None:
+            k = self._find_key(name)
+            chains = [] if k < 0 else [
+                self._parents(self._key_entries[i])
+                for i in range(self._key_start[k], self._key_start[k + 1])
+            ]
+            self._lookup_cache[name] = chains
+        return [list(chain) for chain in chains]  # 호출한 쪽이 수정해도 캐시는 그대로
+
+    def get(self, name: str, default=None):
+        chains = self.lookup(name)
+        return chains[0] if chains else default
+
+    def __getitem__(self, name: str) -> list[str]:
+        chains = self.lookup(name)
+        if not chains:
+            raise KeyError(name)
+        return chains[0]
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and bool(self.lookup(name))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def items(self):
+        """(이름, [구, 시, 국가]) 를 JSON 순서대로 (같은 이름도 항목마다 따로)"""
+        for entry in range(self._n_entries):
+            yield self._string(self._entries[entry * 4]), self._parents(entry)
+
+
+def load_location_index(
+    json_path: str = LOCATION_JSON_PATH,
+    index_path: str = LOCATION_INDEX_PATH
+) -> LocationIndex:
+    """색인이 없거나 JSON이 더 새로우면 빌드한 뒤 mmap으로 열기"""
+    stale = (
+        not os.path.exists(index_path)
+        or (os.path.exists(json_path) and os.path.getmtime(json_path) > os.path.getmtime(index_path))
+    )
+    if stale:
+        print(f"🗺️ 지역 색인 빌드: {json_path} → {index_path}")
+        build_location_index(json_path, index_path)
+    return LocationIndex(index_path)
+
+
+if __name__ == "__main__":
+    json_path = sys.argv[1] if len(sys.argv) > 1 else LOCATION_JSON_PATH
+    index_path = sys.argv[2] if len(sys.argv) > 2 else LOCATION_INDEX_PATH
+    build_location_index(json_path, index_path)
+    index = LocationIndex(index_path)
+    print(f"✅ {index_path}: 이름 {len(index)}개, {os.path.getsize(index_path):,}바이트")
@@ -0,0 +1,298 @@
+# 네이버 오픈 API 공유 HTTP 클라이언트
+# crawling/naver_client.py
+
+import os
+import time
+import random
+import asyncio
+from datetime import datetime, timedelta, timezone
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+NAVER_API_HOST = "https://openapi.naver.com"
+
+# 커넥션 풀 설정
+NAVER_MAX_CONNECTIONS = int(os.getenv("NAVER_MAX_CONNECTIONS", "10"))
+NAVER_MAX_KEEPALIVE = int(os.getenv("NAVER_MAX_KEEPALIVE", "5"))
+NAVER_KEEPALIVE_EXPIRY = float(os.getenv("NAVER_KEEPALIVE_EXPIRY", "60"))
+NAVER_TIMEOUT = float(os.getenv("NAVER_TIMEOUT", "5"))
+
+# 속도 제한 / 재시도 / 일일 쿼터 설정
+# (쿼터는 워커 프로세스별로 집계되므로 워커 수로 나눈 값을 지정)
+NAVER_RATE_PER_SEC = float(os.getenv("NAVER_RATE_PER_SEC", "10"))
+NAVER_RATE_BURST = float(os.getenv("NAVER_RATE_BURST", "10"))
+NAVER_MAX_RETRIES = int(os.getenv("NAVER_MAX_RETRIES", "3"))
+NAVER_BACKOFF_BASE = float(os.getenv("NAVER_BACKOFF_BASE", "0.5"))
+NAVER_BACKOFF_MAX = float(os.getenv("NAVER_BACKOFF_MAX", "8"))
+NAVER_DAILY_QUOTA = int(os.getenv("NAVER_DAILY_QUOTA", "25000"))
+NAVER_QUOTA_PRESSURE = float(os.getenv("NAVER_QUOTA_PRESSURE", "0.9"))
+NAVER_429_COOLDOWN = float(os.getenv("NAVER_429_COOLDOWN", "30"))
+RETRY_STATUS = {429, 500, 502, 503, 504}
+KST = timezone(timedelta(hours=9))
+
+# 인증 헤더는 한 번만 만들어 클라이언트 기본 헤더로 사용
+NAVER_AUTH_HEADERS = {
+    "X-Naver-Client-Id": os.getenv("NAVER2_CLIENT_ID") or "",
+    "X-Naver-Client-Secret": os.getenv("NAVER2_CLIENT_SECRET") or "",
+}
+
+_client: httpx.AsyncClient | None = None
+_page_client: httpx.AsyncClient | None = None
+_http2_enabled = False
+
+# 커넥션 재사용 통계
+_stats = {
+    "requests": 0,
+    "new_connections": 0,
+    "pool_hits": 0,
+    "handshake_seconds": 0.0,
+}
+
+# 속도 제한 / 쿼터 지표
+_rate_stats = {
+    "throttled": 0,
+    "retries": 0,
+    "status_429": 0,
+    "status_5xx": 0,
+    "transport_errors": 0,
+    "quota_rejected": 0,
+    "last_429_at": float("-inf"),
+}
+_quota = {"date": "", "used": 0}
+
+
+def _create_client(base_url: str = NAVER_API_HOST, headers: dict | None = None) -> httpx.AsyncClient:
+    global _http2_enabled
+    try:
+        import h2  # noqa: F401  (HTTP/2 지원 여부 확인)
+        http2 = True
+    except ImportError:
+        http2 = False
+    _http2_enabled = http2
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=NAVER_AUTH_HEADERS if headers is None else headers,
+        timeout=NAVER_TIMEOUT,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=NAVER_MAX_CONNECTIONS,
+            max_keepalive_connections=NAVER_MAX_KEEPALIVE,
+            keepalive_expiry=NAVER_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+async def open_naver_client() -> httpx.AsyncClient:
+    """앱 시작 시 호출: 프로세스 전체에서 공유할 클라이언트 생성"""
+    get_page_client()
+    return get_naver_client()
+
+
+async def close_naver_client():
+    """앱 종료 시 호출: 커넥션 풀 정리"""
+    global _client, _page_client
+    for client in (_client, _page_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _client = None
+    _page_client = None
+
+
+def get_naver_client() -> httpx.AsyncClient:
+    """
+    공유 클라이언트 반환 (lifespan 밖에서 호출되면 지연 생성)
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+def get_page_client() -> httpx.AsyncClient:
+    """
+    네이버 뉴스 페이지(랭킹 등) 크롤링용 공유 클라이언트
+    - 오픈 API 인증 헤더를 다른 호스트로 보내지 않도록 별도 클라이언트 사용
+    """
+    global _page_client
+    if _page_client is None or _page_client.is_closed:
+        _page_client = _create_client(base_url="", headers={"User-Agent": "Mozilla/5.0"})
+    return _page_client
+
+
+async def _traced_get(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """
+    GET 요청
+    - httpcore trace로 새 커넥션(TCP/TLS 핸드셰이크) 여부를 기록
+    """
+    connect = {"new": False, "tls_started": None}
+
+    async def trace(event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.started":
+            connect["new"] = True
+        elif event_name == "connection.start_tls.started":
+            connect["tls_started"] = time.perf_counter()
+        elif event_name == "connection.start_tls.complete" and connect["tls_started"]:
+            _stats["handshake_seconds"] += time.perf_counter() - connect["tls_started"]
+
+    extensions = kwargs.pop("extensions", {}) or {}
+    extensions["trace"] = trace
+    try:
+        return await client.get(url, extensions=extensions, **kwargs)
+    finally:
+        _stats["requests"] += 1
+        if connect["new"]:
+            _stats["new_connections"] += 1
+        else:
+            _stats["pool_hits"] += 1
+
+
+# ────────────────────────────────────────
+# 속도 제한 / 재시도 / 일일 쿼터
+# ────────────────────────────────────────
+class NaverRateLimitError(Exception):
+    """재시도 후에도 429 이거나 일일 쿼터를 다 쓴 경우 ('뉴스 없음'과 구분)"""
+
+
+class NaverQuotaExceeded(NaverRateLimitError):
+    pass
+
+
+class TokenBucket:
+    """초당 rate개, 최대 capacity개까지 모아 쓰는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            throttled = False
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                if not throttled:
+                    throttled = True
+                    _rate_stats["throttled"] += 1
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+_bucket = TokenBucket(NAVER_RATE_PER_SEC, NAVER_RATE_BURST)
+
+
+def _kst_today() -> str:
+    return datetime.now(KST).strftime("%Y-%m-%d")
+
+
+def _consume_quota():
+    """오픈 API 호출 1회를 오늘(KST) 쿼터에서 차감, 다 썼으면 NaverQuotaExceeded"""
+    today = _kst_today()
+    if _quota["date"] != today:
+        _quota["date"] = today
+        _quota["used"] = 0
+    if _quota["used"] >= NAVER_DAILY_QUOTA:
+        _rate_stats["quota_rejected"] += 1
+        raise NaverQuotaExceeded(f"네이버 API 일일 쿼터 소진 ({NAVER_DAILY_QUOTA})")
+    _quota["used"] += 1
+
+
+def quota_pressure() -> bool:
+    """
+    쿼터 압박 상태인지
+    - 오늘 사용량이 NAVER_QUOTA_PRESSURE 비율을 넘었거나
+    - 최근 NAVER_429_COOLDOWN 초 안에 429를 받은 경우
+    → 호출 측은 가능하면 캐시된 결과를 우선 사용
+    """
+    if _quota["date"] == _kst_today() and _quota["used"] >= NAVER_DAILY_QUOTA * NAVER_QUOTA_PRESSURE:
+        return True
+    return time.monotonic() - _rate_stats["last_429_at"] < NAVER_429_COOLDOWN
+
+
+def _retry_delay(attempt: int, res: httpx.Response | None = None) -> float:
+    """Retry-After 헤더가 있으면 따르고, 없으면 지수 백오프 + full jitter"""
+    if res is not None:
+        retry_after = res.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), NAVER_BACKOFF_MAX)
+    return random.uniform(0, min(NAVER_BACKOFF_MAX, NAVER_BACKOFF_BASE * (2 ** attempt)))
+
+
+async def _request_with_retry(client: httpx.AsyncClient, url: str, api: bool, **kwargs) -> httpx.Response:
+    """
+    토큰 버킷 대기 → 요청 → 429/5xx/네트워크 오류면 백오프 후 재시도
+    - api=True 이면 호출마다 일일 쿼터 차감
+    - 끝까지 429면 NaverRateLimitError (5xx는 응답을 그대로 돌려줌)
+    """
+    res = None
+    for attempt in range(NAVER_MAX_RETRIES + 1):
+        if api:
+            _consume_quota()
+        await _bucket.acquire()
+        try:
+            res = await _traced_get(client, url, **kwargs)
+        except httpx.TransportError as e:
+            _rate_stats["transport_errors"] += 1
+            if attempt == NAVER_MAX_RETRIES:
+                raise
+            print(f"⚠️ 네이버 요청 네트워크 오류 → 재시도 ({attempt + 1}/{NAVER_MAX_RETRIES}): {e!r}")
+            _rate_stats["retries"] += 1
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+
+        if res.status_code not in RETRY_STATUS:
+            return res
+        if res.status_code == 429:
+            _rate_stats["status_429"] += 1
+            _rate_stats["last_429_at"] = time.monotonic()
+        else:
+            _rate_stats["status_5xx"] += 1
+        if attempt == NAVER_MAX_RETRIES:
+            break
+        _rate_stats["retries"] += 1
+        await asyncio.sleep(_retry_delay(attempt, res))
+
+    if res is not None and res.status_code == 429:
+        raise NaverRateLimitError(f"네이버 요청 제한(429): {url}")
+    return res
+
+
+async def naver_get(url: str, **kwargs) -> httpx.Response:
+    """네이버 오픈 API GET (공유 클라이언트 + 속도 제한 + 재시도 + 쿼터)"""
+    return await _request_with_retry(get_naver_client(), url, api=True, **kwargs)
+
+
+async def naver_page_get(url: str, **kwargs) -> httpx.Response:
+    """네이버 뉴스 페이지 GET (속도 제한 + 재시도, 쿼터 차감 없음)"""
+    return await _request_with_retry(get_page_client(), url, api=False, **kwargs)
+
+
+def naver_client_stats() -> dict:
+    """커넥션 풀 재사용 통계 (pool_hits vs new_connections) + 속도 제한/쿼터 지표"""
+    client = _client
+    rate_stats = {k: v for k, v in _rate_stats.items() if k != "last_429_at"}
+    return {
+        **_stats,
+        "handshake_seconds": round(_stats["handshake_seconds"], 4),
+        "http2": _http2_enabled,
+        "client_open": client is not None and not client.is_closed,
+        "rate_limit": {
+            **rate_stats,
+            "rate_per_sec": NAVER_RATE_PER_SEC,
+            "quota_pressure": quota_pressure(),
+        },
+        "quota": {
+            "date": _quota["date"],
+            "used": _quota["used"],
+            "daily_limit": NAVER_DAILY_QUOTA,
+        },
+    }
@@ -1,47 +1,273 @@
 # 기사 본문 크롤링 함수
 
+import os
+import re
+import asyncio
+from urllib.parse import urlparse
+from typing import Callable
+
 import requests
-from bs4 import BeautifulSoup, Tag
+import httpx
+from charset_normalizer import from_bytes
+
+from crawling.article_extractors import extract_article_text, ArticleEndDetector
+from crawling.parse_pool import run_parse
+
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# 비동기 기사 수집 설정 (동시 요청 수 / 같은 언론사 동시 요청 수 / 요청 타임아웃)
+ARTICLE_FETCH_CONCURRENCY = int(os.getenv("ARTICLE_FETCH_CONCURRENCY", "8"))
+ARTICLE_FETCH_PER_HOST = int(os.getenv("ARTICLE_FETCH_PER_HOST", "2"))
+ARTICLE_FETCH_TIMEOUT = float(os.getenv("ARTICLE_FETCH_TIMEOUT", "10"))
+
+# 기사 한 건당 최대 다운로드 크기 (본문은 보통 앞쪽에 있어 이 이상은 받지 않음)
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(1024 * 1024)))
+# 인코딩 선언이 없을 때만 추정에 쓰는 앞부분 크기
+CHARSET_DETECT_BYTES = 64 * 1024
+
+# 헤더/메타 태그에서 인코딩을 찾지 못한 경우를 위한 한국어 별칭 (euc-kr → cp949 상위 호환)
+CHARSET_ALIASES = {"euc-kr": "cp949", "ks_c_5601-1987": "cp949", "x-windows-949": "cp949"}
+
+_HEADER_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+
+_article_client: httpx.AsyncClient | None = None
+_fetch_semaphore: asyncio.Semaphore | None = None
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+_download_stats = {
+    "downloads": 0,
+    "bytes": 0,
+    "early_stopped": 0,     # 본문 컨테이너가 닫혀 일찍 멈춘 횟수
+    "capped": 0,            # 크기 상한에 걸려 멈춘 횟수
+    "charset_header": 0,
+    "charset_meta": 0,
+    "charset_detected": 0,  # 선언이 없어 추정한 횟수
+}
+
+
+# ────────────────────────────────────────
+# 인코딩 결정 (헤더 → meta 태그 → 추정)
+# ────────────────────────────────────────
+def _normalize_charset(charset: str | None) -> str | None:
+    if not charset:
+        return None
+    charset = charset.strip().lower()
+    return CHARSET_ALIASES.get(charset, charset)
+
+
+def _decode_html(body: bytes, content_type: str | None) -> tuple[str, str]:
+    """(문자열, 인코딩 결정 방법) - 통계는 호출한 쪽(부모 프로세스)에서 집계"""
+    candidates = [
+        ("charset_header", _HEADER_CHARSET.search(content_type or "")),
+        ("charset_meta", _META_CHARSET.search(body[:4096])),
+    ]
+    for source, match in candidates:
+        if not match:
+            continue
+        charset = match.group(1)
+        if isinstance(charset, bytes):
+            charset = charset.decode("ascii", "ignore")
+        try:
+            return body.decode(_normalize_charset(charset), errors="replace"), source
+        except LookupError:
+            continue  # 알 수 없는 인코딩 이름 → 다음 후보
+
+    best = from_bytes(body[:CHARSET_DETECT_BYTES]).best()
+    encoding = _normalize_charset(best.encoding) if best else "utf-8"
+    return body.decode(encoding, errors="replace"), "charset_detected"
+
+
+def decode_html(body: bytes, content_type: str | None = None) -> str:
+    """
+    기사 HTML 바이트 → 문자열
+    - Content-Type 헤더의 charset, 없으면 앞부분 <meta charset>을 사용
+    - 둘 다 없을 때만 앞부분 CHARSET_DETECT_BYTES로 인코딩 추정
+    """
+    text, source = _decode_html(body, content_type)
+    _download_stats[source] += 1
+    return text
+
+
+def parse_article_bytes(body: bytes, content_type: str | None, url: str) -> tuple[str, str]:
+    """
+    다운로드한 기사 바이트 → (본문, 인코딩 결정 방법)
+    파싱 프로세스 풀에서 실행되므로 모듈 최상위 함수로 둠
+    """
+    html, source = _decode_html(body, content_type)
+    return extract_article_text(html, url), source
+
+
+class _DownloadBuffer:
+    """받은 청크를 모으면서 크기 상한 / 본문 종료 여부를 판단"""
+
+    def __init__(self, url: str, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.detector = ArticleEndDetector(url)
+        self.buf = bytearray()
+
+    def add(self, chunk: bytes) -> bool:
+        """계속 받아야 하면 True"""
+        self.buf += chunk
+        if len(self.buf) >= self.max_bytes:
+            _download_stats["capped"] += 1
+            del self.buf[self.max_bytes:]
+            return False
+        if self.detector.feed(chunk):
+            _download_stats["early_stopped"] += 1
+            return False
+        return True
+
+    def body(self) -> bytes:
+        _download_stats["downloads"] += 1
+        _download_stats["bytes"] += len(self.buf)
+        return bytes(self.buf)
+
+
+def download_article_html(url: str, max_bytes: int = ARTICLE_MAX_BYTES) -> tuple[bytes, str | None]:
+    """기사 HTML을 스트리밍으로 받아 (본문 바이트, Content-Type) 반환 (동기)"""
+    with requests.get(url, headers=HEADERS, timeout=10, stream=True) as res:
+        res.raise_for_status()
+        buffer = _DownloadBuffer(url, max_bytes)
+        for chunk in res.iter_content(chunk_size=16 * 1024):
+            if not buffer.add(chunk):
+                break
+        return buffer.body(), res.headers.get("content-type")
+
 
 def get_article_content(url):
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        res = requests.get(url, headers=headers, timeout=10)
+        body, content_type = download_article_html(url)
+        return extract_article_text(decode_html(body, content_type), url)
+
+    except Exception as e:
+        return f"에러 발생: {e}"
+
+
+def is_article_error(content: str) -> bool:
+    """수집 실패로 돌려받은 메시지인지 확인"""
+    return not content or content.startswith("에러 발생")
+
+
+# ────────────────────────────────────────
+# 비동기 기사 수집 (공유 커넥션 풀)
+# ────────────────────────────────────────
+def get_article_client() -> httpx.AsyncClient:
+    """
+    언론사 기사 수집용 공유 httpx.AsyncClient (keep-alive 커넥션 풀)
+    """
+    global _article_client
+    if _article_client is None or _article_client.is_closed:
+        _article_client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=ARTICLE_FETCH_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=ARTICLE_FETCH_CONCURRENCY * 2,
+                max_keepalive_connections=ARTICLE_FETCH_CONCURRENCY,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _article_client
+
+
+async def close_article_client():
+    global _article_client
+    if _article_client is not None and not _article_client.is_closed:
+        await _article_client.aclose()
+    _article_client = None
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = urlparse(url).netloc
+    sem = _host_semaphores.get(host)
+    if sem is None:
+        sem = _host_semaphores[host] = asyncio.Semaphore(ARTICLE_FETCH_PER_HOST)
+    return sem
+
+
+async def adownload_article_html(
+    url: str,
+    max_bytes: int = ARTICLE_MAX_BYTES
+) -> tuple[bytes, str | None]:
+    """download_article_html의 비동기 버전 (공유 커넥션 풀 사용)"""
+    async with get_article_client().stream("GET", url) as res:
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, 'html.parser')
-        article = None
-
-        # ── 1) MBN 전용 처리 ──
-        if "mbn.co.kr" in url:
-            # (a) 먼저 메타 description 확인
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc and meta_desc.get("content"):
-                return meta_desc["content"].strip()
-
-        # ── 2) 노컷뉴스 ──
-        if "nocutnews.co.kr" in url:
-            article = soup.select_one("div#pnlContent")
-        # ── 3) 연합뉴스 ──
-        elif "yna.co.kr" in url:
-            for sel in ("#articleFailoverContent", "#articleWrap", "#articleContent"):
-                article = soup.select_one(sel)
-                if article and article.get_text(strip=True):
-                    break
-
-        # ── 4) 일반적인 fallback ──
-        if not article:
-            article = soup.select_one("#dic_area") or soup.find("article")
-        if not article:
-            article = soup.find("div", class_=lambda x: x and "content" in x)
-
-        # ── 5) 불필요 요소 제거 및 텍스트 반환 ──
-        if article:
-            for bad in article.select("script, style, aside, .ad"):
-                bad.decompose()
-            text = article.get_text(separator=" ", strip=True)
-            return text if text else "본문이 비어 있습니다."
-
-        return "본문을 불러올 수 없습니다."
+        buffer = _DownloadBuffer(url, max_bytes)
+        async for chunk in res.aiter_bytes():
+            if not buffer.add(chunk):
+                break
+        return buffer.body(), res.headers.get("content-type")
+
+
+def article_download_stats() -> dict:
+    stats = dict(_download_stats)
+    stats["avg_bytes"] = round(stats["bytes"] / stats["downloads"]) if stats["downloads"] else 0
+    stats["max_bytes"] = ARTICLE_MAX_BYTES
+    return stats
+
+
+async def fetch_article_content(url: str) -> str:
+    """
+    get_article_content의 비동기 버전
+    - 전체 동시 요청 수와 언론사(호스트)별 동시 요청 수를 함께 제한
+    - 실패 시 동기 버전과 같은 '에러 발생: ...' 문자열 반환
+    """
+    global _fetch_semaphore
+    if _fetch_semaphore is None:
+        _fetch_semaphore = asyncio.Semaphore(ARTICLE_FETCH_CONCURRENCY)
+
+    try:
+        async with _fetch_semaphore, _host_semaphore(url):
+            body, content_type = await adownload_article_html(url)
+        # 디코딩/파싱은 CPU 작업이라 파싱 프로세스 풀에서 처리
+        text, source = await run_parse(parse_article_bytes, body, content_type, url)
+        _download_stats[source] += 1
+        return text
 
     except Exception as e:
         return f"에러 발생: {e}"
+
+
+async def fetch_articles(urls: list[str]) -> list[tuple[str, str]]:
+    """후보 URL을 한꺼번에 요청해 성공한 기사만 [(url, content), ...] (입력 순서 유지)"""
+    contents = await asyncio.gather(*(fetch_article_content(url) for url in urls))
+    return [
+        (url, content)
+        for url, content in zip(urls, contents)
+        if not is_article_error(content)
+    ]
+
+
+async def fetch_first_articles(
+    urls: list[str],
+    limit: int = 3,
+    accept: Callable[[str], bool] | None = None
+) -> list[tuple[str, str]]:
+    """
+    후보 URL을 한꺼번에 요청하고, 먼저 도착한 기사부터 accept 검사를 통과한
+    기사를 최대 limit개 모아 [(url, content), ...] 로 반환합니다.
+    limit개가 모이면 남은 요청은 취소합니다.
+    """
+    if not urls:
+        return []
+
+    async def _fetch(url: str) -> tuple[str, str]:
+        return url, await fetch_article_content(url)
+
+    tasks = [asyncio.create_task(_fetch(url)) for url in urls]
+    picked: list[tuple[str, str]] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            url, content = await next_done
+            if is_article_error(content):
+                continue
+            if accept is not None and not accept(content):
+                continue
+            picked.append((url, content))
+            if len(picked) >= limit:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return picked
@@ -1,20 +1,36 @@
 # 키워드로 뉴스 검색해서 URL 리스트 가져오기
 # crawling\news_searcher.py
 
-import random
+import zlib
+import unicodedata
 import requests
-import json
 import urllib.parse
 import os
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import httpx
 import asyncio
+from cachetools import TTLCache, LRUCache
+from crawling.naver_client import naver_get, quota_pressure, NaverRateLimitError
+from crawling.location_index import load_location_index
+# 도메인 어휘 목록은 utils/vocabulary.py 로 이동 (기존 import 경로 유지용 재노출)
+from utils.vocabulary import (
+    person_keywords,
+    location_keywords,
+    economy_keywords,
+    environment_keywords,
+    word_categories
+)
 
 load_dotenv()  # .env 파일 로드
 
-client_id = os.getenv("NAVER2_CLIENT_ID")
-client_secret = os.getenv("NAVER2_CLIENT_SECRET")
+# 검색 결과 캐시: (정규화 키워드, 위치 변형, display) → items
+# TTLCache는 maxsize 초과 시 가장 오래 안 쓰인(LRU) 항목부터 제거
+SEARCH_CACHE_TTL = float(os.getenv("NAVER_SEARCH_CACHE_TTL", "300"))
+SEARCH_CACHE_SIZE = int(os.getenv("NAVER_SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+# TTL이 지나도 남겨두는 마지막 결과: 쿼터 압박/429 때 대신 사용
+STALE_SEARCH_CACHE: LRUCache = LRUCache(maxsize=SEARCH_CACHE_SIZE * 4)
+_search_cache_stats = {"hits": 0, "misses": 0, "stale_served": 0}
 
 # 쿼리에서 완전히 제거할 불필요한 단어
 IRRELEVANT_STOPWORDS = {
@@ -39,8 +55,8 @@ IRRELEVANT_STOPWORDS = {
 TIME_KEYWORDS = {'오늘', '어제', '지금', '방금', '최근', '현재'}
 TIME_OFFSET = {'오늘': 0, '지금': 0, '방금': 0, '현재': 0, '어제': 1, '최근': 0}
 
-with open("data/korea_location_hierarchy.json", encoding="utf-8") as f:
-    LOCATION_MAP = json.load(f)
+# 지역 계층: JSON 대신 미리 빌드한 이진 색인을 mmap (dict처럼 get/in/items 사용)
+LOCATION_MAP = load_location_index()
 
 def clean_keyword(raw: str) -> str:
     """
@@ -49,73 +65,26 @@ def clean_keyword(raw: str) -> str:
     tokens = [t for t in raw.split() if t not in IRRELEVANT_STOPWORDS]
     return " ".join(tokens) if tokens else raw
 
-# 샘플 인물 리스트
-person_keywords = [
-    # 정치 인물
-    '윤석열', '이재명', '김기현', '한동훈', '이낙연', '홍준표', '유승민', '안철수', '오세훈', '원희룡',
-    '추미애', '박지원', '심상정', '조국', '한덕수', '정은경', '박근혜', '문재인', '이명박', '노무현',
-    '전두환', '김대중', '김영삼',
-
-    # 해외 정치인
-    '바이든', '트럼프', '시진핑', '김정은', '김여정', '푸틴', '기시다', '마크롱', '메르켈',
-    '젤렌스키', '나렌드라 모디', '보리스 존슨', '리시 수낙', '올라프 숄츠', '카말라 해리스',
-
-    # 경제계 유명 인사
-    '이재용', '정의선', '최태원', '구광모', '신동빈', '엘론 머스크', '마크 저커버그', '제프 베이조스', 
-    '팀 쿡', '손정의', '워런 버핏', '빌 게이츠', '잭 마',
-
-    # 연예·스포츠 유명 인사
-    '손흥민', '이강인', '김연아', '류현진', '이정후', '임영웅', 'BTS', '블랙핑크', '유재석', 
-    '아이유', '전지현', '송중기', '현빈', '이병헌', '차은우',
-
-    # 기타 사회적으로 유명한 인물
-    '조코비치', '페더러', '메시', '호날두', '박항서', '손석희', '이국종', '백종원', '강형욱',
-    '윤여정', '봉준호', '황선우', '추신수'
-]
-
-# 샘플 지역 리스트
-location_keywords = [
-    '서울', '부산', '대구', '광주', '인천', '울산', '대전', '세종', '수원', '성남',
-    '고양', '용인', '창원', '청주', '전주', '포항', '여수', '천안', '안산', '제주',
-    '강릉', '춘천', '평창', '경주', '군산', '목포', '진주', '김해', '양산',
-    
-    # 북한 주요 지역 (뉴스에 자주 등장)
-    '평양', '개성', '함흥', '신의주',
-
-    # 해외 주요 도시 (자주 등장)
-    '뉴욕', '워싱턴', '베이징', '상하이', '도쿄', '오사카', '런던', '파리', '베를린',
-    '모스크바', '홍콩', '싱가포르', '두바이', '로스앤젤레스', '실리콘밸리'
-]
-
-# 샘플 경제 키워드
-economy_keywords = [
-    # 국내 주요 기업·그룹
-    '삼성', 'LG', '현대자동차', '기아', 'SK하이닉스', '카카오', '네이버', '롯데', '한화', '포스코', '쿠팡', '셀트리온',
-    'CJ', 'KT', '신세계', '아모레퍼시픽', '하나은행', '신한은행', 'KB국민은행',
 
-    # 해외 기업
-    '애플', '테슬라', '엔비디아', '아마존', '구글', '알파벳', '넷플릭스', '메타', '마이크로소프트', '페이스북',
-    '화웨이', '샤오미', '텐센트', '알리바바',
-
-    # 주요 경제지표·분야
-    '코스피', '코스닥', '나스닥', '다우존스', 'S&P500', '주식시장', '증시', '환율', '금리', '물가', '인플레이션',
-    '부동산', '아파트 가격', '전세', '월세', '주택시장', '청약', '분양',
-
-    # 금융·기술 이슈
-    '비트코인', '이더리움', '암호화폐', '가상화폐', 'NFT', '블록체인', '핀테크', '스타트업', '창업', '벤처기업',
-    '유니콘', 'IPO', '공모주', '한국은행', '미국 증시', '중국 경제', '무역수지', '수출입',
+def canonicalize_keyword(keyword: str) -> str:
+    """
+    캐시 키용 정규형: 유니코드 NFC 정규화 + 공백 정리 + 불용어 제거
+    ex) ' 삼성  뉴스 ' / '삼성 뉴스' → 같은 키
+    """
+    normalized = unicodedata.normalize("NFC", keyword)
+    return clean_keyword(" ".join(normalized.split()))
 
-    # 글로벌 경제 상황
-    '경제 위기', '침체', '호황', '불황', '구조조정', '실업률', '고용', '경기침체', '반도체', '자동차 산업', '조선업'
-]
 
-environment_keywords = {"미세먼지", "황사", "초미세먼지", "대기질"}
+def _pick_pattern(keyword: str, patterns: list[str]) -> str:
+    """키워드마다 항상 같은 패턴을 고르도록 crc32로 결정 (캐시 가능하게)"""
+    return patterns[zlib.crc32(keyword.encode("utf-8")) % len(patterns)]
 
 
 def refine_keyword_for_search(keyword: str) -> str:
     """
     키워드를 검색 친화적으로 정제하는 함수
     - 키워드 종류(인물, 사건, 지역, 경제 등)에 따라 다른 패턴 적용
+    - 같은 키워드는 항상 같은 쿼리가 되도록 패턴을 결정적으로 선택
     """
     person_patterns = [
         f"{keyword} 관련 기사",
@@ -147,16 +116,17 @@ def refine_keyword_for_search(keyword: str) -> str:
         f"{keyword} 최신 소식",
     ]
 
-    if keyword in person_keywords or '대통령' in keyword:
-        return random.choice(person_patterns)
-    elif keyword in location_keywords:
-        return random.choice(location_patterns)
-    elif keyword in economy_keywords:
-        return random.choice(economy_patterns)
-    elif keyword in environment_keywords:
-        return random.choice(environment_patterns)
+    categories = word_categories(keyword)
+    if "person" in categories or '대통령' in keyword:
+        return _pick_pattern(keyword, person_patterns)
+    elif "location" in categories:
+        return _pick_pattern(keyword, location_patterns)
+    elif "economy" in categories:
+        return _pick_pattern(keyword, economy_patterns)
+    elif "environment" in categories:
+        return _pick_pattern(keyword, environment_patterns)
     else:
-        return random.choice(general_patterns)
+        return _pick_pattern(keyword, general_patterns)
     
 
 
@@ -185,60 +155,120 @@ def expand_location(token: str) -> list[str]:
         chain.append("대한민국")
     return chain
 
-async def _fetch_items(client: httpx.AsyncClient, url: str) -> list[dict]:
-    """단일 URL에서 JSON 아이템을 가져오고 실패 시 빈 리스트 리턴"""
+async def _fetch_items(url: str) -> list[dict]:
+    """
+    단일 URL에서 JSON 아이템을 가져오고 실패 시 빈 리스트 리턴
+    - 요청 제한(429)/쿼터 소진은 '뉴스 없음'과 구분되도록 NaverRateLimitError를 그대로 올림
+    """
     try:
-        headers = {
-            "X-Naver-Client-Id": client_id,
-            "X-Naver-Client-Secret": client_secret
-        }
-        r = await client.get(url, headers=headers)
+        # 인증 헤더는 공유 클라이언트(naver_client)에 이미 설정되어 있음
+        r = await naver_get(url)
         r.raise_for_status()
         return r.json().get("items", [])
+    except NaverRateLimitError:
+        raise
     except Exception:
         return []
 
+async def _fetch_items_cached(cache_key: tuple, url: str) -> list[dict]:
+    """
+    SEARCH_CACHE를 먼저 확인하고, 없을 때만 네이버 API 호출
+    - 빈 결과(실패 포함)는 캐시하지 않음
+    - 쿼터 압박/요청 제한 시에는 TTL 지난 마지막 결과(STALE_SEARCH_CACHE)로 대체
+    """
+    items = SEARCH_CACHE.get(cache_key)
+    if items is not None:
+        _search_cache_stats["hits"] += 1
+        return items
+    _search_cache_stats["misses"] += 1
+
+    # 쿼터 압박 중이면 오래된 결과라도 먼저 사용
+    stale = STALE_SEARCH_CACHE.get(cache_key)
+    if stale is not None and quota_pressure():
+        _search_cache_stats["stale_served"] += 1
+        return stale
+
+    try:
+        items = await _fetch_items(url)
+    except NaverRateLimitError as e:
+        print(f"🚦 {e} → 캐시된 결과로 대체")
+        if stale is not None:
+            _search_cache_stats["stale_served"] += 1
+        return stale or []
+    if items:
+        SEARCH_CACHE[cache_key] = items
+        STALE_SEARCH_CACHE[cache_key] = items
+    return items
+
+def search_cache_stats() -> dict:
+    """검색 결과 캐시 적중/미스 통계"""
+    total = _search_cache_stats["hits"] + _search_cache_stats["misses"]
+    return {
+        **_search_cache_stats,
+        "hit_rate": round(_search_cache_stats["hits"] / total, 4) if total else 0.0,
+        "size": len(SEARCH_CACHE),
+        "stale_size": len(STALE_SEARCH_CACHE),
+        "maxsize": SEARCH_CACHE.maxsize,
+        "ttl": SEARCH_CACHE.ttl,
+    }
+
+async def _first_non_empty(coros: list) -> list[dict]:
+    """
+    우선순위 순서(동 → 구 → 시 → 대한민국)로 준 요청들을 한꺼번에 시작하고,
+    가장 높은 순위의 비어 있지 않은 결과가 확정되는 즉시 반환
+    - 앞 순위 요청이 끝날 때까지는 기다림 (뒤 순위가 먼저 끝나도 결과는 보관만)
+    - 반환 시점에 아직 진행 중인 낮은 순위 요청은 취소 → 지연 시간과 API 쿼터 절약
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        for task in tasks:
+            items = await task
+            if items:
+                return items
+        return []
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
 async def _fetch_for_keyword(
-    client: httpx.AsyncClient,
     raw_keyword: str,
     max_per_keyword: int
 ) -> tuple[str, list[str]]:
     # 1) 기존 clean_keyword, token 분리, date_offset 계산
     keyword = clean_keyword(raw_keyword if isinstance(raw_keyword, str) else " ".join(raw_keyword))
-    tokens = keyword.split()
+    canonical = canonicalize_keyword(keyword)
+    tokens = canonical.split()
     date_offset = next((TIME_OFFSET[t] for t in tokens if t in TIME_KEYWORDS), None)
 
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
-    urls_to_try: list[str] = []
+    # (캐시 키, 요청 URL) 목록
+    urls_to_try: list[tuple[tuple, str]] = []
 
     # 2) 위치 키워드 있을 때
     loc = next((t for t in tokens if t in LOCATION_MAP), None)
     if loc:
         for loc_variant in expand_location(loc):
             query = build_and_query([loc_variant] + [t for t in tokens if t != loc])
-            urls_to_try.append(
-                f"https://openapi.naver.com/v1/search/news"
+            urls_to_try.append((
+                (canonical, loc_variant, max_per_keyword),
+                f"/v1/search/news"
                 f"?query={query}&display={max_per_keyword}&sort=date"
-            )
+            ))
+        pattern = None
     # 3) 위치 없으면 일반 키워드 패턴
     else:
-        pattern = refine_keyword_for_search(keyword)
+        pattern = refine_keyword_for_search(canonical)
         q = urllib.parse.quote(pattern)
-        urls_to_try.append(
-            f"https://openapi.naver.com/v1/search/news"
+        urls_to_try.append((
+            (canonical, None, max_per_keyword),
+            f"/v1/search/news"
             f"?query={q}&display={max_per_keyword}&sort=date"
-        )
+        ))
 
-    # 4) 후보 URL들 병렬 요청 → 첫 결과가 있으면 사용
-    tasks = [_fetch_items(client, url) for url in urls_to_try]
-    for items in await asyncio.gather(*tasks):
-        if items:
-            break
-    else:
-        items = []
+    # 4) 후보 URL들 병렬 요청 → 우선순위 높은 것부터 첫 결과가 있으면 사용
+    items = await _first_non_empty(
+        [_fetch_items_cached(cache_key, url) for cache_key, url in urls_to_try]
+    )
 
     # 5) 날짜 필터링
     if date_offset is not None and all(t not in TIME_KEYWORDS for t in tokens):
@@ -249,7 +279,7 @@ async def _fetch_for_keyword(
         ]
 
     print(f"🧪 refined query: {pattern}")
-    print(f"🔗 request URL: {urls_to_try}")
+    print(f"🔗 request URL: {[url for _, url in urls_to_try]}")
 
     return keyword, [it["link"] for it in items]
 
@@ -258,15 +288,14 @@ async def search_news_by_keywords(
     max_per_keyword: int = 6
 ) -> dict[str, list[str]]:
     """
-    비동기 httpx.AsyncClient + asyncio.gather로
+    프로세스 공유 httpx.AsyncClient(naver_client) + asyncio.gather로
     키워드별·위치별 검색을 병렬 처리합니다.
     """
     results: dict[str, list[str]] = {}
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        tasks = [
-            _fetch_for_keyword(client, kw, max_per_keyword)
-            for kw in keywords
-        ]
-        for keyword, links in await asyncio.gather(*tasks):
-            results[keyword] = links
+    tasks = [
+        _fetch_for_keyword(kw, max_per_keyword)
+        for kw in keywords
+    ]
+    for keyword, links in await asyncio.gather(*tasks):
+        results[keyword] = links
     return results
\ No newline at end of file
@@ -0,0 +1,96 @@
+# HTML 파싱 전용 프로세스 풀
+# crawling/parse_pool.py
+#
+# BeautifulSoup 파싱은 CPU 작업이라 GIL을 잡고 있어, 스레드로 넘겨도 같은 워커의
+# 다른 코루틴(다른 사용자 요청)이 함께 멈춤 → 별도 프로세스에서 파싱하고 결과만 받음
+
+import os
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+# 파싱 프로세스 수 (0이면 프로세스 풀 없이 스레드에서 파싱)
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 워커 시작 방식: fork는 부모의 JVM(Okt)·스레드·열린 클라이언트까지 복제하므로 쓰지 않음
+# (forkserver가 없는 플랫폼은 spawn)
+PARSE_POOL_START_METHOD = os.getenv(
+    "PARSE_POOL_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_pool: ProcessPoolExecutor | None = None
+
+_pool_stats = {
+    "submitted": 0,
+    "thread_fallback": 0,   # 풀이 없거나 깨져서 스레드에서 처리한 횟수
+    "restarts": 0,
+}
+
+
+def _warm_worker():
+    """
+    워커 프로세스 초기화: 파서/추출 모듈을 미리 import하고 한 번 파싱해 둠
+    (첫 요청이 import·캐시 생성 비용을 떠안지 않도록)
+    """
+    from crawling.article_extractors import extract_article_text
+    from crawling import weather_fetcher, rank_news  # noqa: F401
+
+    extract_article_text("<html><body><article>warm</article></body></html>", "https://n.news.naver.com/")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def start_parse_pool() -> ProcessPoolExecutor | None:
+    """앱 시작 시 호출: 워커를 전부 띄우고 초기화까지 끝내 둠"""
+    global _pool
+    if PARSE_POOL_WORKERS <= 0:
+        return None
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=PARSE_POOL_WORKERS,
+            mp_context=multiprocessing.get_context(PARSE_POOL_START_METHOD),
+            initializer=_warm_worker,
+        )
+        # 워커는 작업이 들어와야 생성되므로 워커 수만큼 작업을 넣어 미리 띄움
+        pids = {f.result() for f in [_pool.submit(_ping) for _ in range(PARSE_POOL_WORKERS)]}
+        print(f"🧵 파싱 프로세스 풀 시작: {len(pids)}개 워커 ({PARSE_POOL_START_METHOD})")
+    return _pool
+
+
+def stop_parse_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    _pool = None
+
+
+async def run_parse(fn: Callable, *args):
+    """
+    파싱 함수를 프로세스 풀에서 실행하고 결과를 기다림
+    - fn과 인자는 피클 가능해야 함 (모듈 최상위 함수 + bytes/str 인자)
+    - 풀이 없으면(스크립트 실행, PARSE_POOL_WORKERS=0) 스레드에서 실행
+    """
+    global _pool
+    if _pool is not None:
+        _pool_stats["submitted"] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(_pool, fn, *args)
+        except BrokenProcessPool:
+            # 워커가 죽으면 풀을 새로 만들고 이번 작업은 스레드에서 처리
+            print("⚠️ 파싱 프로세스 풀이 깨져 다시 시작합니다.")
+            _pool_stats["restarts"] += 1
+            broken, _pool = _pool, None
+            broken.shutdown(wait=False, cancel_futures=True)
+            await asyncio.to_thread(start_parse_pool)
+
+    _pool_stats["thread_fallback"] += 1
+    return await asyncio.to_thread(fn, *args)
+
+
+def parse_pool_stats() -> dict:
+    return {**_pool_stats, "workers": PARSE_POOL_WORKERS, "running": _pool is not None}
@@ -3,40 +3,65 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from crawling.naver_client import naver_page_get
+from crawling.parse_pool import run_parse
+
+RANKING_URL = "https://news.naver.com/main/ranking/popularDay.naver"
+
+
+def parse_trending_news(html: str | bytes, limit: int = 3) -> list[dict]:
+    """랭킹 페이지 HTML → [{"title", "url"}, ...] (최대 limit개, 파싱 프로세스 풀에서 실행)"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    result = []
+
+    # 언론사별 랭킹 박스 순회
+    for box in soup.select("div.rankingnews_box"):
+        ul = box.select_one("ul.rankingnews_list")
+        if not ul:
+            continue
+
+        for li in ul.select("li")[:limit]:
+            a_tag = li.find("a")
+            if not a_tag:
+                continue
+
+            title = a_tag.get_text(strip=True)
+            link = urljoin(RANKING_URL, a_tag["href"])  # 상대경로 보정
+            result.append({"title": title, "url": link})
+
+            if len(result) >= limit:
+                return result
+
+    return result
+
 
 def fetch_naver_trending_news(limit=3):
     """
     네이버 뉴스 홈의 '많이 본 뉴스'를 크롤링하여 상위 기사 링크와 제목을 반환합니다.
     """
-    url = "https://news.naver.com/main/ranking/popularDay.naver"
     headers = {"User-Agent": "Mozilla/5.0"}
 
     try:
-        res = requests.get(url, headers=headers, timeout=10)
+        res = requests.get(RANKING_URL, headers=headers, timeout=10)
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
+        return parse_trending_news(res.text, limit)
 
-        result = []
-
-        # 언론사별 랭킹 박스 순회
-        for box in soup.select("div.rankingnews_box"):
-            ul = box.select_one("ul.rankingnews_list")
-            if not ul:
-                continue
-
-            for li in ul.select("li")[:limit]:
-                a_tag = li.find("a")
-                if not a_tag:
-                    continue
-
-                title = a_tag.get_text(strip=True)
-                link = urljoin(url, a_tag["href"])  # 상대경로 보정
-                result.append({"title": title, "url": link})
+    except Exception as e:
+        print(f"❌ 크롤링 실패: {e}")
+        return []
 
-                if len(result) >= limit:
-                    return result
 
-        return result
+async def fetch_naver_trending_news_async(limit=3):
+    """
+    fetch_naver_trending_news 의 비동기 버전
+    - naver_client 공유 레이어(속도 제한 + 429/5xx 재시도)를 거쳐 요청
+    - 파싱은 파싱 프로세스 풀에서 처리
+    """
+    try:
+        res = await naver_page_get(RANKING_URL)
+        res.raise_for_status()
+        return await run_parse(parse_trending_news, res.content, limit)
 
     except Exception as e:
         print(f"❌ 크롤링 실패: {e}")
@@ -2,6 +2,8 @@
 
 import requests, urllib.parse, re
 from bs4 import BeautifulSoup, SoupStrainer
+from crawling.naver_client import naver_page_get
+from crawling.parse_pool import run_parse
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -9,13 +11,39 @@ USER_AGENT = (
     "Chrome/115.0.0.0 Safari/537.36"
 )
 
-def _get_soup(location: str) -> BeautifulSoup:
-    url = "https://search.naver.com/search.naver?query=" \
-          + urllib.parse.quote(f"{location} 날씨")
-    headers = {"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"}
-    resp = requests.get(url, headers=headers, timeout=5)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+WEATHER_HEADERS = {"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"}
+
+WEEKLY_ITEMS_SELECTOR = (
+    "div.api_subject_bx._weekly_weather_wrap "
+    "div.list_box._weekly_weather ul li"
+)
+
+
+def _weather_url(location: str) -> str:
+    return "https://search.naver.com/search.naver?query=" \
+           + urllib.parse.quote(f"{location} 날씨")
+
+
+def _get_page(location: str, raise_status: bool = True) -> bytes:
+    resp = requests.get(_weather_url(location), headers=WEATHER_HEADERS, timeout=5)
+    if raise_status:
+        resp.raise_for_status()
+    return resp.content
+
+
+async def _aget_page(location: str, raise_status: bool = True) -> bytes:
+    """_get_page의 비동기 버전 (네이버 공유 페이지 클라이언트 + 속도 제한)"""
+    resp = await naver_page_get(_weather_url(location), headers=WEATHER_HEADERS)
+    if raise_status:
+        resp.raise_for_status()
+    return resp.content
+
+
+def _soup(body: bytes | str) -> BeautifulSoup:
+    # 네이버 검색 결과는 UTF-8 → 인코딩 추정 없이 바로 디코딩
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    return BeautifulSoup(body, "html.parser")
 
 def normalize_location_name(location: str) -> str:
     """
@@ -65,13 +93,9 @@ def extract_air_quality(soup):
     return None
 
 
-def get_current_weather(location: str):
-    location = normalize_location_name(location)
-
-    url = "https://search.naver.com/search.naver?query=" + urllib.parse.quote(f"{location} 날씨")
-    headers = {"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"}
-    res = requests.get(url, headers=headers, timeout=5)
-    soup = BeautifulSoup(res.text, "html.parser")
+def parse_current_weather(body: bytes | str, location: str) -> dict:
+    """현재 날씨 검색 결과 HTML → 날씨 항목 dict (파싱 프로세스 풀에서 실행)"""
+    soup = _soup(body)
 
     # 현재 온도
     temp_span = soup.find("span", string=re.compile("현재 온도"))
@@ -107,53 +131,58 @@ def get_current_weather(location: str):
     }
 
 
-def get_forecast_weather(location: str, day_offset: int) -> str | None:
-    """
-    day_offset=1 → 내일, 2 → 모레
-    """
+def get_current_weather(location: str):
     location = normalize_location_name(location)
-    soup = _get_soup(location)
-    items = soup.select(
-        "div.api_subject_bx._weekly_weather_wrap "
-        "div.list_box._weekly_weather ul li"
-    )
-    if not items or day_offset >= len(items):
-        return None
+    return parse_current_weather(_get_page(location, raise_status=False), location)
 
-    li = items[day_offset]
 
-    # 1) 날짜·요일
-    date_tag = li.select_one(".date")
-    date = date_tag.get_text(strip=True).rstrip(".") if date_tag else ""
+async def get_current_weather_async(location: str) -> dict:
+    location = normalize_location_name(location)
+    body = await _aget_page(location, raise_status=False)
+    return await run_parse(parse_current_weather, body, location)
 
-    # 2) 날씨 설명 (두 번째 .blind 엘리먼트)
+
+def _day_description(li) -> str:
+    # 날씨 설명 (두 번째 .blind 엘리먼트)
     blinds = li.select("span.blind")
     if len(blinds) >= 2:
-        desc = blinds[1].get_text(strip=True)
-    else:
-        desc_tag = li.select_one(".weather_desc") or blinds[:1]
-        desc = desc_tag.get_text(strip=True) if desc_tag else "정보 없음"
+        return blinds[1].get_text(strip=True)
+    desc_tag = li.select_one(".weather_desc") or (blinds[0] if blinds else None)
+    return desc_tag.get_text(strip=True) if desc_tag else "정보 없음"
+
 
-    # 3) 최저·최고 기온
+def _day_temperatures(li) -> tuple[str, str]:
+    # 최저·최고 기온
     low_tag  = li.select_one("span.lowest")
     high_tag = li.select_one("span.highest")
     low  = re.sub(r"[^\d.-]", "", low_tag.get_text())  + "°" if low_tag  else "—"
     high = re.sub(r"[^\d.-]", "", high_tag.get_text()) + "°" if high_tag else "—"
+    return low, high
+
+
+def parse_forecast_weather(body: bytes | str, location: str, day_offset: int) -> str | None:
+    """주간 예보 HTML → day_offset일 뒤 예보 문장 (파싱 프로세스 풀에서 실행)"""
+    items = _soup(body).select(WEEKLY_ITEMS_SELECTOR)
+    if not items or day_offset >= len(items):
+        return None
+
+    li = items[day_offset]
+
+    # 1) 날짜·요일
+    date_tag = li.select_one(".date")
+    date = date_tag.get_text(strip=True).rstrip(".") if date_tag else ""
+
+    # 2) 날씨 설명 / 3) 최저·최고 기온
+    desc = _day_description(li)
+    low, high = _day_temperatures(li)
 
     label = "내일" if day_offset == 1 else "모레"
     return f"{label} ({date}) {location} 날씨는 {desc}, 최저 {low}, 최고 {high}입니다."
 
 
-def get_weekly_weather(location: str) -> str:
-    """
-    이번 주 전체 예보
-    """
-    location = normalize_location_name(location)
-    soup = _get_soup(location)
-    items = soup.select(
-        "div.api_subject_bx._weekly_weather_wrap "
-        "div.list_box._weekly_weather ul li"
-    )
+def parse_weekly_weather(body: bytes | str, location: str) -> str:
+    """주간 예보 HTML → 이번 주 예보 여러 줄 (파싱 프로세스 풀에서 실행)"""
+    items = _soup(body).select(WEEKLY_ITEMS_SELECTOR)
     if not items:
         return f"{location} 이번 주 날씨 정보를 가져올 수 없습니다."
 
@@ -164,43 +193,86 @@ def get_weekly_weather(location: str) -> str:
         day  = day_tag.get_text(strip=True) if day_tag else ""
         date = date_tag.get_text(strip=True).rstrip(".") if date_tag else ""
 
-        # 날씨 설명
-        blinds = li.select("span.blind")
-        if len(blinds) >= 2:
-            desc = blinds[1].get_text(strip=True)
-        else:
-            desc_tag = li.select_one(".weather_desc") or blinds[:1]
-            desc = desc_tag.get_text(strip=True) if desc_tag else "정보 없음"
-
-        # 최저·최고 기온
-        low_tag  = li.select_one("span.lowest")
-        high_tag = li.select_one("span.highest")
-        low  = re.sub(r"[^\d.-]", "", low_tag.get_text())  + "°" if low_tag  else "—"
-        high = re.sub(r"[^\d.-]", "", high_tag.get_text()) + "°" if high_tag else "—"
+        desc = _day_description(li)
+        low, high = _day_temperatures(li)
 
         lines.append(f"{day}({date}): {desc}, {low} ~ {high}")
 
     return "\n".join(lines)
 
 
+def get_forecast_weather(location: str, day_offset: int) -> str | None:
+    """
+    day_offset=1 → 내일, 2 → 모레
+    """
+    location = normalize_location_name(location)
+    return parse_forecast_weather(_get_page(location), location, day_offset)
+
+
+def get_weekly_weather(location: str) -> str:
+    """
+    이번 주 전체 예보
+    """
+    location = normalize_location_name(location)
+    return parse_weekly_weather(_get_page(location), location)
+
+
 def get_monthly_weather(location: str) -> str:
     location = normalize_location_name(location)
     # 아직 구현되지 않은 기능
     return f"{location} 월간 예보 기능은 아직 구현되지 않았습니다."
 
 
-def get_weather(location: str, when: str = "오늘", offset: int = None) -> str:
+def _weather_plan(when: str, offset: int = None) -> tuple[str | None, int]:
+    """when → (조회 종류, 며칠 뒤) - 동기/비동기 get_weather 공통"""
     if when == "오늘":
+        return "current", 0
+    if when in ("내일", "모레", "글피", "n일후"):
+        day_offset = offset if offset is not None else (1 if when=="내일" else 2 if when=="모레" else 3)
+        return "forecast", day_offset
+    if when == "이번주":
+        return "weekly", 0
+    if when == "다음주":
+        return "monthly", 0  # placeholder
+    if when in ("이번달","다음달"):
+        return "monthly", 0
+    return None, 0
+
+
+def get_weather(location: str, when: str = "오늘", offset: int = None) -> str:
+    kind, day_offset = _weather_plan(when, offset)
+    if kind == "current":
         data = get_current_weather(location)
         text = data.get("summary", f"{location}의 날씨 정보를 불러오지 못했습니다.")
-    elif when in ("내일", "모레", "글피", "n일후"):
-        day_offset = offset if offset is not None else (1 if when=="내일" else 2 if when=="모레" else 3)
+    elif kind == "forecast":
         text = get_forecast_weather(location, day_offset)
-    elif when == "이번주":
+    elif kind == "weekly":
         text = get_weekly_weather(location)
-    elif when == "다음주":
-        text = get_monthly_weather(location)  # placeholder
-    elif when in ("이번달","다음달"):
+    elif kind == "monthly":
+        text = get_monthly_weather(location)
+    else:
+        text = None
+
+    return text or f"{when} {location} 날씨 정보를 가져올 수 없습니다."
+
+
+async def get_weather_async(location: str, when: str = "오늘", offset: int = None) -> str:
+    """
+    get_weather의 비동기 버전
+    - 요청은 공유 커넥션 풀로, HTML 파싱은 파싱 프로세스 풀에서 처리
+    """
+    kind, day_offset = _weather_plan(when, offset)
+    if kind == "current":
+        data = await get_current_weather_async(location)
+        text = data.get("summary", f"{location}의 날씨 정보를 불러오지 못했습니다.")
+    elif kind in ("forecast", "weekly"):
+        normalized = normalize_location_name(location)
+        body = await _aget_page(normalized)
+        if kind == "forecast":
+            text = await run_parse(parse_forecast_weather, body, normalized, day_offset)
+        else:
+            text = await run_parse(parse_weekly_weather, body, normalized)
+    elif kind == "monthly":
         text = get_monthly_weather(location)
     else:
         text = None
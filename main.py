@@ -4,13 +4,26 @@ from sqlalchemy.orm import Session
 from fastapi.middleware.cors import CORSMiddleware
 from models import Base, ProcessedText, SummaryNote, OtherUserRecord, NewsHistory  # ✅ NewsHistory 추가
 from database import SessionLocal, engine
-from routers import search_router, stt_router, story_router, otherstory_router, auth_router, weather_router, tts_router
+from routers import search_router, stt_router, story_router, otherstory_router, auth_router, weather_router, tts_router, input_router
 from routers.user_alert_router import router as user_alert_router
 from routers.processing_router import router as processing_router
 from routers.news_history_router import router as news_history_router  
+from routers.metrics_router import router as metrics_router
+from routers.health_router import router as health_router
+
+from crawling.naver_client import open_naver_client, close_naver_client
+from crawling.news_content import close_article_client
+from crawling.parse_pool import start_parse_pool, stop_parse_pool
+from utils.keyword_extractor import warm_up_keyword_extractor
+from utils.keyword_service import stop_keyword_service
+from services.classifier_service import classify_batcher, warm_up_classifier
+from services.tts_service import warm_up_tts_client
+from utils.warmup import warm_up_until_ready
 
 from dotenv import load_dotenv
 import logging
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi.staticfiles import StaticFiles
 
 # 로깅 기본 설정
@@ -23,10 +36,35 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# 앱 수명주기: 공유 HTTP 커넥션 풀 / 파싱 프로세스 풀 생성·정리 + Okt·분류 모델·TTS 워밍업
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_naver_client()
+    # 파싱 프로세스 풀은 forkserver로 띄우므로 부모의 JVM·스레드 상태를 복사하지 않음
+    await asyncio.to_thread(start_parse_pool)
+    # 형태소 분석 워커 기동 + JVM 워밍업, 분류 모델 다운로드/로딩/워밍업, TTS 클라이언트 생성은
+    # 오래 걸리므로 백그라운드에서 진행하고 실패하면 백오프하며 재시도 (완료 여부는 /ready)
+    warmups = [
+        asyncio.create_task(warm_up_until_ready("Okt", warm_up_keyword_extractor)),
+        asyncio.create_task(warm_up_until_ready("의도 분류 모델", warm_up_classifier)),
+        asyncio.create_task(warm_up_until_ready("TTS", warm_up_tts_client)),
+    ]
+    yield
+    # 끝나지 않은 워밍업(다운로드·재시도 대기)은 기다리지 않고 취소
+    for task in warmups:
+        task.cancel()
+    await asyncio.gather(*warmups, return_exceptions=True)
+    await close_naver_client()
+    await close_article_client()
+    await asyncio.to_thread(stop_parse_pool)
+    await asyncio.to_thread(stop_keyword_service)
+    await classify_batcher.close()
+
 app = FastAPI(
     title="Capstone API",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -59,7 +97,10 @@ app.include_router(user_alert_router)
 app.include_router(processing_router)
 app.include_router(weather_router.router)
 app.include_router(tts_router.router)
+app.include_router(input_router.router)
 app.include_router(news_history_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
 
 # ✅ 정적 파일 경로 등록
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -0,0 +1,30 @@
+# routers/health_router.py
+# 준비 상태 확인용 라우터 (오케스트레이터/로드밸런서가 워밍업이 끝난 워커에만 트래픽을 보내도록)
+
+import os
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from services.classifier_service import classifier_ready
+from services.tts_service import tts_client_ready
+from utils.keyword_extractor import keyword_extractor_ready
+
+# 준비 완료로 보기 위해 반드시 로딩되어야 하는 구성 요소 (쉼표 구분)
+READY_COMPONENTS = [
+    c.strip() for c in os.getenv("READY_COMPONENTS", "classifier,okt,tts").split(",") if c.strip()
+]
+
+router = APIRouter(tags=["Health"])
+
+@router.get("/ready")
+def get_ready():
+    """무거운 구성 요소별 로딩 여부 (전부 준비되면 200, 아니면 503)"""
+    components = {
+        "classifier": classifier_ready(),
+        "okt": keyword_extractor_ready(),
+        "tts": tts_client_ready(),
+    }
+    ready = all(components.get(name, False) for name in READY_COMPONENTS)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "components": components, "required": READY_COMPONENTS},
+    )
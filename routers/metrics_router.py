@@ -0,0 +1,26 @@
+# routers/metrics_router.py
+# 성능 지표 확인용 라우터
+
+from fastapi import APIRouter
+from crawling.naver_client import naver_client_stats
+from crawling.news_searcher import search_cache_stats
+from crawling.news_content import article_download_stats
+from crawling.parse_pool import parse_pool_stats
+from utils.keyword_extractor import keyword_cache_stats
+from services.classifier_service import classify_batch_stats, intent_cascade_stats
+from utils.summary_cache import SUMMARY_CACHE
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@router.get("/")
+def get_metrics():
+    return {
+        "naver_http": naver_client_stats(),
+        "naver_search_cache": search_cache_stats(),
+        "article_download": article_download_stats(),
+        "parse_pool": parse_pool_stats(),
+        "keyword_extractor": keyword_cache_stats(),
+        "summary_cache": SUMMARY_CACHE.stats(),
+        "classify_batching": classify_batch_stats(),
+        "intent_cascade": intent_cascade_stats(),
+    }
@@ -4,7 +4,14 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 from database import SessionLocal, engine
 from sqlalchemy.orm import Session
-from models import Base, OtherUserRecord
+from models import Base
+from services.story_repository import (
+    DEFAULT_PROFILE_URL,
+    create_other_user_record as save_other_user_record,
+    list_other_user_records,
+    delete_all_other_user_records as delete_other_user_records,
+    other_user_record_to_dict,
+)
 
 router = APIRouter()
 Base.metadata.create_all(bind=engine)
@@ -27,17 +34,15 @@ class OtherUserRecordCreate(BaseModel):
 
 @router.post("/other-user-records/")
 def create_other_user_record(record: OtherUserRecordCreate, db: Session = Depends(get_db)):
-    db_record = OtherUserRecord(
+    db_record = save_other_user_record(
+        db,
         title=record.title,
         content=record.content,
         author=record.author,
-        profileUrl=record.profileUrl,
-        region=record.region,   
-        topic=record.topic       
+        region=record.region,
+        topic=record.topic,
+        profile_url=record.profileUrl
     )
-    db.add(db_record)
-    db.commit()
-    db.refresh(db_record)
     return {
         "message": "Other user record saved!",
         "record": {
@@ -48,29 +53,17 @@ def create_other_user_record(record: OtherUserRecordCreate, db: Session = Depend
             "author": db_record.author,
             "region": db_record.region,
             "topic": db_record.topic,
-            "profileUrl": db_record.profileUrl or "https://i.pravatar.cc/150?img=1"
+            "profileUrl": db_record.profileUrl or DEFAULT_PROFILE_URL
         }
     }
 
 @router.get("/other-user-records/")
 def get_other_user_records(db: Session = Depends(get_db)):
-    records = db.query(OtherUserRecord).order_by(OtherUserRecord.date.desc()).all()
-    return [
-        {
-            "date": r.date,
-            "title": r.title,
-            "content": r.content,
-            "author": r.author,
-            "region": r.region,
-            "topic": r.topic,
-            "profileUrl": r.profileUrl
-        } for r in records
-    ]
+    return [other_user_record_to_dict(r) for r in list_other_user_records(db)]
 
 @router.delete("/other-user-records/")
 def delete_all_other_user_records(db: Session = Depends(get_db)):
-    deleted_count = db.query(OtherUserRecord).delete()
-    db.commit()
+    deleted_count = delete_other_user_records(db)
     return {
         "message": f"모든 기록이 삭제되었습니다.",
         "deleted_count": deleted_count
@@ -4,16 +4,19 @@
 import os
 import uuid
 import re
-import httpx
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from sqlalchemy.orm import Session
 import time
 from utils.stt_processor import transcribe_audio_from_url
 from database import SessionLocal
-from routers.search_router import search_news_urls, UserRequest
-from crawling.weather_fetcher import get_weather, normalize_location_name
+from fastapi.responses import StreamingResponse
+from routers.search_router import search_news_urls, UserRequest, news_events, format_sse, SSE_HEADERS
+from crawling.weather_fetcher import get_weather_async, normalize_location_name
+from utils.gazetteer import resolve_location
 from crawling.news_searcher import expand_location
 from utils.story_handler import handle_story_interaction
+from services.classifier_service import classify_intent
+from services.tts_service import get_tts_audio_url
 
 
 router = APIRouter(prefix="/process", tags=["Audio Processing"])
@@ -28,30 +31,8 @@ def get_db():
     finally:
         db.close()
 
-async def classify_with_model(text: str) -> str:
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post("http://localhost:8000/classify", json={"text": text})
-            if response.status_code == 200:
-                data = response.json()
-                label = data.get("label", "")
-                confidence = data.get("confidence", 0)
-                if label in ["이야기", "뉴스", "날씨"] and confidence > 0.5:
-                    return {"이야기": "story", "뉴스": "news", "날씨": "weather"}[label]
-        except Exception as e:
-            print(f"❌ 입력 분류 API 실패: {e}")
-    return "invalid"
-
-
-@router.post("/audio/")
-async def process_audio(
-    file: UploadFile = File(...),
-    session_state: str = Form("initial"),
-    username: str | None = Form(None)
-):
-    start_total = time.time()
-    print("🟢 [전체 시작]")
-
+async def _save_and_transcribe(file: UploadFile) -> str:
+    """업로드 파일 저장 → STT → 텍스트"""
     # 1. 파일 저장
     start = time.time()
     filename = f"{uuid.uuid4().hex}.wav"
@@ -74,27 +55,67 @@ async def process_audio(
     except Exception as e:
         raise HTTPException(500, f"STT 실패: {e}")
     print(f"🗣️ [STT 완료] 텍스트: {text[:20]}... / 시간: {time.time() - start:.2f}s")
+    return text
+
+
+def _invalid_response(text: str, session_state: str) -> dict:
+    if session_state == "invalid_repeat":
+        return {
+            "type": "invalid",
+            "transcribed_text": text,
+            "response": "못 알아듣겠어요.",
+            "next_state": "initial"
+        }
+    return {
+        "type": "invalid",
+        "transcribed_text": text,
+        "response": "알아듣지 못했어요. 다시 말해줄래요?",
+        "next_state": "invalid_repeat"
+    }
+
+
+def _combined_summary(result: dict | None) -> str:
+    """뉴스 결과 → TTS로 읽을 통합 요약 (ok=False 면 combined_summary 가 실패 안내 문구 → ValueError)"""
+    if not result or not result.get("ok"):
+        raise ValueError("통합 요약이 유효하지 않습니다.")
+    combined = result.get("combined_summary", "")
+    if not isinstance(combined, str) or not combined.strip():
+        raise ValueError("통합 요약이 비어 있습니다.")
+    return combined
+
+
+@router.post("/audio/")
+async def process_audio(
+    file: UploadFile = File(...),
+    session_state: str = Form("initial"),
+    username: str | None = Form(None)
+):
+    start_total = time.time()
+    print("🟢 [전체 시작]")
+
+    # 1~2. 파일 저장 + STT
+    text = await _save_and_transcribe(file)
 
 
     # 3. 분류 (story / news / weather)
     start = time.time()
-    input_type = await classify_with_model(text)
+    input_type = await classify_intent(text)  # 규칙 → 캐시 → 모델
     print(f"📦 [입력 분류] → {input_type} / 시간: {time.time() - start:.2f}s")
 
     if input_type not in ["story", "news", "weather"]:
-        if session_state == "invalid_repeat":
-            return {
-                "type": "invalid",
-                "transcribed_text": text,
-                "response": "못 알아듣겠어요.",
-                "next_state": "initial"
-            }
-        return {
-            "type": "invalid",
-            "transcribed_text": text,
-            "response": "알아듣지 못했어요. 다시 말해줄래요?",
-            "next_state": "invalid_repeat"
-        }
+        return _invalid_response(text, session_state)
+
+    return await _respond_by_type(input_type, text, session_state, username, start_total)
+
+
+async def _respond_by_type(
+    input_type: str,
+    text: str,
+    session_state: str,
+    username: str | None,
+    start_total: float
+):
+    start = time.time()
 
     # 4. 분기 처리
     if input_type == "story":
@@ -106,11 +127,13 @@ async def process_audio(
 
     if input_type == "weather":
         try:
-            # 1. 지역 추출
-            location_parts = expand_location(text)
-            full_location = " ".join(reversed(location_parts[:-1])) if len(location_parts) > 1 else "대한민국"
-            full_location = normalize_location_name(full_location)
-            full_location = clean_location_name(full_location)
+            # 1. 지역 추출 (지명 사전으로 문장 속 지명 → 전체 행정 경로, 못 찾으면 기존 방식)
+            full_location = resolve_location(text)
+            if full_location is None:
+                location_parts = expand_location(text)
+                full_location = " ".join(reversed(location_parts[:-1])) if len(location_parts) > 1 else "대한민국"
+                full_location = normalize_location_name(full_location)
+                full_location = clean_location_name(full_location)
             print(f"🧭 날씨 지역 추출 결과: {full_location}")
 
             # 2. 시점 추론
@@ -130,7 +153,7 @@ async def process_audio(
                 when = "다음달"
 
             # 3. 요약 문자열 얻기
-            summary_text = get_weather(full_location, when=when)
+            summary_text = await get_weather_async(full_location, when=when)
         except Exception as e:
             raise HTTPException(500, f"날씨 정보 수집 실패: {e}")
 
@@ -154,9 +177,7 @@ async def process_audio(
         print(f"📰 [뉴스 검색/요약 완료] / 시간: {time.time() - start:.2f}s")
         start = time.time()
         try:
-            combined = result.get("combined_summary", "")
-            if not isinstance(combined, str) or "요약 실패" in combined:
-                raise ValueError("통합 요약이 유효하지 않습니다.")
+            combined = _combined_summary(result)
         except Exception as e:
             raise HTTPException(500, f"뉴스 요약 텍스트 추출 실패: {e}")
 
@@ -175,13 +196,68 @@ async def process_audio(
         }
 
 
-async def get_tts_audio_url(text: str) -> str:
-    async with httpx.AsyncClient() as client:
-        response = await client.post("http://localhost:8000/tts/synthesize", json={"text": text})
-        if response.status_code != 200:
-            raise Exception(f"TTS 요청 실패: {response.text}")
-        return response.json()["file_url"]
-    
+@router.post("/audio/stream")
+async def process_audio_stream(
+    file: UploadFile = File(...),
+    session_state: str = Form("initial"),
+    username: str | None = Form(None)
+):
+    """
+    /process/audio/ 의 스트리밍 버전 (text/event-stream)
+    - 뉴스: 검색/기사 수집/기사별 요약 진행 이벤트 + 통합 이야기 토큰 → 마지막에 TTS 포함 done
+    - 그 외(날씨/이야기/invalid): 기존 응답을 done 이벤트 하나로 전송
+    """
+    start_total = time.time()
+    text = await _save_and_transcribe(file)
+    input_type = await classify_intent(text)  # 규칙 → 캐시 → 모델
+    print(f"📦 [입력 분류] → {input_type}")
+
+    if input_type != "news":
+        if input_type not in ["story", "weather"]:
+            result = _invalid_response(text, session_state)
+        else:
+            result = await _respond_by_type(input_type, text, session_state, username, start_total)
+
+        async def _single():
+            yield format_sse("transcribed", {"text": text, "type": input_type})
+            yield format_sse("done", result)
+
+        return StreamingResponse(_single(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    async def _news_stream():
+        yield format_sse("transcribed", {"text": text, "type": "news"})
+        try:
+            result = None
+            async for event, data in news_events(text):
+                if event == "done":
+                    result = data
+                    break
+                yield format_sse(event, data)
+
+            try:
+                combined = _combined_summary(result)
+            except ValueError as e:
+                # 비스트리밍 경로와 같은 기준: 요약 실패 문구는 TTS로 읽지 않고 error 이벤트로 종료
+                print(f"❗ 뉴스 요약 텍스트 추출 실패: {e}")
+                yield format_sse("error", {"message": f"뉴스 요약 텍스트 추출 실패: {e}"})
+                return
+
+            tts_url = await get_tts_audio_url(combined) if combined else None
+            print(f"✅ [스트리밍 처리 완료] / 총 시간: {time.time() - start_total:.2f}s")
+            yield format_sse("done", {
+                "type": "news",
+                "transcribed_text": text,
+                "result": result,
+                "response_text": combined,
+                "response_audio_url": tts_url,
+                "next_state": "initial"
+            })
+        except Exception as e:
+            print(f"❗ 뉴스 스트리밍 실패: {e}")
+            yield format_sse("error", {"message": f"뉴스 처리 실패: {e}"})
+
+    return StreamingResponse(_news_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
 
 def clean_location_name(text: str) -> str:
     """
@@ -3,20 +3,38 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
 from crawling.news_searcher import search_news_by_keywords
-from crawling.news_content import get_article_content
-from utils.keyword_extractor import extract_keyword_from_text
+from crawling.news_content import fetch_article_content, fetch_articles, fetch_first_articles, is_article_error
+from utils.keyword_extractor import extract_keyword_from_text_async
 from utils.text_processor import summarize_article_pipeline, combine_summaries_into_story
 from crawling.weather_fetcher import get_weather
 from utils.time_parser import parse_korean_time_expr
-from crawling.rank_news import fetch_naver_trending_news
+from crawling.rank_news import fetch_naver_trending_news_async
 import asyncio
-from utils.news_processor import MASSaC
+import json
+from fastapi.responses import StreamingResponse
+from utils.news_processor import MASSaC, MASSaC_stream, ARTICLE_SUMMARY_FAILED_MESSAGE
+from utils.near_duplicate import NearDuplicateFilter
+from utils.article_ranker import rank_articles
 
 router = APIRouter()
 
+# BM25로 순위를 매길 후보 기사 수 (모든 키워드 검색 결과를 합쳐서)
+MAX_CANDIDATES = 10
+
+# 프록시(nginx 등)가 스트림을 버퍼링하지 않도록
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 class UserRequest(BaseModel):
     request_text: str
 
+
+def article_summaries(articles: list) -> list[dict]:
+    """MASSaC 의 기사별 결과 [(url, 요약 | None), ...] → 응답용 [{"url", "summary"}, ...] (입력 기사 순서 그대로)"""
+    return [
+        {"url": url, "summary": summary if summary is not None else ARTICLE_SUMMARY_FAILED_MESSAGE}
+        for url, summary in articles
+    ]
+
 def relevance_score(content: str, keyword: str) -> int:
     """
     키워드 토큰이 본문에 등장할 때마다 +1
@@ -45,9 +63,9 @@ async def get_top3_summarized_articles(result_dict: dict, user_query: str) -> li
 
     summaries = []
 
-    for url in urls:
-        content = get_article_content(url)
-        if not content or "에러 발생" in content:
+    contents = await asyncio.gather(*(fetch_article_content(url) for url in urls))
+    for url, content in zip(urls, contents):
+        if is_article_error(content):
             continue
         if relevance_score(content, first_keyword) == 0:
             continue
@@ -61,72 +79,186 @@ async def get_top3_summarized_articles(result_dict: dict, user_query: str) -> li
     return summaries
 
 
+TRENDING_INTRO = "오늘 많이 본 뉴스를 요약해서 알려드릴게요.\n"
+
+
+def is_trending_request(keywords: list[str]) -> bool:
+    """'오늘', '인기' 키워드가 있으면 인기 뉴스 요청으로 처리"""
+    return bool(set(keywords) & {"오늘", "인기"})
+
+
+async def search_candidate_urls(keywords: list[str]) -> list[str]:
+    """
+    후보 기사 URL
+    - 인기 뉴스: 많이 본 뉴스 상위 6개
+    - 일반 뉴스: 모든 키워드 검색 결과를 번갈아 합쳐 최대 MAX_CANDIDATES개 (중복 URL 제거)
+    """
+    if is_trending_request(keywords):
+        raw_articles = await fetch_naver_trending_news_async(6)
+        return [article["url"] for article in raw_articles]
+    news_results = await search_news_by_keywords(keywords)
+
+    urls: list[str] = []
+    link_lists = list(news_results.values())
+    for rank in range(max((len(links) for links in link_lists), default=0)):
+        for links in link_lists:
+            if rank < len(links) and links[rank] not in urls:
+                urls.append(links[rank])
+    return urls[:MAX_CANDIDATES]
+
+
+async def fetch_candidate_articles(keywords: list[str], urls: list[str]) -> list[tuple[str, str]]:
+    """
+    후보 중 최대 3개 기사 원문
+    - 일반 뉴스: 후보 전체를 받아 모든 키워드로 BM25 점수화 → 상위 기사부터 선택
+    - 여러 언론사가 같은 통신사 기사를 실은 경우 한 건만 남기고 다른 기사로 채움
+    """
+    seen = NearDuplicateFilter()
+
+    if is_trending_request(keywords):
+        def accept(content: str) -> bool:
+            if not seen.add(content):
+                print("🪞 중복 기사 제외")
+                return False
+            return True
+
+        return await fetch_first_articles(urls, limit=3, accept=accept)
+
+    fetched = await fetch_articles(urls)
+    picked: list[tuple[str, str]] = []
+    for url, content, score in rank_articles(fetched, keywords):
+        if not seen.add(content):
+            print(f"🪞 중복 기사 제외: {url}")
+            continue
+        print(f"📈 BM25 {score:.2f}: {url}")
+        picked.append((url, content))
+        if len(picked) >= 3:
+            break
+    return picked
+
+
 @router.post("/search-news-urls/")
 async def search_news_urls(user_request: UserRequest):
     text = user_request.request_text
-    keywords = extract_keyword_from_text(text)
+    keywords = await extract_keyword_from_text_async(text)
 
     # 인기 뉴스 조건이면 일반 뉴스는 무시
-    if set(keywords) & {"오늘", "인기"}:
+    if is_trending_request(keywords):
         # 1) 상위 6개 중 최대 3개 기사 원문 가져오기
-        raw_articles = fetch_naver_trending_news(limit=6)
-        url_text_pairs: list[tuple[str,str]] = []
-        for article in raw_articles:
-            if len(url_text_pairs) >= 3:
-                break
-            content = get_article_content(article["url"])
-            if content:
-                url_text_pairs.append((article["url"], content))
+        urls = await search_candidate_urls(keywords)
+        url_text_pairs = await fetch_candidate_articles(keywords, urls)
 
         # 2) 요약+쉬운말+통합 (MASSaC)
         if not url_text_pairs:
             return {
+                "ok": False,
                 "keywords": keywords,
                 "summaries": [{"url": "", "summary": "인기 뉴스 요약에 실패했습니다."}],
                 "combined_summary": "인기 뉴스 요약에 실패했습니다."
             }
         proc = await MASSaC(url_text_pairs)
-        summaries = [
-            {"url": url, "summary": summary}
-            for (url, _), summary in zip(url_text_pairs, proc["summaries"])
-        ]
         return {
+            "ok": proc["ok"],
             "keywords": keywords,
             "Detailed articles": [{"url": url} for url, _ in url_text_pairs],
-            "summaries": summaries,
-            "combined_summary": "오늘 많이 본 뉴스를 요약해서 알려드릴게요.\n" + proc["combined"]
+            "summaries": article_summaries(proc["articles"]),
+            "combined_summary": TRENDING_INTRO + proc["combined"]
         }
 
 
     # 일반 뉴스 키워드 처리
-    news_results = await search_news_by_keywords(keywords)
-    # 1) 상위 6개 중 relevance 체크하여 최대 3개 기사 원문 가져오기
-    first_kw = keywords[0] if keywords else ""
-    urls = news_results.get(first_kw, [])[:6]
-    url_text_pairs = []
-    from routers.search_router import relevance_score
-    for url in urls:
-        if len(url_text_pairs) >= 3:
-            break
-        content = get_article_content(url)
-        if not content or relevance_score(content, first_kw) == 0:
-            continue
-        url_text_pairs.append((url, content))
+    # 1) 모든 키워드 검색 결과에서 후보 최대 MAX_CANDIDATES개 → BM25 순위로 최대 3개 기사 원문 가져오기
+    urls = await search_candidate_urls(keywords)
+    url_text_pairs = await fetch_candidate_articles(keywords, urls)
 
     # 2) 요약+쉬운말+통합 (MASSaC)
     if not url_text_pairs:
         return {
+            "ok": False,
             "keywords": keywords,
             "summaries": [{"url": "", "summary": "관련된 기사를 요약할 수 없습니다."}],
             "combined_summary": "관련된 기사를 요약할 수 없습니다."
         }
     proc = await MASSaC(url_text_pairs)
-    summaries = [
-        {"url": url, "summary": summary}
-        for (url, _), summary in zip(url_text_pairs, proc["summaries"])
-    ]
     return {
+        "ok": proc["ok"],
         "keywords": keywords,
-        "summaries": summaries,
+        "summaries": article_summaries(proc["articles"]),
         "combined_summary": proc["combined"]
-    }
\ No newline at end of file
+    }
+
+
+# ────────────────────────────────────────
+# 스트리밍 응답 (Server-Sent Events)
+# ────────────────────────────────────────
+def format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def news_events(text: str):
+    """
+    뉴스 처리 진행 상황을 (이벤트 이름, 데이터) 로 차례로 yield
+    keywords → search_done → articles_fetched → summary(기사별) → token(통합 이야기) → done
+    done 데이터는 /search-news-urls/ 응답과 같은 형태 (ok=False 이면 combined_summary 는 실패 안내 문구)
+    """
+    keywords = await extract_keyword_from_text_async(text)
+    trending = is_trending_request(keywords)
+    yield "keywords", {"keywords": keywords, "trending": trending}
+
+    urls = await search_candidate_urls(keywords)
+    yield "search_done", {"candidates": len(urls)}
+
+    url_text_pairs = await fetch_candidate_articles(keywords, urls)
+    yield "articles_fetched", {"urls": [url for url, _ in url_text_pairs]}
+
+    if not url_text_pairs:
+        message = "인기 뉴스 요약에 실패했습니다." if trending else "관련된 기사를 요약할 수 없습니다."
+        yield "done", {
+            "ok": False,
+            "keywords": keywords,
+            "summaries": [{"url": "", "summary": message}],
+            "combined_summary": message
+        }
+        return
+
+    if trending:
+        yield "token", {"text": TRENDING_INTRO}
+
+    async for event, data in MASSaC_stream(url_text_pairs):
+        if event == "summary":
+            yield "summary", {**data, "url": url_text_pairs[data["index"]][0]}
+        elif event == "done":
+            result = {
+                "ok": data["ok"],
+                "keywords": keywords,
+                "summaries": article_summaries(data["articles"]),
+                "combined_summary": (TRENDING_INTRO if trending else "") + data["combined"],
+                "timings": data["timings"]
+            }
+            if trending:
+                result["Detailed articles"] = [{"url": url} for url, _ in url_text_pairs]
+            yield "done", result
+        else:
+            yield event, data
+
+
+async def _news_sse(text: str):
+    try:
+        async for event, data in news_events(text):
+            yield format_sse(event, data)
+    except Exception as e:
+        print(f"❗ 뉴스 스트리밍 실패: {e}")
+        yield format_sse("error", {"message": f"뉴스 처리 실패: {e}"})
+
+
+@router.post("/search-news-urls/stream")
+async def search_news_urls_stream(user_request: UserRequest):
+    """
+    /search-news-urls/ 의 스트리밍 버전 (text/event-stream)
+    진행 이벤트와 통합 이야기 토큰을 생성되는 대로 전송
+    """
+    return StreamingResponse(
+        _news_sse(user_request.request_text),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
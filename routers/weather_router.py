@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Query
 from crawling.news_searcher import expand_location  
 from crawling.weather_fetcher import get_weather, get_current_weather
+from utils.gazetteer import resolve_location
 from fastapi.responses import JSONResponse
 
 router = APIRouter(prefix="/weather", tags=["Weather"])
@@ -10,9 +11,11 @@ router = APIRouter(prefix="/weather", tags=["Weather"])
 @router.get("/")
 def fetch_weather(text: str = Query(...), when: str = "오늘"):
     print(f"📥 받은 text = {text}")
-    location_parts = expand_location(text)
-    print(f"🧩 확장된 location_parts = {location_parts}")
-    full_location = " ".join(reversed(location_parts[:-1]))  # '대한민국' 제외
+    full_location = resolve_location(text)
+    if full_location is None:
+        location_parts = expand_location(text)
+        print(f"🧩 확장된 location_parts = {location_parts}")
+        full_location = " ".join(reversed(location_parts[:-1]))  # '대한민국' 제외
     print(f"🧭 최종 full_location = {full_location}")
 
     if when == "오늘":
@@ -0,0 +1,190 @@
+# 의도 분류 서비스 (라우터/음성 처리에서 같은 프로세스 안에서 직접 호출)
+# services/classifier_service.py
+#
+# /classify 엔드포인트와 process_audio 가 모두 이 모듈을 거침
+# → 자기 서버로 HTTP 요청을 다시 보내지 않고, 동시에 들어온 요청은 마이크로 배처가 한 번에 추론
+
+import os
+import re
+import time
+import threading
+import unicodedata
+import requests
+from cachetools import LRUCache
+from utils.micro_batcher import MicroBatcher
+from utils.input_classifier import classify_confident
+from utils.intent_model import MODEL_DIR, load_intent_classifier, result_to_type
+
+# 마이크로 배칭 설정: 최대 배치 크기 / 첫 요청 후 최대 대기(ms) / 대기열 한도
+CLASSIFY_MAX_BATCH_SIZE = int(os.getenv("CLASSIFY_MAX_BATCH_SIZE", "16"))
+CLASSIFY_MAX_WAIT_MS = float(os.getenv("CLASSIFY_MAX_WAIT_MS", "5"))
+CLASSIFY_MAX_QUEUE = int(os.getenv("CLASSIFY_MAX_QUEUE", "256"))
+
+# 모델 분류 결과 캐시 크기 (정규화한 문장 → 처리 유형)
+INTENT_CACHE_SIZE = int(os.getenv("INTENT_CACHE_SIZE", "4096"))
+
+# 모델 다운로드 제한 시간(초): 연결 / 청크 사이 대기 (멈춘 다운로드가 워밍업 재시도를 막지 않도록)
+MODEL_DOWNLOAD_CONNECT_TIMEOUT = float(os.getenv("MODEL_DOWNLOAD_CONNECT_TIMEOUT", "10"))
+MODEL_DOWNLOAD_READ_TIMEOUT = float(os.getenv("MODEL_DOWNLOAD_READ_TIMEOUT", "60"))
+
+# 모델 경로
+model_dir = MODEL_DIR
+model_file = model_dir / "model.safetensors"
+
+# Google Drive 다운로드 URL
+GDRIVE_MODEL_URL = "https://drive.google.com/uc?export=download&id=1h-x9OPeJA3Oexg_KIsNhn12NA-Cu0KQL"
+
+# 모델이 없을 때만 다운로드
+def download_model_if_needed():
+    if model_file.exists():
+        print("✅ 모델 파일이 이미 존재합니다. 다운로드 생략.")
+        return
+    print("📥 모델 파일이 존재하지 않아 다운로드합니다...")
+    os.makedirs(model_dir, exist_ok=True)
+    response = requests.get(
+        GDRIVE_MODEL_URL,
+        stream=True,
+        timeout=(MODEL_DOWNLOAD_CONNECT_TIMEOUT, MODEL_DOWNLOAD_READ_TIMEOUT)
+    )
+    if response.status_code == 200:
+        # 임시 파일에 받은 뒤 이름 변경 (중간에 끊겨도 잘린 파일이 "이미 존재"로 남지 않도록)
+        part_file = model_file.with_suffix(".part")
+        with response, open(part_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+        os.replace(part_file, model_file)
+        print("✅ 모델 다운로드 완료.")
+    else:
+        raise RuntimeError(f"❌ 모델 다운로드 실패. 응답 코드: {response.status_code}")
+
+# 워밍업용 더미 배치 (길이가 다른 문장 → 패딩/어텐션 마스크 경로까지 한 번 실행)
+WARMUP_TEXTS = [
+    "오늘 날씨 어때",
+    "요즘 경제 뉴스 좀 알려줘",
+    "내가 어제 시장에서 있었던 재밌는 이야기 하나 해줄게",
+]
+
+# 모델은 import 시점이 아니라 앱 시작 후 백그라운드 스레드(load_classifier)에서 로딩
+classifier = None
+_classifier_lock = threading.Lock()
+
+
+def load_classifier():
+    """
+    모델 다운로드(없을 때만) + 로딩(CLASSIFIER_BACKEND=torch | onnx) + 더미 배치 워밍업
+    - 수 초~수십 초 걸리므로 앱 수명주기에서 스레드로 호출 (완료 여부는 /ready)
+    - 로딩 전에 모델이 필요한 요청이 오면 그 요청이 로딩을 기다림
+    """
+    global classifier
+    if classifier is None:
+        with _classifier_lock:
+            if classifier is None:
+                start = time.time()
+                download_model_if_needed()
+                loaded = load_intent_classifier()
+                loaded.predict_batch(WARMUP_TEXTS)
+                classifier = loaded
+                print(f"🧠 의도 분류 모델 준비 완료 ({classifier.backend}, {time.time() - start:.1f}s)")
+    return classifier
+
+
+def warm_up_classifier() -> bool:
+    """앱 시작 시 백그라운드에서 호출 (실패해도 서버는 뜨고, False → utils/warmup 이 다시 시도)"""
+    try:
+        load_classifier()
+    except Exception as e:
+        print(f"❌ 의도 분류 모델 로딩 실패: {e}")
+        return False
+    return True
+
+
+def classifier_ready() -> bool:
+    return classifier is not None
+
+
+def _predict_batch(texts: list[str]) -> list[dict]:
+    return load_classifier().predict_batch(texts)
+
+
+# 동시에 들어온 분류 요청을 모아 한 번의 forward로 처리
+classify_batcher = MicroBatcher(
+    _predict_batch,
+    max_batch_size=CLASSIFY_MAX_BATCH_SIZE,
+    max_wait_ms=CLASSIFY_MAX_WAIT_MS,
+    max_queue=CLASSIFY_MAX_QUEUE,
+    name="classify",
+)
+
+
+async def classify(text: str) -> dict:
+    """문장 → {"label": "날씨"|"뉴스"|"이야기", "confidence": float} (대기열이 가득 차면 BatcherQueueFull)"""
+    return await classify_batcher.submit(text)
+
+
+async def classify_with_model(text: str) -> str:
+    """모델만으로 문장 → 처리 유형 ("story" | "news" | "weather" | "invalid")"""
+    return result_to_type(await classify(text))
+
+
+# 분류 캐스케이드: 규칙(빠른 경로) → 캐시 → 모델
+_intent_cache: LRUCache = LRUCache(maxsize=INTENT_CACHE_SIZE)
+
+_cascade_stats = {
+    "requests": 0,
+    "rules": 0,         # 규칙으로 바로 결정
+    "cache": 0,         # 이전 모델 결과 재사용
+    "model": 0,         # 모델 추론
+    "model_errors": 0,  # 모델 실패 → invalid
+}
+
+
+def intent_cache_key(text: str) -> str:
+    """캐시 키: NFC 정규화 + 소문자 + 문장부호 제거 + 공백 정리 ("날씨 어때?" == "날씨 어때")"""
+    text = unicodedata.normalize("NFC", text).lower()
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+
+async def classify_intent(text: str) -> str:
+    """
+    문장 → 처리 유형 ("story" | "news" | "weather" | "invalid")
+    1) 의도가 분명한 키워드 규칙 (utils/input_classifier.classify_confident)
+    2) 같은 문장에 대한 이전 모델 결과 (LRU)
+    3) ELECTRA 모델 (마이크로 배칭)
+    """
+    _cascade_stats["requests"] += 1
+
+    intent = classify_confident(text)
+    if intent is not None:
+        _cascade_stats["rules"] += 1
+        return intent
+
+    key = intent_cache_key(text)
+    intent = _intent_cache.get(key)
+    if intent is not None:
+        _cascade_stats["cache"] += 1
+        return intent
+
+    _cascade_stats["model"] += 1
+    try:
+        intent = await classify_with_model(text)
+    except Exception as e:
+        _cascade_stats["model_errors"] += 1
+        print(f"❌ 입력 분류 실패: {e}")
+        return "invalid"
+    _intent_cache[key] = intent
+    return intent
+
+
+def intent_cascade_stats() -> dict:
+    requests_ = _cascade_stats["requests"]
+    rates = {
+        f"{tier}_rate": round(_cascade_stats[tier] / requests_, 4) if requests_ else 0.0
+        for tier in ("rules", "cache", "model")
+    }
+    return {**_cascade_stats, **rates, "cache_size": len(_intent_cache), "cache_maxsize": INTENT_CACHE_SIZE}
+
+
+def classify_batch_stats() -> dict:
+    return classify_batcher.stats()
+
@@ -0,0 +1,103 @@
+# 이야기(요약 노트 / 타 사용자 기록) 저장소
+# services/story_repository.py
+#
+# /other-user-records/ 엔드포인트와 이야기 대화(story_handler)가 같은 DB 함수를 직접 사용
+# (async 처리 중에는 *_async 버전으로 스레드에서 실행해 이벤트 루프를 막지 않음)
+
+import asyncio
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from models import SummaryNote, OtherUserRecord
+
+DEFAULT_PROFILE_URL = "https://i.pravatar.cc/150?img=1"
+
+
+def other_user_record_to_dict(r: OtherUserRecord) -> dict:
+    return {
+        "date": r.date,
+        "title": r.title,
+        "content": r.content,
+        "author": r.author,
+        "region": r.region,
+        "topic": r.topic,
+        "profileUrl": r.profileUrl
+    }
+
+
+def create_other_user_record(
+    db: Session,
+    title: str,
+    content: str,
+    author: str,
+    region: str | None = None,
+    topic: str | None = None,
+    profile_url: str | None = None
+) -> OtherUserRecord:
+    db_record = OtherUserRecord(
+        title=title,
+        content=content,
+        author=author,
+        profileUrl=profile_url,
+        region=region,
+        topic=topic
+    )
+    db.add(db_record)
+    db.commit()
+    db.refresh(db_record)
+    return db_record
+
+
+def list_other_user_records(db: Session) -> list[OtherUserRecord]:
+    return db.query(OtherUserRecord).order_by(OtherUserRecord.date.desc()).all()
+
+
+def delete_all_other_user_records(db: Session) -> int:
+    deleted_count = db.query(OtherUserRecord).delete()
+    db.commit()
+    return deleted_count
+
+
+def random_other_user_record(db: Session) -> OtherUserRecord | None:
+    """전체 기록을 불러오지 않고 DB에서 하나만 무작위로 고름"""
+    return db.query(OtherUserRecord).order_by(func.random()).first()
+
+
+def save_user_story(db: Session, username: str, title: str, content: str, region: str, topic: str):
+    """사용자 이야기를 요약 노트 + 타 사용자 기록에 한 번에 저장"""
+    db.add(SummaryNote(
+        sum_title=title,
+        content=content,
+        username=username,
+        region=region,
+        topic=topic
+    ))
+    db.add(OtherUserRecord(
+        title=title,
+        content=content,
+        author=username,
+        region=region,
+        topic=topic
+    ))
+    db.commit()
+
+
+def _with_session(fn, *args):
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def _random_other_user_story(db: Session) -> dict | None:
+    record = random_other_user_record(db)
+    return other_user_record_to_dict(record) if record else None
+
+
+async def random_other_user_story_async() -> dict | None:
+    return await asyncio.to_thread(_with_session, _random_other_user_story)
+
+
+async def save_user_story_async(username: str, title: str, content: str, region: str, topic: str):
+    await asyncio.to_thread(_with_session, save_user_story, username, title, content, region, topic)
@@ -0,0 +1,106 @@
+# 음성 합성(TTS) 서비스
+# services/tts_service.py
+#
+# - Google TTS 클라이언트(gRPC 채널)는 요청마다 새로 만들지 않고 하나를 재사용
+# - synthesize_speech는 블로킹 호출이라 스레드에서 실행 (이벤트 루프를 막지 않도록)
+# - /tts/synthesize 와 음성 처리(process_audio, 이야기 응답)가 같은 함수를 직접 호출
+
+import os
+import asyncio
+import threading
+from datetime import datetime
+from google.cloud import texttospeech
+from dotenv import load_dotenv
+load_dotenv()
+
+OUTPUT_DIR = "./static/tts"
+VOICE_NAME = "ko-KR-Standard-A"
+MAX_TTS_LENGTH = 5000
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+_client: texttospeech.TextToSpeechClient | None = None
+_client_lock = threading.Lock()
+
+
+class TTSError(Exception):
+    """음성 합성/저장 실패"""
+
+
+def get_tts_client() -> texttospeech.TextToSpeechClient:
+    """TTS 클라이언트를 처음 쓸 때 한 번만 생성 (인증 + 채널 연결 비용)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = texttospeech.TextToSpeechClient()
+    return _client
+
+
+def warm_up_tts_client() -> bool:
+    """앱 시작 시 백그라운드에서 호출: 인증 + 채널 생성 (실패하면 False → utils/warmup 이 다시 시도)"""
+    try:
+        get_tts_client()
+    except Exception as e:
+        print(f"❌ TTS 클라이언트 생성 실패: {e}")
+        return False
+    print("🔊 TTS 클라이언트 준비 완료")
+    return True
+
+
+def tts_client_ready() -> bool:
+    return _client is not None
+
+
+def _synthesize_to_file(text: str, voice: str | None) -> str:
+    safe_text = text[:MAX_TTS_LENGTH]
+    print(f"📝 [TTS 요청 텍스트] {safe_text[:300]}...")
+
+    synthesis_input = texttospeech.SynthesisInput(text=safe_text)
+
+    voice_config = texttospeech.VoiceSelectionParams(
+        language_code="ko-KR",
+        name=voice or VOICE_NAME,
+        ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
+    )
+
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=texttospeech.AudioEncoding.LINEAR16
+    )
+
+    response = get_tts_client().synthesize_speech(
+        input=synthesis_input,
+        voice=voice_config,
+        audio_config=audio_config
+    )
+
+    if len(response.audio_content) < 500:
+        raise TTSError("TTS 응답이 너무 짧습니다.")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    filename = f"tts_{timestamp}.wav"
+    file_path = os.path.join(OUTPUT_DIR, filename)
+
+    with open(file_path, "wb") as out:
+        out.write(response.audio_content)
+
+    if not os.path.exists(file_path) or os.path.getsize(file_path) < 1000:
+        raise TTSError("TTS 파일 저장 실패 또는 파일이 너무 작습니다.")
+
+    return f"/static/tts/{filename}"
+
+
+async def synthesize(text: str, voice: str | None = None) -> str:
+    """텍스트 → 저장된 음성 파일 URL (/static/tts/...)"""
+    if not text.strip():
+        raise ValueError("텍스트가 비어 있습니다.")
+    try:
+        return await asyncio.to_thread(_synthesize_to_file, text, voice)
+    except TTSError:
+        raise
+    except Exception as e:
+        raise TTSError(f"TTS 처리 실패: {e}") from e
+
+
+async def get_tts_audio_url(text: str) -> str:
+    """기존 호출부 호환용 이름 (실패 시 예외)"""
+    return await synthesize(text)
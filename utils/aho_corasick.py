@@ -0,0 +1,114 @@
+# 여러 키워드를 한 번에 찾는 Aho–Corasick 자동자
+# utils/aho_corasick.py
+#
+# 키워드 목록마다 `kw in text`를 반복하는 대신, 전체 키워드로 자동자를 한 번 만들어 두고
+# 텍스트를 한 번만 훑어 모든 출현 위치를 찾음
+
+from collections import deque
+from typing import Hashable, Iterable, Iterator
+
+
+class AhoCorasick:
+    """
+    사용법
+        matcher = AhoCorasick()
+        matcher.add("미세먼지", "environment")
+        matcher.build()
+        for start, end, word, payloads in matcher.iter_matches(text): ...
+    - 같은 단어를 여러 번 add하면 payload가 모두 모임 (여러 카테고리에 속하는 단어)
+    - 겹치는 출현도 모두 보고함 (예: '초미세먼지' 안의 '미세먼지')
+    """
+
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 상태별로 끝나는 단어들: [(단어, payload 집합), ...] (실패 링크 쪽 출력까지 합쳐 둠)
+        self._out: list[list[tuple[str, frozenset]]] = [[]]
+        # 상태별 payload 합집합 (payloads_in 빠른 경로용)
+        self._state_payloads: list[frozenset] = [frozenset()]
+        self._payloads: dict[str, set] = {}
+        self._alphabet: set[str] = set()
+        self._built = False
+
+    def add(self, word: str, payload: Hashable):
+        if not word:
+            return
+        self._payloads.setdefault(word, set()).add(payload)
+        self._built = False
+
+    def add_all(self, words: Iterable[str], payload: Hashable):
+        for word in words:
+            self.add(word, payload)
+
+    def build(self) -> "AhoCorasick":
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[tuple[str, frozenset]]] = [[]]
+        for word, payloads in self._payloads.items():
+            state = 0
+            for ch in word:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append((word, frozenset(payloads)))
+
+        # BFS로 실패 링크 계산 + 출력 병합
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto, self._fail, self._out = goto, fail, out
+        self._state_payloads = [
+            frozenset().union(*(payloads for _, payloads in outputs)) for outputs in out
+        ]
+        self._alphabet = {ch for word in self._payloads for ch in word}
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, str, frozenset]]:
+        """(시작, 끝, 단어, payload 집합)을 끝 위치 순서로"""
+        if not self._built:
+            self.build()
+        goto, fail, out, alphabet = self._goto, self._fail, self._out, self._alphabet
+        state = 0
+        for i, ch in enumerate(text):
+            if ch not in alphabet:
+                state = 0  # 어떤 키워드에도 없는 글자 → 바로 처음 상태로
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for word, payloads in out[state]:
+                yield i - len(word) + 1, i + 1, word, payloads
+
+    def payloads_in(self, text: str) -> set:
+        """텍스트에 등장한 단어들의 payload 합집합 (위치가 필요 없을 때의 빠른 경로)"""
+        if not self._built:
+            self.build()
+        goto, fail, state_payloads, alphabet = self._goto, self._fail, self._state_payloads, self._alphabet
+        found: set = set()
+        state = 0
+        for ch in text:
+            if ch not in alphabet:
+                state = 0
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if state_payloads[state]:
+                found |= state_payloads[state]
+        return found
+
+    def __len__(self) -> int:
+        return len(self._payloads)
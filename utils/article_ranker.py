@@ -0,0 +1,74 @@
+# 후보 기사 BM25 랭킹
+# utils/article_ranker.py
+
+import numpy as np
+
+# BM25 파라미터 (일반적인 기본값)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def query_terms(keywords: list[str]) -> list[str]:
+    """추출된 키워드 전체를 토큰 단위로 풀어 중복 없이 (순서 유지)"""
+    terms: list[str] = []
+    for keyword in keywords:
+        for token in keyword.lower().split():
+            if token and token not in terms:
+                terms.append(token)
+    return terms
+
+
+def term_frequency_matrix(docs: list[str], terms: list[str]) -> np.ndarray:
+    """
+    (기사 수 × 검색어 수) 출현 횟수 행렬
+    - 한국어는 조사가 붙어 공백 토큰이 잘 안 맞으므로 부분 문자열 출현 횟수로 셈
+    """
+    lowered = [doc.lower() for doc in docs]
+    return np.array(
+        [[doc.count(term) for term in terms] for doc in lowered],
+        dtype=np.float64
+    ).reshape(len(docs), len(terms))
+
+
+def bm25_scores(
+    docs: list[str],
+    keywords: list[str],
+    k1: float = BM25_K1,
+    b: float = BM25_B
+) -> np.ndarray:
+    """후보 기사 전체를 한 번에 BM25로 점수화 → shape (기사 수,)"""
+    terms = query_terms(keywords)
+    if not docs or not terms:
+        return np.zeros(len(docs))
+
+    tf = term_frequency_matrix(docs, terms)
+    doc_len = np.array([max(len(doc.split()), 1) for doc in docs], dtype=np.float64)
+    avgdl = doc_len.mean()
+
+    n_docs = len(docs)
+    df = (tf > 0).sum(axis=0)
+    idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+
+    norm = k1 * (1.0 - b + b * doc_len / avgdl)
+    weighted = tf * (k1 + 1.0) / (tf + norm[:, None])
+    return weighted @ idf
+
+
+def rank_articles(
+    url_text_pairs: list[tuple[str, str]],
+    keywords: list[str]
+) -> list[tuple[str, str, float]]:
+    """
+    [(url, text), ...] → BM25 점수 내림차순 [(url, text, score), ...]
+    - 검색어가 하나도 안 나오는 기사(점수 0)는 제외
+    - 점수가 같으면 원래(네이버) 순서 유지
+    """
+    if not url_text_pairs:
+        return []
+    scores = bm25_scores([text for _, text in url_text_pairs], keywords)
+    order = np.argsort(-scores, kind="stable")
+    return [
+        (url_text_pairs[i][0], url_text_pairs[i][1], float(scores[i]))
+        for i in order
+        if scores[i] > 0
+    ]
@@ -0,0 +1,159 @@
+# 자유 문장에서 지역명을 찾아 전체 행정 경로로 바꾸는 지명 사전(gazetteer)
+# utils/gazetteer.py
+#
+# korea_location_hierarchy.json 의 동/읍/면 + 부모(시·도, 시·군·구) 이름과
+# 줄임말/띄어쓰기 변형을 트라이 하나에 넣어 두고, 문장을 한 번 훑어 가장 긴 지명을 찾음
+# ex) "동선동 이가 날씨 알려줘" → "서울특별시 성북구 동선동2가"
+
+import re
+
+from crawling.news_searcher import LOCATION_MAP
+from crawling.weather_fetcher import normalize_location_name
+
+# 시·도 줄임말 (뉴스/음성 질의에서 흔히 쓰는 형태)
+PROVINCE_SHORT_NAMES = {
+    "서울특별시": ["서울", "서울시"],
+    "부산광역시": ["부산", "부산시"],
+    "대구광역시": ["대구", "대구시"],
+    "인천광역시": ["인천", "인천시"],
+    "광주광역시": ["광주", "광주시"],
+    "대전광역시": ["대전", "대전시"],
+    "울산광역시": ["울산", "울산시"],
+    "세종특별자치시": ["세종", "세종시"],
+    "경기도": ["경기"],
+    "충청북도": ["충북"],
+    "충청남도": ["충남"],
+    "전라남도": ["전남"],
+    "경상북도": ["경북"],
+    "경상남도": ["경남"],
+    "제주특별자치도": ["제주", "제주도"],
+    "강원특별자치도": ["강원", "강원도"],
+    "전북특별자치도": ["전북", "전라북도"],
+}
+
+# 이 길이 이하의 지명은 뒤에 다른 글자가 바로 붙으면(조사 제외) 지명으로 보지 않음
+SHORT_NAME_LENGTH = 2
+JOSA = set("은는이가을를의에도과와로")
+
+_NUMBERED = re.compile(r"^(?P<stem>.+?)(?P<num>\d+)(?P<unit>가|동)$")
+_WORD_CHAR = re.compile(r"[\w가-힣]")
+
+# 트라이 노드에서 후보 목록을 담는 키
+_TERMINAL = ""
+
+
+def _path_tuple(name: str, parents: list[str]) -> tuple[str, ...]:
+    """('서울특별시', '성북구', '동선동2가') 처럼 상위 → 하위 순서 (빈 값/대한민국 제외)"""
+    chain = [p for p in reversed(parents) if p and p != "대한민국"]
+    return tuple(chain + [name])
+
+
+def _variants(name: str, level: int) -> list[str]:
+    """정식 이름/시·도 줄임말 외에 문장에 나올 법한 변형"""
+    variants = []
+    if level == 2 and name[-1] in "시군구" and len(name) >= 3:
+        variants.append(name[:-1])  # 성북구 → 성북, 수원시 → 수원
+    match = _NUMBERED.match(name)
+    if match:
+        variants.append(f"{match['stem']} {match['num']}{match['unit']}")  # 동선동2가 → 동선동 2가
+    return variants
+
+
+class Gazetteer:
+    """
+    지명 트라이
+    - find(text): 겹치지 않게 왼쪽부터 가장 긴 지명 [(시작, 끝, 표면형, 후보들), ...]
+    - resolve(text): 언급된 지명들을 종합해 가장 구체적인 전체 행정 경로 문자열
+    후보: (경로 튜플, 수준(1=시·도, 2=시·군·구, 3=동·읍·면), 정식 이름·줄임말 여부, 등록 순서)
+    """
+
+    def __init__(self, hierarchy: dict[str, list[str]]):
+        self.root: dict = {}
+        self.paths: dict[tuple[str, ...], str] = {}
+        order = 0
+        for name, parents in hierarchy.items():
+            path = _path_tuple(name, parents)
+            # 부모 계층(시·도, 시·군·구)도 하나의 지명으로 등록
+            for depth in range(1, len(path) + 1):
+                node_path = path[:depth]
+                if node_path in self.paths:
+                    continue
+                self.paths[node_path] = " ".join(node_path)
+                level = 3 if depth == len(path) and len(path) > 1 else depth
+                node_name = node_path[-1]
+                self._insert(node_name, (node_path, level, True, order))
+                # 시·도 줄임말은 정식 이름과 같은 급으로 취급 ('광주' → 광주광역시 우선)
+                for alias in PROVINCE_SHORT_NAMES.get(node_name, []) if level == 1 else []:
+                    self._insert(alias, (node_path, level, True, order))
+                for variant in _variants(node_name, level):
+                    self._insert(variant, (node_path, level, False, order))
+                order += 1
+
+    def _insert(self, surface: str, candidate: tuple):
+        node = self.root
+        for ch in surface:
+            node = node.setdefault(ch, {})
+        node.setdefault(_TERMINAL, []).append(candidate)
+
+    def find(self, text: str) -> list[tuple[int, int, str, list[tuple]]]:
+        text = normalize_location_name(text)
+        mentions = []
+        i, n = 0, len(text)
+        while i < n:
+            # 단어 중간에서 시작하는 지명은 무시 (ex. '강남동'의 '남동')
+            if i > 0 and _WORD_CHAR.match(text[i - 1]):
+                i += 1
+                continue
+            node, j, longest = self.root, i, None
+            while j < n and text[j] in node:
+                node = node[text[j]]
+                j += 1
+                if _TERMINAL in node and self._acceptable_end(text, i, j):
+                    longest = (j, node[_TERMINAL])
+            if longest is None:
+                i += 1
+                continue
+            end, candidates = longest
+            mentions.append((i, end, text[i:end], candidates))
+            i = end
+        return mentions
+
+    @staticmethod
+    def _acceptable_end(text: str, start: int, end: int) -> bool:
+        if end - start > SHORT_NAME_LENGTH or end >= len(text):
+            return True
+        nxt = text[end]
+        return not _WORD_CHAR.match(nxt) or nxt in JOSA
+
+    def resolve(self, text: str) -> str | None:
+        """
+        언급된 지명 중 하나의 행정 경로를 고름
+        1) 다른 언급들과 가장 잘 맞는 경로 (ex. '서울 중구' → 서울특별시 중구)
+        2) 변형(성북, 수원)보다 정식 이름·시·도 줄임말 (ex. '광주' → 광주광역시)
+        3) 더 구체적인 수준 (동 > 구 > 시), 먼저 등록된 지명
+        """
+        mentions = self.find(text)
+        if not mentions:
+            return None
+
+        mention_paths = [{c[0] for c in candidates} for _, _, _, candidates in mentions]
+
+        def support(path: tuple[str, ...]) -> int:
+            return sum(
+                any(path[:len(p)] == p for p in paths)
+                for paths in mention_paths
+            )
+
+        best = max(
+            (c for _, _, _, candidates in mentions for c in candidates),
+            key=lambda c: (support(c[0]), c[2], c[1], -c[3]),
+        )
+        return self.paths[best[0]]
+
+
+GAZETTEER = Gazetteer(LOCATION_MAP)
+
+
+def resolve_location(text: str) -> str | None:
+    """문장 속 지명 → '서울특별시 성북구 동선동2가' 같은 전체 행정 경로 (없으면 None)"""
+    return GAZETTEER.resolve(text)
@@ -0,0 +1,171 @@
+# 의도 분류 모델(ELECTRA) 백엔드
+# utils/intent_model.py
+#
+# - torch: best_model 을 PyTorch(FP32)로 그대로 실행 (기본값)
+# - onnx : ONNX로 내보내 int8 동적 양자화한 모델을 onnxruntime + fast 토크나이저로 실행 (CPU 노드용)
+#
+# ONNX 내보내기:  python -m utils.intent_model          (best_model/onnx/ 에 model.onnx, model.int8.onnx 생성)
+# 백엔드 선택:    CLASSIFIER_BACKEND=onnx  (양자화 모델이 없으면 시작 시 한 번 내보냄)
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 라벨 매핑
+ID2LABEL = {0: "날씨", 1: "뉴스", 2: "이야기"}
+# 모델 라벨 → 처리 유형
+LABEL_TO_TYPE = {"이야기": "story", "뉴스": "news", "날씨": "weather"}
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODEL_DIR = PROJECT_ROOT / "best_model"
+ONNX_DIR = Path(os.getenv("CLASSIFIER_ONNX_DIR", str(MODEL_DIR / "onnx")))
+ONNX_FP32_FILE = "model.onnx"
+ONNX_INT8_FILE = "model.int8.onnx"
+
+CLASSIFIER_BACKEND = os.getenv("CLASSIFIER_BACKEND", "torch").lower()
+CLASSIFY_MAX_LENGTH = int(os.getenv("CLASSIFY_MAX_LENGTH", "128"))
+# 이 값 이하의 확신도는 invalid로 처리
+CLASSIFY_MIN_CONFIDENCE = float(os.getenv("CLASSIFY_MIN_CONFIDENCE", "0.5"))
+# onnxruntime 연산 스레드 수 (0이면 onnxruntime 기본값 = 물리 코어 수)
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
+
+_ONNX_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def _results(probs: np.ndarray) -> list[dict]:
+    pred_ids = probs.argmax(axis=-1)
+    return [
+        {"label": ID2LABEL[int(pred_id)], "confidence": round(float(row[pred_id]), 4)}
+        for pred_id, row in zip(pred_ids, probs)
+    ]
+
+
+def result_to_type(result: dict) -> str:
+    """모델 결과 → 처리 유형 (확신도가 낮으면 invalid)"""
+    if result["label"] in LABEL_TO_TYPE and result["confidence"] > CLASSIFY_MIN_CONFIDENCE:
+        return LABEL_TO_TYPE[result["label"]]
+    return "invalid"
+
+
+class TorchIntentClassifier:
+    """best_model 을 PyTorch로 실행 (느린 Python ElectraTokenizer)"""
+
+    backend = "torch"
+
+    def __init__(self, model_dir: Path = MODEL_DIR):
+        import torch
+        from transformers import ElectraForSequenceClassification, ElectraTokenizer
+
+        self._torch = torch
+        self.tokenizer = ElectraTokenizer.from_pretrained(model_dir)
+        self.model = ElectraForSequenceClassification.from_pretrained(model_dir)
+        self.model.eval()
+
+    def predict_batch(self, texts: list[str]) -> list[dict]:
+        """여러 문장을 배치 안에서 가장 긴 문장 길이로 패딩해 한 번에 분류"""
+        inputs = self.tokenizer(
+            texts, return_tensors="pt", truncation=True, padding=True, max_length=CLASSIFY_MAX_LENGTH
+        )
+        with self._torch.no_grad():
+            logits = self.model(**inputs).logits
+            probs = self._torch.softmax(logits, dim=-1).numpy()
+        return _results(probs)
+
+
+class OnnxIntentClassifier:
+    """int8 양자화 ONNX 모델을 onnxruntime으로 실행 (Rust 기반 fast 토크나이저)"""
+
+    backend = "onnx"
+
+    def __init__(
+        self,
+        onnx_dir: Path = ONNX_DIR,
+        model_file: str = ONNX_INT8_FILE,
+        intra_op_threads: int = ONNX_INTRA_OP_THREADS,
+    ):
+        import onnxruntime as ort
+        from transformers import ElectraTokenizerFast
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads > 0:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(Path(onnx_dir) / model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.tokenizer = ElectraTokenizerFast.from_pretrained(onnx_dir)
+
+    def predict_batch(self, texts: list[str]) -> list[dict]:
+        inputs = self.tokenizer(
+            texts, return_tensors="np", truncation=True, padding=True, max_length=CLASSIFY_MAX_LENGTH
+        )
+        feed = {name: inputs[name].astype(np.int64) for name in self.input_names}
+        logits = self.session.run(None, feed)[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=-1, keepdims=True)
+        return _results(probs)
+
+
+def export_onnx(model_dir: Path = MODEL_DIR, onnx_dir: Path = ONNX_DIR, opset: int = 17) -> Path:
+    """
+    best_model → ONNX(FP32) → int8 동적 양자화
+    - 배치/길이 축은 동적으로 내보내 마이크로 배칭 그대로 사용
+    - fast 토크나이저(tokenizer.json)도 같은 폴더에 저장 (실행 시 vocab 변환 생략)
+    """
+    import torch
+    from transformers import ElectraForSequenceClassification, ElectraTokenizerFast
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    onnx_dir = Path(onnx_dir)
+    onnx_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path, int8_path = onnx_dir / ONNX_FP32_FILE, onnx_dir / ONNX_INT8_FILE
+
+    tokenizer = ElectraTokenizerFast.from_pretrained(model_dir)
+    model = ElectraForSequenceClassification.from_pretrained(model_dir)
+    model.eval()
+
+    sample = tokenizer(["오늘 서울 날씨 어때", "경제 뉴스 알려줘"], return_tensors="pt", padding=True)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in _ONNX_INPUTS}
+    dynamic_axes["logits"] = {0: "batch"}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"], sample["token_type_ids"]),
+            str(fp32_path),
+            input_names=list(_ONNX_INPUTS),
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False,  # TorchScript 내보내기: 단일 파일 + 동적 축 그대로 (quantize_dynamic 호환)
+        )
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    tokenizer.save_pretrained(onnx_dir)
+
+    print(
+        f"✅ ONNX 내보내기 완료: {fp32_path.name} {fp32_path.stat().st_size / 2**20:.1f}MB"
+        f" → {int8_path.name} {int8_path.stat().st_size / 2**20:.1f}MB"
+    )
+    return int8_path
+
+
+def load_intent_classifier(backend: str = CLASSIFIER_BACKEND):
+    """CLASSIFIER_BACKEND 에 맞는 분류기 생성 (predict_batch(texts) -> [{label, confidence}, ...])"""
+    if backend == "onnx":
+        if not (ONNX_DIR / ONNX_INT8_FILE).exists():
+            print("📦 양자화 ONNX 모델이 없어 새로 내보냅니다...")
+            export_onnx()
+        return OnnxIntentClassifier()
+    if backend == "torch":
+        return TorchIntentClassifier()
+    raise ValueError(f"알 수 없는 CLASSIFIER_BACKEND: {backend}")
+
+
+if __name__ == "__main__":
+    export_onnx(
+        Path(sys.argv[1]) if len(sys.argv) > 1 else MODEL_DIR,
+        Path(sys.argv[2]) if len(sys.argv) > 2 else ONNX_DIR,
+    )
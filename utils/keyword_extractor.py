@@ -1,17 +1,43 @@
 # 사용자가 준 문장에서 핵심 키워드 뽑아내기
 # utils/keyword_extractor.py
 
+import os
 import re
+import asyncio
+import threading
+import unicodedata
 from konlpy.tag import Okt
 from collections import Counter
-from crawling.news_searcher import (
-    person_keywords,
-    location_keywords,
-    economy_keywords,
-    environment_keywords
+from cachetools import LRUCache
+from utils.vocabulary import (
+    ECONOMY_TOPICS,       # 기존 import 경로 유지용
+    DOMAIN_VOCABULARY,    # 기존 import 경로 유지용
+    DOMAIN_CATEGORIES,
+    word_categories
 )
+from utils.keyword_service import (
+    KEYWORD_WORKERS,
+    WARMUP_TEXT,
+    KeywordServiceUnavailable,
+    start_keyword_service,
+    keyword_service_ready,
+    keyword_service_stats,
+    pos_batch
+)
+
+# 형태소 분석 / 키워드 결과 메모 크기 (같은 음성 질의가 반복되는 경우가 많음)
+KEYWORD_CACHE_SIZE = int(os.getenv("KEYWORD_CACHE_SIZE", "1024"))
+
+# Okt()는 JVM 기동 + 사전 로딩이 오래 걸려 import 시점이 아니라 처음 쓸 때(또는 워밍업 때) 생성
+_okt: Okt | None = None
+_okt_lock = threading.Lock()
+_ready = False
 
-okt = Okt()
+# 메모: 정제된 문장 → okt.pos 결과 / (정규화된 문장, top_n) → 키워드
+_pos_memo: LRUCache = LRUCache(maxsize=KEYWORD_CACHE_SIZE)
+_keyword_memo: LRUCache = LRUCache(maxsize=KEYWORD_CACHE_SIZE)
+_memo_lock = threading.Lock()
+_memo_stats = {"pos_hits": 0, "pos_misses": 0, "keyword_hits": 0, "keyword_misses": 0}
 
 # 1) 불용어
 STOPWORDS = {
@@ -20,20 +46,89 @@ STOPWORDS = {
     "까지", "부터", "보다", "니다", "이다", "하고", "에도", "에서", "에게",
 }
 
-# 2) 경제 전용 지표 키워드
-ECONOMY_TOPICS = {
-    '금리', '물가', '환율', '실업률', '수출', '수입', '경기침체', '한국은행',
-    '기준금리', '고용', '무역수지', '재정적자', '증시', '코스피', '코스닥',
-    '부동산', '인플레이션', '청약', '분양', '소득', '임금'
-}
+# 2) 경제 전용 지표 키워드 / 3) 도메인별 키워드 사전 → utils/vocabulary.py
+
+
+def get_okt() -> Okt:
+    """공유 Okt 인스턴스 (최초 1회 생성, 동시에 불려도 JVM은 한 번만 기동)"""
+    global _okt
+    if _okt is None:
+        with _okt_lock:
+            if _okt is None:
+                _okt = Okt()
+    return _okt
+
+
+def warm_up_keyword_extractor():
+    """
+    앱 시작 시 호출: JVM 기동 + 사전 로딩 + 첫 분석까지 미리 끝내 둠
+    (배포 직후 첫 사용자가 콜드 스타트를 떠안지 않도록)
+    - 형태소 분석 워커 풀을 쓰면 워커들을, 아니면 이 프로세스의 Okt를 워밍업
+    - 성공하면 True (실패하면 utils/warmup 이 잠시 후 다시 호출)
+    """
+    global _ready
+    try:
+        if KEYWORD_WORKERS <= 0:
+            get_okt().pos(WARMUP_TEXT)
+        elif not start_keyword_service():
+            return False  # 워커 기동 중 앱 종료
+    except Exception as e:
+        print(f"❌ Okt 워밍업 실패: {e}")
+        return False
+    _ready = True
+    print("🔤 Okt 형태소 분석기 준비 완료")
+    return True
+
+
+def keyword_extractor_ready() -> bool:
+    """워커 풀을 쓰면 풀 상태(장애 후 재시작 중이면 False), 아니면 이 프로세스 Okt 워밍업 여부"""
+    if KEYWORD_WORKERS > 0:
+        return keyword_service_ready()
+    return _ready
+
+
+def normalize_query(text: str) -> str:
+    """메모 키용 정규형: 유니코드 NFC 정규화 + 공백 정리"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def clean_text(text: str) -> str:
+    return re.sub(r'[^\w\s]', ' ', text)
+
+
+def _memo_get(memo: LRUCache, key, stat: str):
+    with _memo_lock:
+        value = memo.get(key)
+        _memo_stats[f"{stat}_hits" if value is not None else f"{stat}_misses"] += 1
+    return value
+
+
+def _memo_set(memo: LRUCache, key, value):
+    with _memo_lock:
+        memo[key] = value
+
+
+def _okt_pos(cleaned: str) -> tuple[tuple[str, str], ...]:
+    tags = _memo_get(_pos_memo, cleaned, "pos")
+    if tags is None:
+        tags = tuple(get_okt().pos(cleaned))
+        _memo_set(_pos_memo, cleaned, tags)
+    return tags
+
+
+def keyword_cache_stats() -> dict:
+    stats = {"ready": _ready, "service": keyword_service_stats()}
+    for name, memo in (("pos", _pos_memo), ("keyword", _keyword_memo)):
+        hits, misses = _memo_stats[f"{name}_hits"], _memo_stats[f"{name}_misses"]
+        stats[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "size": len(memo),
+            "maxsize": memo.maxsize,
+        }
+    return stats
 
-# 3) 도메인별 키워드 사전 (사전 키워드 + 전용 토픽 합침)
-DOMAIN_VOCABULARY = {
-    'economy': set(economy_keywords) | ECONOMY_TOPICS,
-    'person': set(person_keywords),
-    'location': set(location_keywords),
-    'environment': set(environment_keywords),
-}
 
 def extract_keyword_from_text(text: str, top_n: int = 3) -> list[str]:
     """
@@ -41,23 +136,105 @@ def extract_keyword_from_text(text: str, top_n: int = 3) -> list[str]:
     2) Okt로 명사 추출 + 불용어 제거
     3) 도메인 감지 → 해당 도메인 키워드 우선 반환
     4) 없으면 3-gram/2-gram 조합 (띄어쓰기 유지)
+    같은 (정규화된) 문장은 메모된 결과를 돌려줌
+    """
+    key = (normalize_query(text), top_n)
+    keywords = _memo_get(_keyword_memo, key, "keyword")
+    if keywords is None:
+        keywords = tuple(keywords_from_pos(key[0], _okt_pos(clean_text(key[0])), top_n))
+        _memo_set(_keyword_memo, key, keywords)
+    return list(keywords)
+
+
+async def _analyze(texts: list[str]) -> list[tuple[tuple[str, str], ...]] | None:
+    """
+    형태소 분석: 워커 풀(KEYWORD_WORKERS > 0) 또는 이 프로세스의 Okt(KEYWORD_WORKERS=0)
+    - 워커 풀이 준비 전/장애 중이면 None (이 프로세스에서 JVM을 띄우지 않음)
+    """
+    if KEYWORD_WORKERS <= 0:
+        okt = await asyncio.to_thread(get_okt)
+        return await asyncio.to_thread(lambda: [tuple(okt.pos(cleaned)) for cleaned in texts])
+    try:
+        return await pos_batch(texts)
+    except KeywordServiceUnavailable as e:
+        print(f"⚠️ {e} → 형태소 분석 없이 간이 키워드 사용")
+        return None
+
+
+async def extract_keywords_batch(texts: list[str], top_n: int = 3) -> list[list[str]]:
+    """
+    extract_keyword_from_text의 비동기·배치 버전 (입력 순서대로 결과 반환)
+    - 메모에 없는 문장만 모아 형태소 분석 워커에 한 번에 보냄
+    - 워커가 준비되지 않았으면 문장 자체를 키워드로 쓰는 간이 결과 (메모하지 않음)
     """
-    # 1) 정제
-    cleaned = re.sub(r'[^\w\s]', ' ', text)
+    keys = [(normalize_query(text), top_n) for text in texts]
+    results: dict = {}
+    pending = []
+    for key in dict.fromkeys(keys):
+        keywords = _memo_get(_keyword_memo, key, "keyword")
+        if keywords is None:
+            pending.append(key)
+        else:
+            results[key] = keywords
+
+    if pending:
+        tags_by_text: dict[str, tuple] = {}
+        to_analyze = []
+        for text, _ in pending:
+            cleaned = clean_text(text)
+            tags = _memo_get(_pos_memo, cleaned, "pos")
+            if tags is None:
+                to_analyze.append(cleaned)
+            else:
+                tags_by_text[cleaned] = tags
+
+        to_analyze = list(dict.fromkeys(to_analyze))
+        if to_analyze:
+            analyzed = await _analyze(to_analyze)
+            for cleaned, tags in zip(to_analyze, analyzed or ()):
+                tags_by_text[cleaned] = tags
+                _memo_set(_pos_memo, cleaned, tags)
+
+        for key in pending:
+            text = key[0]
+            tags = tags_by_text.get(clean_text(text))
+            if tags is None:
+                # 간이 결과: 분석 결과 없이 → [문장] (워커가 준비되면 다시 제대로 분석하도록 메모하지 않음)
+                results[key] = tuple(keywords_from_pos(text, (), top_n))
+                continue
+            keywords = tuple(keywords_from_pos(text, tags, top_n))
+            _memo_set(_keyword_memo, key, keywords)
+            results[key] = keywords
+
+    return [list(results[key]) for key in keys]
+
+
+async def extract_keyword_from_text_async(text: str, top_n: int = 3) -> list[str]:
+    """요청 처리(비동기) 경로용 extract_keyword_from_text"""
+    return (await extract_keywords_batch([text], top_n))[0]
+
 
+def keywords_from_pos(text: str, pos_tags, top_n: int = 3) -> list[str]:
+    """형태소 분석 결과 → 키워드 (분석은 호출한 쪽에서: 프로세스 내 Okt 또는 워커 풀)"""
     # 2) 토큰화
     tokens = [
-        w for w, pos in okt.pos(cleaned)
+        w for w, pos in pos_tags
         if pos == "Noun" and len(w) > 1 and w not in STOPWORDS
     ]
     if not tokens:
         return [text.strip()]
 
     # 3) 도메인 감지 & 사전 키워드 조합
-    for domain, vocab in DOMAIN_VOCABULARY.items():
+    # (토큰마다 어휘 색인을 한 번만 조회 → 도메인마다 전체 사전을 다시 보지 않음)
+    token_categories = [word_categories(tok) for tok in tokens]
+    for domain, categories in DOMAIN_CATEGORIES.items():
         # 토큰 중에 도메인 어휘가 하나라도 있으면 ‘감지’로 간주
-        if any(tok in vocab for tok in tokens):
-            specific = [tok for tok in tokens if tok in vocab and any(tok in seg for seg in text.split())]
+        if any(not cats.isdisjoint(categories) for cats in token_categories):
+            # 원문에 그대로 등장하는 어휘만 (토큰엔 공백이 없으므로 원문 부분 문자열 검사와 같음)
+            specific = [
+                tok for tok, cats in zip(tokens, token_categories)
+                if not cats.isdisjoint(categories) and tok in text
+            ]
             return specific[:top_n] if specific else [tokens[0]]
 
     # 4) n-gram 기반 추출 (띄어쓰기 유지)
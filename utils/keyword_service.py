@@ -0,0 +1,164 @@
+# 형태소 분석(Okt) 전용 워커 프로세스 풀
+# utils/keyword_service.py
+#
+# okt.pos는 JPype로 한 JVM을 거치기 때문에 스레드를 늘려도 호출이 줄을 섬
+# → 워커 프로세스마다 자기 JVM + Okt를 띄워 두고 여러 코어에서 나눠 분석
+
+import os
+import math
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Okt 워커 프로세스 수 (워커마다 JVM을 하나씩 띄우므로 메모리를 고려해 작게, 0이면 사용 안 함)
+KEYWORD_WORKERS = int(os.getenv("KEYWORD_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+WARMUP_TEXT = "오늘 서울 날씨와 경제 뉴스 알려줘"
+
+_pool: ProcessPoolExecutor | None = None
+_ready = False
+_start_lock = threading.Lock()
+# stop_keyword_service 호출마다 증가 → 종료 전에 시작한 (취소된 워밍업의) 풀은 버림
+_generation = 0
+# 워커가 죽었거나 시작에 실패했을 때 백그라운드에서 풀을 다시 띄우는 작업
+_restart_task: asyncio.Task | None = None
+
+# 워커 프로세스 안에서만 쓰는 Okt 인스턴스
+_worker_okt = None
+
+_service_stats = {
+    "batches": 0,       # pos_batch 호출 수 (= 왕복 수)
+    "texts": 0,         # 분석한 문장 수
+    "unavailable": 0,   # 준비 전/장애로 분석하지 못한 호출 수
+    "restarts": 0,
+}
+
+
+class KeywordServiceUnavailable(RuntimeError):
+    """형태소 분석 워커가 준비되지 않았거나 깨짐 (풀은 백그라운드에서 다시 시작)"""
+
+
+def _init_worker():
+    """워커 초기화: JVM 기동 + 사전 로딩 + 한 번 분석해 둠"""
+    global _worker_okt
+    from konlpy.tag import Okt
+
+    _worker_okt = Okt()
+    _worker_okt.pos(WARMUP_TEXT)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _pos_many(texts: list[str]) -> list[tuple[tuple[str, str], ...]]:
+    return [tuple(_worker_okt.pos(text)) for text in texts]
+
+
+def start_keyword_service() -> bool:
+    """
+    워커를 전부 띄우고 Okt 워밍업까지 끝날 때까지 대기 (수 초 걸림 → 백그라운드 스레드에서 호출)
+    - JVM이 떠 있는 부모를 fork하지 않도록 spawn으로 생성
+    """
+    global _pool, _ready
+    if KEYWORD_WORKERS <= 0:
+        return False
+    generation = _generation
+    with _start_lock:
+        if _pool is not None:
+            return True
+        pool = ProcessPoolExecutor(
+            max_workers=KEYWORD_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        try:
+            pids = {f.result() for f in [pool.submit(_ping) for _ in range(KEYWORD_WORKERS)]}
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        if generation != _generation:
+            # 기동하는 사이 앱이 종료됨
+            pool.shutdown(wait=False, cancel_futures=True)
+            return False
+        _pool, _ready = pool, True
+    print(f"🔤 형태소 분석 워커 {len(pids)}개 준비 완료")
+    return True
+
+
+def _restart_in_thread():
+    try:
+        start_keyword_service()
+    except Exception as e:
+        print(f"❌ 형태소 분석 워커 재시작 실패 (다음 요청 때 다시 시도): {e}")
+
+
+def _schedule_restart():
+    """워커 풀 재시작을 백그라운드로 (이미 진행 중이면 그대로, 요청은 기다리지 않음)"""
+    global _restart_task
+    if _restart_task is None or _restart_task.done():
+        _service_stats["restarts"] += 1
+        _restart_task = asyncio.get_running_loop().create_task(asyncio.to_thread(_restart_in_thread))
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """깨진 풀 정리 (그 사이 이미 새 풀로 바뀌었으면 새 풀은 건드리지 않음)"""
+    global _pool, _ready
+    if _pool is pool:
+        _pool, _ready = None, False
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def stop_keyword_service():
+    global _pool, _ready, _generation
+    _generation += 1
+    _ready = False
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    _pool = None
+
+
+def keyword_service_ready() -> bool:
+    return _ready
+
+
+async def pos_batch(texts: list[str]) -> list[tuple[tuple[str, str], ...]]:
+    """
+    여러 문장을 한 번의 왕복으로 형태소 분석 (입력 순서대로 결과 반환)
+    - 워커 수만큼 나눠 동시에 분석
+    - 준비 전이거나 워커가 죽었으면 KeywordServiceUnavailable
+      (풀은 백그라운드에서 다시 띄우고, 호출한 쪽은 부모 프로세스에서 JVM을 띄우지 않고 간이 결과로 응답)
+    """
+    pool = _pool
+    if not _ready or pool is None:
+        _service_stats["unavailable"] += 1
+        if pool is None and not _start_lock.locked():
+            _schedule_restart()
+        raise KeywordServiceUnavailable("형태소 분석 워커가 준비되지 않았습니다.")
+    if not texts:
+        return []
+
+    _service_stats["batches"] += 1
+    _service_stats["texts"] += len(texts)
+
+    size = math.ceil(len(texts) / KEYWORD_WORKERS)
+    loop = asyncio.get_running_loop()
+    try:
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, _pos_many, texts[i:i + size])
+            for i in range(0, len(texts), size)
+        ))
+    except (BrokenProcessPool, RuntimeError) as e:
+        # BrokenProcessPool: 워커가 죽음(JVM 크래시, OOM) / RuntimeError: 종료된 풀에 submit
+        print(f"⚠️ 형태소 분석 워커 풀이 깨져 다시 시작합니다: {e!r}")
+        _service_stats["unavailable"] += 1
+        _discard_pool(pool)
+        _schedule_restart()
+        raise KeywordServiceUnavailable("형태소 분석 워커가 깨졌습니다.") from e
+    return [tags for part in parts for tags in part]
+
+
+def keyword_service_stats() -> dict:
+    return {**_service_stats, "workers": KEYWORD_WORKERS, "ready": _ready}
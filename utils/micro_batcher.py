@@ -0,0 +1,192 @@
+# 동시에 들어온 추론 요청을 잠깐 모아 한 번에 처리하는 마이크로 배처
+# utils/micro_batcher.py
+#
+# 요청마다 모델을 한 번씩 돌리면 동시 사용자가 많을 때 같은 가중치로 작은 연산을 반복함
+# → 첫 요청 후 몇 ms(또는 배치가 찰 때)까지 기다렸다가 모인 입력을 한 번의 forward로 처리
+
+import time
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+
+class BatcherQueueFull(Exception):
+    """대기열이 가득 차 요청을 받을 수 없음 (라우터에서 503으로 변환)"""
+
+
+class MicroBatcher:
+    """
+    사용법
+        batcher = MicroBatcher(predict_batch, max_batch_size=16, max_wait_ms=5, max_queue=256)
+        result = await batcher.submit(item)
+    - predict_batch(items) -> results : 입력 순서대로 결과 리스트 (블로킹 함수, 전용 스레드 하나에서 실행)
+    - 배치 처리 중 예외가 나면 그 배치의 요청 모두에 같은 예외를 전달
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[list], Sequence],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue: int = 256,
+        name: str = "batcher",
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_queue = max_queue
+        self.name = name
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "rejected": 0,              # 대기열이 가득 차 거절한 요청
+            "errors": 0,                # 예외로 끝난 배치
+            "max_queue_depth": 0,
+            "total_wait_ms": 0.0,       # 요청이 배치에 들어가기까지 기다린 시간 합
+            "total_inference_ms": 0.0,
+        }
+        self._batch_sizes: Counter = Counter()
+
+    @staticmethod
+    def _fail(entries, exc: BaseException):
+        """대기 중인 요청들에 예외 전달 (다른 이벤트 루프의 future면 그 루프에서 설정)"""
+        loop = asyncio.get_running_loop()
+        for _, future, _ in entries:
+            if future.done():
+                continue
+            future_loop = future.get_loop()
+            if future_loop is loop:
+                future.set_exception(exc)
+            elif not future_loop.is_closed():
+                future_loop.call_soon_threadsafe(
+                    lambda f=future: f.done() or f.set_exception(exc)
+                )
+
+    def _drain_queue(self) -> list[tuple]:
+        entries = []
+        while self._queue is not None and not self._queue.empty():
+            entries.append(self._queue.get_nowait())
+        return entries
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            # 이벤트 루프가 바뀌면(테스트/재시작) 대기열과 워커를 새로 만듦
+            # 이전 대기열에 남은 요청은 처리할 워커가 없으므로 실패로 끝냄 (영원히 기다리지 않도록)
+            self._fail(self._drain_queue(), RuntimeError(f"{self.name} 워커가 다시 시작되었습니다."))
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            if self._executor is None:
+                # 모델 추론은 한 번에 한 배치만 (torch가 자체적으로 여러 코어를 사용)
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, item: Any) -> Any:
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            raise BatcherQueueFull(f"{self.name} 대기열이 가득 찼습니다 ({self.max_queue}).")
+        self._stats["requests"] += 1
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue.qsize())
+        return await future
+
+    async def _collect(self, batch: list[tuple]):
+        """첫 요청을 기다린 뒤, 배치가 차거나 대기 시간이 끝날 때까지 batch에 추가로 모음"""
+        batch.append(await self._queue.get())
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # 이미 쌓여 있는 요청은 기다리지 않고 바로 가져옴
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self):
+        while True:
+            batch: list[tuple] = []
+            try:
+                await self._collect(batch)
+                await self._process(batch)
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError(f"{self.name} 배처가 종료되었습니다."))
+                raise
+            except Exception as e:
+                # 예상하지 못한 오류도 이번 배치만 실패시키고 워커는 계속 동작
+                self._stats["errors"] += 1
+                print(f"❌ {self.name} 배치 처리 중 예기치 않은 오류: {e!r}")
+                self._fail(batch, e)
+
+    async def _process(self, batch: list[tuple]):
+        # 기다리는 사이 취소된 요청(클라이언트 연결 끊김)은 제외
+        batch = [entry for entry in batch if not entry[1].done()]
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        self._stats["batches"] += 1
+        self._batch_sizes[len(batch)] += 1
+        self._stats["total_wait_ms"] += sum(started - queued for _, _, queued in batch) * 1000
+
+        items = [item for item, _, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.predict_batch, items
+            )
+            if len(results) != len(items):
+                raise RuntimeError(f"배치 결과 수가 맞지 않습니다: {len(results)} != {len(items)}")
+        except Exception as e:
+            self._stats["errors"] += 1
+            self._fail(batch, e)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        self._stats["total_inference_ms"] += (time.perf_counter() - started) * 1000
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._fail(self._drain_queue(), RuntimeError(f"{self.name} 배처가 종료되었습니다."))
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def stats(self) -> dict:
+        batches = self._stats["batches"]
+        batched = sum(size * count for size, count in self._batch_sizes.items())
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_queue": self.max_queue,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self._stats["requests"],
+            "batches": batches,
+            "rejected": self._stats["rejected"],
+            "errors": self._stats["errors"],
+            "max_queue_depth": self._stats["max_queue_depth"],
+            "avg_batch_size": round(batched / batches, 2) if batches else 0.0,
+            "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+            "avg_wait_ms": round(self._stats["total_wait_ms"] / batched, 3) if batched else 0.0,
+            "avg_inference_ms": round(self._stats["total_inference_ms"] / batches, 3) if batches else 0.0,
+        }
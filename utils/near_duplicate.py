@@ -0,0 +1,61 @@
+# 같은 기사(통신사 기사 재배포 등) 중복 판별
+# utils/near_duplicate.py
+
+import re
+import hashlib
+import numpy as np
+
+# 문자 n-gram 크기 (한국어는 띄어쓰기가 들쭉날쭉해서 공백 제거 후 문자 단위로 자름)
+SHINGLE_SIZE = 4
+# 64비트 SimHash 해밍 거리 임계값: 이 이하이면 같은 기사로 간주
+SIMHASH_MAX_DISTANCE = 6
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _shingles(text: str) -> set[str]:
+    normalized = _NON_WORD.sub("", text.lower())
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+
+def simhash(text: str) -> int:
+    """
+    문자 n-gram 집합의 64비트 SimHash
+    - 각 n-gram 해시의 비트별 다수결 → 비슷한 본문은 비트가 거의 같음
+    """
+    shingles = _shingles(text)
+    if not shingles:
+        return 0
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+         for s in shingles],
+        dtype=np.uint64
+    )
+    bits = np.unpackbits(hashes.view(np.uint8)).reshape(len(hashes), 64)
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(hashes)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateFilter:
+    """
+    본문을 하나씩 넣으면서 이미 본 기사와 거의 같은지 판별
+    - add(text): 새 기사면 등록 후 True, 이미 있는 기사와 겹치면 False
+    """
+
+    def __init__(self, max_distance: int = SIMHASH_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.fingerprints: list[int] = []
+
+    def add(self, text: str) -> bool:
+        fp = simhash(text)
+        if any(hamming_distance(fp, seen) <= self.max_distance for seen in self.fingerprints):
+            return False
+        self.fingerprints.append(fp)
+        return True
+
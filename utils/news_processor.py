@@ -6,34 +6,82 @@ import os
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 import re
-import pickle
+import time
+import asyncio
+import hashlib
+import unicodedata
+from functools import lru_cache
 import tiktoken
 import json
-
-CACHE_PATH = "summary_cache.pkl"
-SUMMARY_CACHE = {}
-if os.path.exists(CACHE_PATH):
-    try:
-        with open(CACHE_PATH, "rb") as f:
-            SUMMARY_CACHE = pickle.load(f)
-        print(f"📂 캐시 로드 완료: {len(SUMMARY_CACHE)}개")
-    except Exception as e:
-        print(f"❗ 캐시 로드 실패: {e}")
+from utils.summary_cache import SUMMARY_CACHE
 
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 client = AsyncOpenAI()
 
+# 청크 요약 동시 실행 수 / 청크 하나당 제한 시간(초)
+MASSAC_CHUNK_CONCURRENCY = int(os.getenv("MASSAC_CHUNK_CONCURRENCY", "4"))
+MASSAC_CHUNK_TIMEOUT = float(os.getenv("MASSAC_CHUNK_TIMEOUT", "60"))
+
+# 동시 요청 전체가 공유하는 청크 요약 세마포어 (실행 중인 이벤트 루프에서 처음 쓸 때 생성)
+_chunk_semaphore: asyncio.Semaphore | None = None
+_chunk_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_chunk_semaphore() -> asyncio.Semaphore:
+    """프로세스 전체 MASSaC 청크 동시 요약 수 제한 (이벤트 루프가 바뀌면 새로 생성)"""
+    global _chunk_semaphore, _chunk_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _chunk_semaphore is None or _chunk_semaphore_loop is not loop:
+        _chunk_semaphore = asyncio.Semaphore(MASSAC_CHUNK_CONCURRENCY)
+        _chunk_semaphore_loop = loop
+    return _chunk_semaphore
+
 # -------------------
 # NEW: 토큰 수 계산용
 # -------------------
+@lru_cache(maxsize=None)
+def get_encoding(model: str = "gpt-4o") -> tiktoken.Encoding:
+    """모델별 tiktoken 인코더를 한 번만 만들어 재사용"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
 def count_tokens(text: str, model: str = "gpt-4o") -> int:
-    enc = tiktoken.encoding_for_model(model)
-    return len(enc.encode(text))
+    return len(get_encoding(model).encode(text))
 
 # --------------------------
 # NEW: 자동 청크 분할 로직
 # --------------------------
+def _article_block(i: int, url: str, text: str, model: str, max_tokens: int) -> tuple[str, int]:
+    """
+    기사 하나를 '블록' 문자열로 만들고 토큰 수와 함께 반환
+    - 기사 하나만으로 max_tokens를 넘으면 본문 뒷부분을 잘라 한도에 맞춤
+    """
+    enc = get_encoding(model)
+    header = f"=== 기사 {i} ({url}) ===\n"
+    body = text.strip()
+    block = f"{header}{body}\n"
+    n_tokens = len(enc.encode(block))
+    if n_tokens <= max_tokens:
+        return block, n_tokens
+
+    body_tokens = enc.encode(body)
+    budget = max_tokens - len(enc.encode(header)) - 1
+    # 디코딩 후 재인코딩하면 경계에서 토큰 수가 조금 달라질 수 있어 맞을 때까지 줄임
+    while budget > 0:
+        block = f"{header}{enc.decode(body_tokens[:budget])}\n"
+        n_tokens = len(enc.encode(block))
+        if n_tokens <= max_tokens:
+            print(f"✂️ 기사 {i} 본문이 너무 길어 {budget}토큰으로 자름")
+            return block, n_tokens
+        budget -= n_tokens - max_tokens
+    block = header
+    return block, len(enc.encode(block))
+
+
 def chunk_url_text_pairs(
     url_text_pairs: list[tuple[str, str]],
     model: str = "gpt-4o",
@@ -42,96 +90,120 @@ def chunk_url_text_pairs(
     """
     [(url, text), ...] 를 model 한도(max_tokens)에 맞춰
     텍스트 블록 단위로 분할해 리스트 반환
+    - 블록마다 토큰 수를 한 번만 세고 누적 합으로 비교 (전체 길이에 선형)
+    - 기사 순서를 유지하는 분할 중에서는 앞에서부터 꽉 채우는 방식이 청크 수가 가장 적음
+    - 혼자서 한도를 넘는 기사는 잘라서 넣음 (빈 청크를 만들지 않음)
     """
-    # 각 기사를 하나의 '블록' 문자열로 변환
-    blocks = [
-        f"=== 기사 {i} ({url}) ===\n{txt.strip()}\n"
-        for i, (url, txt) in enumerate(url_text_pairs, start=1)
-    ]
-    chunks = []
-    current_chunk = []
-    current_text = ""
-    for block in blocks:
+    chunks: list[list[str]] = []
+    current_chunk: list[str] = []
+    current_tokens = 0
+    for i, (url, txt) in enumerate(url_text_pairs, start=1):
+        block, n_tokens = _article_block(i, url, txt, model, max_tokens)
         # 현재 청크에 block을 추가했을 때 한도 초과 여부 검사
-        if count_tokens(current_text + block, model) > max_tokens:
+        if current_chunk and current_tokens + n_tokens > max_tokens:
             # 초과하면 지금까지 쌓은 청크를 확정하고 새 청크 시작
             chunks.append(current_chunk)
-            current_chunk = [block]
-            current_text = block
-        else:
-            current_chunk.append(block)
-            current_text += block
+            current_chunk = []
+            current_tokens = 0
+        current_chunk.append(block)
+        current_tokens += n_tokens
     if current_chunk:
         chunks.append(current_chunk)
     return chunks
 
 # --------------------------------------------------------
-# NEW: 요약 + 쉬운 언어 변환 → 청크 단위로 처리 + 최종 통합
+# NEW: 기사 본문 해시 기반 요약 재사용
 # --------------------------------------------------------
-async def MASSaC(
-    url_text_pairs: list[tuple[str, str]]
-) -> dict[str, list[str] | str]:
+ARTICLE_SUMMARY_PREFIX = "massac:article:"
+# v2: 결과에 기사별 (URL, 요약) 목록 포함
+COMBINED_STORY_PREFIX = "massac:combined:v2:"
+COMBINE_FAILED_MESSAGE = "요약을 통합하는 데 실패했어요. 다시 시도해 주세요."
+
+
+def article_hash(text: str) -> str:
     """
-    함수 뜻: multi_article_simplified_summary_and_combine
-    1) 토큰 한도 검사 → 필요 시 자동 청크 분할
-    2) 각 청크별로 500자 요약 + 쉬운 말투 재작성 → summaries 수집
-    3) 모든 summaries를 마지막에 한 번의 프롬프트로 통합
-    - 반환: { "summaries": [...], "combined": "..." }
+    본문 정규화(NFC + 공백 정리) 후 sha256
+    → 같은 기사를 다른 URL/다른 사용자가 요청해도 같은 키
     """
-    model = "gpt-4o"
-    # 모델 한도 대비 여유분 둔 임계치 (예: 32K 한도 중 28K 토큰으로)
-    max_input_tokens = 28_000
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
-    print(f"📊 받은 기사 수: {len(url_text_pairs)}개")
-    # 1) 청크 분할
-    chunks = chunk_url_text_pairs(url_text_pairs, model, max_input_tokens)
 
-    all_summaries: list[str] = []
-    
-    # 2) 청크별 요약 + 쉬운 말투 변환 (summaries만)
-    for chunk in chunks:
-        joined = "\n".join(chunk)
-        prompt = f"""
-        다음 {len(chunk)}건의 뉴스를 처리하세요:
-        1) 1000자 내외로 간결하게 요약
-        2) 경계선 지능형 장애인 수준의 사용자도 이해할 수 있도록 어려운 단어는 쉬운 말로 바꿔주세요
-        3) 필요하다면 어려운 말 앞에 추가 설명을 넣어주세요.(ex. 배터리의 한 종류인 납축전지)
-
-        [기사 블록]
-        {joined}
-
-        [출력 형식 - JSON]
-        {{
-        "summaries": [
-            "기사1 요약+쉬운 문장",
-            "기사2 요약+쉬운 문장",
-            ...
-        ]
-        }}
-        """
-        resp = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "너는 어린이용 뉴스 편집자야."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=1500
-        )
-        out = resp.choices[0].message.content
-        # JSON 블록 파싱
-        m = re.search(r"\{\s*\"summaries\"\s*:\s*\[([\s\S]*?)\]\s*\}", out)
-        if m:
-            obj = json.loads("{" + m.group(0).split("{", 1)[1])
-            all_summaries.extend(obj["summaries"])
+def _combined_key(hashes: list[str]) -> str:
+    """기사 해시들의 순서 있는 묶음 → 통합 이야기 캐시 키"""
+    joined = ":".join(hashes)
+    return COMBINED_STORY_PREFIX + hashlib.sha256(joined.encode("utf-8")).hexdigest()
 
-    if not all_summaries:
-        return {
-            "summaries": [],
-            "combined": "요약할 기사를 찾을 수 없습니다. 다시 시도해 주세요."
-        }
-    
-    # 3) 최종 통합
+
+async def _summarize_chunk(chunk: list[str], model: str) -> list[str]:
+    """청크 하나(기사 블록 여러 개)를 요약 + 쉬운 말투로 변환"""
+    joined = "\n".join(chunk)
+    prompt = f"""
+    다음 {len(chunk)}건의 뉴스를 처리하세요:
+    1) 1000자 내외로 간결하게 요약
+    2) 경계선 지능형 장애인 수준의 사용자도 이해할 수 있도록 어려운 단어는 쉬운 말로 바꿔주세요
+    3) 필요하다면 어려운 말 앞에 추가 설명을 넣어주세요.(ex. 배터리의 한 종류인 납축전지)
+
+    [기사 블록]
+    {joined}
+
+    [출력 형식 - JSON]
+    {{
+    "summaries": [
+        "기사1 요약+쉬운 문장",
+        "기사2 요약+쉬운 문장",
+        ...
+    ]
+    }}
+    """
+    resp = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "너는 어린이용 뉴스 편집자야."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2,
+        max_tokens=1500
+    )
+    out = resp.choices[0].message.content
+    # JSON 블록 파싱
+    m = re.search(r"\{\s*\"summaries\"\s*:\s*\[([\s\S]*?)\]\s*\}", out)
+    if m:
+        obj = json.loads("{" + m.group(0).split("{", 1)[1])
+        return obj["summaries"]
+    return []
+
+
+async def _summarize_chunk_guarded(
+    i: int,
+    chunk: list[str],
+    model: str
+) -> list[str] | None:
+    """공유 세마포어 + 청크별 제한 시간 적용, 실패한 청크는 None"""
+    async with _get_chunk_semaphore():
+        try:
+            return await asyncio.wait_for(_summarize_chunk(chunk, model), MASSAC_CHUNK_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"⏰ 청크 {i} 요약 시간 초과 ({MASSAC_CHUNK_TIMEOUT}s) → 제외")
+        except Exception as e:
+            print(f"❗ 청크 {i} 요약 실패 → 제외: {e}")
+        return None
+
+
+async def _summarize_chunks_parallel(chunks: list[list[str]], model: str) -> list[list[str] | None]:
+    """
+    청크들을 공유 세마포어로 동시 실행 수를 제한하며 병렬 요약
+    - 결과는 chunks 순서 그대로 반환
+    - 시간 초과/실패한 청크는 None (다른 청크에는 영향 없음)
+    """
+    return await asyncio.gather(*(
+        _summarize_chunk_guarded(i, chunk, model)
+        for i, chunk in enumerate(chunks, start=1)
+    ))
+
+
+async def _combine_summaries(summaries: list[str], model: str) -> str:
+    """여러 기사 요약을 하나의 쉬운 이야기로 통합"""
     combined_prompt = f"""
     아래는 여러 뉴스 요약입니다.
     - 경계선 지능형 장애인 수준의 사용자도 이해할 수 있도록 한 문장에 하나의 정보만 담고, 어려운 말은 쉬운 말로 바꿔주세요.
@@ -139,7 +211,7 @@ async def MASSaC(
     - 마지막에 '이상이 오늘의 뉴스입니다.'로 마무리.
 
     [요약 목록]
-    {json.dumps(all_summaries, ensure_ascii=False, indent=2)}
+    {json.dumps(summaries, ensure_ascii=False, indent=2)}
 
     [출력 형식 - JSON]
     {{ "combined": "여기에 통합 결과를 쓰세요" }}
@@ -154,20 +226,300 @@ async def MASSaC(
         max_tokens=800
     )
     out2 = resp2.choices[0].message.content
-    m2 = re.search(r"\{[\s\S]+\}$", out2)
-    combined = ""
     try:
         m2 = re.search(r"\{[\s\S]+\}", out2)
         if m2:
             parsed = json.loads(m2.group(0))
-            combined = parsed.get("combined", "")
-        else:
-            combined = "요약을 통합하는 데 실패했어요. 다시 시도해 주세요."
+            return parsed.get("combined", "")
+        return COMBINE_FAILED_MESSAGE
     except Exception as e:
         print(f"❗ 통합 요약 파싱 실패: {e}")
-        combined = "요약을 통합하는 데 실패했어요. 다시 시도해 주세요."
+        return COMBINE_FAILED_MESSAGE
+
+
+async def _combine_summaries_stream(summaries: list[str], model: str):
+    """
+    _combine_summaries 의 스트리밍 버전
+    - JSON 대신 본문만 출력하게 해서 생성되는 토큰을 바로 흘려보냄
+    """
+    combined_prompt = f"""
+    아래는 여러 뉴스 요약입니다.
+    - 경계선 지능형 장애인 수준의 사용자도 이해할 수 있도록 한 문장에 하나의 정보만 담고, 어려운 말은 쉬운 말로 바꿔주세요.
+    - 중복 없이 하나의 쉽고 명확한 이야기로 이어 붙이세요.
+    - 마지막에 '이상이 오늘의 뉴스입니다.'로 마무리.
+
+    [요약 목록]
+    {json.dumps(summaries, ensure_ascii=False, indent=2)}
+
+    [출력 형식]
+    통합한 이야기 본문만 출력하세요. (JSON, 제목, 머리말 없이)
+    """
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "너는 어린이용 뉴스 편집자야."},
+            {"role": "user", "content": combined_prompt}
+        ],
+        temperature=0.2,
+        max_tokens=800,
+        stream=True
+    )
+    async for part in stream:
+        if not part.choices:
+            continue
+        delta = part.choices[0].delta.content
+        if delta:
+            yield delta
+
+
+class _StageTimer:
+    """MASSaC 단계별 소요 시간(초) 기록"""
 
-    return {
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        self.timings[stage] = round(now - self._start, 3)
+        self._start = now
+
+
+async def _lookup_article_summaries(hashes: list[str]) -> tuple[list[str | None], list[int]]:
+    """
+    기사별 요약 캐시 확인
+    - slots[i]: i번째 기사의 요약 (캐시 적중 시 채워짐, 없으면 None)
+    - pending: 새로 요약해야 하는 기사 인덱스
+    """
+    slots = await SUMMARY_CACHE.aget_many([ARTICLE_SUMMARY_PREFIX + h for h in hashes])
+    pending = [i for i, cached in enumerate(slots) if cached is None]
+    print(f"♻️ 기사 요약 캐시 적중: {len(hashes) - len(pending)}개 / 새로 요약: {len(pending)}개")
+    return slots, pending
+
+
+def _split_pending(chunks: list[list[str]], pending: list[int]) -> list[list[int]]:
+    """청크마다 어떤 기사 인덱스들이 들어갔는지 (청크 분할은 순서를 유지)"""
+    chunk_idxs, offset = [], 0
+    for chunk in chunks:
+        chunk_idxs.append(pending[offset:offset + len(chunk)])
+        offset += len(chunk)
+    return chunk_idxs
+
+
+async def _store_chunk_summaries(
+    chunk_idxs: list[int],
+    summaries: list[str],
+    slots: list[str | None],
+    loose: list[str],
+    hashes: list[str]
+) -> bool:
+    """
+    청크 요약 결과 저장 (기사별로 나눠 저장했으면 True)
+    - 기사 수와 요약 수가 맞을 때만 기사별 slot + 캐시에 저장
+    - 개수가 어긋나면 어느 기사 요약인지 알 수 없으므로 loose 에만 모음 (통합 이야기에는 사용)
+    """
+    if len(summaries) == len(chunk_idxs):
+        for idx, summary in zip(chunk_idxs, summaries):
+            slots[idx] = summary
+        await SUMMARY_CACHE.aset_many(
+            [(ARTICLE_SUMMARY_PREFIX + hashes[idx], summary) for idx, summary in zip(chunk_idxs, summaries)]
+        )
+        return True
+    loose.extend(summaries)
+    return False
+
+
+def _all_summaries(slots: list[str | None], loose: list[str]) -> list[str]:
+    """통합 이야기 재료: 기사 순서대로의 요약 + 기사별로 나누지 못한 요약"""
+    return [summary for summary in slots if summary is not None] + loose
+
+
+def _article_results(
+    url_text_pairs: list[tuple[str, str]],
+    slots: list[str | None]
+) -> list[tuple[str, str | None]]:
+    """입력 기사 순서 그대로 (URL, 요약) — 요약하지 못한 기사는 None"""
+    return [(url, summary) for (url, _), summary in zip(url_text_pairs, slots)]
+
+
+def _combined_ok(combined: str) -> bool:
+    """통합 이야기가 실제로 만들어졌는지 (실패 문구/빈 문자열이면 False)"""
+    return bool(combined.strip()) and combined != COMBINE_FAILED_MESSAGE
+
+
+async def _cache_combined(combined_key: str, slots: list[str | None], loose: list[str], result: dict):
+    if result["ok"] and not loose and None not in slots:
+        await SUMMARY_CACHE.aset(combined_key, json.dumps(result, ensure_ascii=False))
+
+
+NO_ARTICLE_MESSAGE = "요약할 기사를 찾을 수 없습니다. 다시 시도해 주세요."
+# 요약에 실패했거나 시간 초과된 기사 자리에 보여 줄 문구
+ARTICLE_SUMMARY_FAILED_MESSAGE = "이 기사는 요약하지 못했어요."
+
+
+# --------------------------------------------------------
+# NEW: 요약 + 쉬운 언어 변환 → 청크 단위로 처리 + 최종 통합
+# --------------------------------------------------------
+async def MASSaC(
+    url_text_pairs: list[tuple[str, str]]
+) -> dict[str, list[str] | str]:
+    """
+    함수 뜻: multi_article_simplified_summary_and_combine
+    0) 기사 본문 해시로 캐시 확인 → 이미 요약한 기사는 재사용
+    1) 토큰 한도 검사 → 필요 시 자동 청크 분할 (캐시에 없는 기사만)
+    2) 각 청크별로 500자 요약 + 쉬운 말투 재작성 → summaries 수집 (청크 병렬 처리)
+    3) 모든 summaries를 마지막에 한 번의 프롬프트로 통합 (기사 해시 묶음으로 캐시)
+    - 반환: { "ok": bool, "articles": [(url, 요약 | None), ...], "summaries": [...], "combined": "...", "timings": {단계: 초} }
+      ok=False 이면 combined 는 사용자에게 보여 줄 실패 안내 문구 (TTS로 읽지 않음)
+      articles 는 입력 기사 순서 그대로 (요약 실패/시간 초과 기사는 None)
+      summaries 는 통합에 쓴 요약 목록 (기사와 1:1 대응하지 않을 수 있음)
+    """
+    model = "gpt-4o"
+    # 모델 한도 대비 여유분 둔 임계치 (예: 32K 한도 중 28K 토큰으로)
+    max_input_tokens = 28_000
+
+    print(f"📊 받은 기사 수: {len(url_text_pairs)}개")
+    timer = _StageTimer()
+    hashes = [article_hash(text) for _, text in url_text_pairs]
+
+    # 0-a) 같은 기사 묶음의 통합 결과가 있으면 바로 반환
+    combined_key = _combined_key(hashes)
+    cached_result = await SUMMARY_CACHE.aget(combined_key)
+    if cached_result is not None:
+        print("♻️ 통합 요약 캐시 적중")
+        timer.lap("cache")
+        return {**json.loads(cached_result), "timings": timer.timings}
+
+    # 0-b) 기사별 요약 캐시 확인
+    slots, pending = await _lookup_article_summaries(hashes)
+    timer.lap("cache")
+
+    # 1) 청크 분할 (캐시에 없는 기사만)
+    chunks = chunk_url_text_pairs([url_text_pairs[i] for i in pending], model, max_input_tokens)
+    timer.lap("chunk")
+
+    # 2) 청크별 요약 + 쉬운 말투 변환 (summaries만) → 병렬 실행
+    chunk_results = await _summarize_chunks_parallel(chunks, model)
+    timer.lap("summarize")
+
+    loose: list[str] = []
+    for chunk_idxs, summaries in zip(_split_pending(chunks, pending), chunk_results):
+        if summaries is not None:
+            await _store_chunk_summaries(chunk_idxs, summaries, slots, loose, hashes)
+
+    all_summaries = _all_summaries(slots, loose)
+    articles = _article_results(url_text_pairs, slots)
+
+    if not all_summaries:
+        return {
+            "ok": False,
+            "articles": articles,
+            "summaries": [],
+            "combined": NO_ARTICLE_MESSAGE,
+            "timings": timer.timings
+        }
+
+    # 3) 최종 통합
+    combined = await _combine_summaries(all_summaries, model)
+    timer.lap("combine")
+    print(f"⏱️ MASSaC 단계별 시간: {timer.timings}")
+
+    result = {
+        "ok": _combined_ok(combined),
+        "articles": articles,
         "summaries": all_summaries,
         "combined": combined
     }
+    await _cache_combined(combined_key, slots, loose, result)
+    return {**result, "timings": timer.timings}
+
+
+async def MASSaC_stream(url_text_pairs: list[tuple[str, str]]):
+    """
+    MASSaC 스트리밍 버전 (async generator) → (이벤트 이름, 데이터) 를 차례로 yield
+    - ("summary", {"index", "summary"}): 기사 요약이 준비될 때마다 (캐시 적중은 즉시, index = 입력 기사 위치)
+    - ("token", {"text"}): 통합 이야기가 생성되는 대로
+    - ("done", {"ok", "articles", "summaries", "combined", "timings"}): 마지막 결과 (MASSaC 반환값과 같은 형태)
+    """
+    model = "gpt-4o"
+    max_input_tokens = 28_000
+
+    print(f"📊 [stream] 받은 기사 수: {len(url_text_pairs)}개")
+    timer = _StageTimer()
+    hashes = [article_hash(text) for _, text in url_text_pairs]
+
+    # 0-a) 통합 결과 캐시 적중 → 한 번에 흘려보냄
+    combined_key = _combined_key(hashes)
+    cached_result = await SUMMARY_CACHE.aget(combined_key)
+    if cached_result is not None:
+        result = json.loads(cached_result)
+        timer.lap("cache")
+        for i, (_, summary) in enumerate(result["articles"]):
+            yield "summary", {"index": i, "summary": summary}
+        yield "token", {"text": result["combined"]}
+        yield "done", {**result, "timings": timer.timings}
+        return
+
+    # 0-b) 기사별 요약 캐시 확인 → 적중한 기사는 바로 전송
+    slots, pending = await _lookup_article_summaries(hashes)
+    for i, summary in enumerate(slots):
+        if summary is not None:
+            yield "summary", {"index": i, "summary": summary}
+    timer.lap("cache")
+
+    # 1) 청크 분할
+    chunks = chunk_url_text_pairs([url_text_pairs[i] for i in pending], model, max_input_tokens)
+    chunk_idxs_list = _split_pending(chunks, pending)
+    timer.lap("chunk")
+
+    # 2) 청크 병렬 요약 → 끝나는 순서대로 기사 요약 전송
+    async def _indexed(n: int, chunk: list[str]) -> tuple[int, list[str] | None]:
+        return n, await _summarize_chunk_guarded(n + 1, chunk, model)
+
+    loose: list[str] = []
+    tasks = [asyncio.create_task(_indexed(n, chunk)) for n, chunk in enumerate(chunks)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            n, summaries = await next_done
+            if summaries is None:
+                continue
+            # 기사별로 나누지 못한 요약은 어느 기사 것인지 모르므로 summary 이벤트 없이 통합에만 사용
+            if await _store_chunk_summaries(chunk_idxs_list[n], summaries, slots, loose, hashes):
+                for idx in chunk_idxs_list[n]:
+                    yield "summary", {"index": idx, "summary": slots[idx]}
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 청크 요청 취소
+        for task in tasks:
+            task.cancel()
+    timer.lap("summarize")
+
+    all_summaries = _all_summaries(slots, loose)
+    articles = _article_results(url_text_pairs, slots)
+    if not all_summaries:
+        yield "done", {
+            "ok": False,
+            "articles": articles,
+            "summaries": [],
+            "combined": NO_ARTICLE_MESSAGE,
+            "timings": timer.timings
+        }
+        return
+
+    # 3) 최종 통합 → 토큰 단위 스트리밍
+    parts: list[str] = []
+    try:
+        async for delta in _combine_summaries_stream(all_summaries, model):
+            parts.append(delta)
+            yield "token", {"text": delta}
+        combined = "".join(parts).strip()
+    except Exception as e:
+        print(f"❗ 통합 요약 스트리밍 실패: {e}")
+        combined = COMBINE_FAILED_MESSAGE
+        if not parts:
+            yield "token", {"text": combined}
+    timer.lap("combine")
+    print(f"⏱️ MASSaC(stream) 단계별 시간: {timer.timings}")
+
+    result = {"ok": _combined_ok(combined), "articles": articles, "summaries": all_summaries, "combined": combined}
+    await _cache_combined(combined_key, slots, loose, result)
+    yield "done", {**result, "timings": timer.timings}
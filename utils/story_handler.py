@@ -1,23 +1,14 @@
 #utils\story_handler.py
 
 import re
-from random import choice
 from fastapi import HTTPException
 from utils.story_cleaner import process_user_story
-from models import SummaryNote, OtherUserRecord
-from database import SessionLocal
-from routers.tts_router import get_tts_audio_url
+from services.story_repository import random_other_user_story_async, save_user_story_async
+from services.tts_service import get_tts_audio_url
 
 # 실패 횟수 추적용 임시 메모리
 fail_count_map = {}
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 async def handle_story_interaction(text: str, session_state: str, username: str | None):
     if session_state == "initial":
         if re.search(r"내가.*(이야기|얘기)", text):
@@ -35,11 +26,8 @@ async def handle_story_interaction(text: str, session_state: str, username: str
             return await respond("그래, 어떤 이야기야?", "awaiting_story")
 
         elif re.search(r"(얘기해줘|재밌는 얘기\s*있니|...)", text):  # 생략
-            from requests import get
-            r = get("http://localhost:8000/other-user-records/")
-            stories = r.json()
-            if stories:
-                selected = choice(stories)
+            selected = await random_other_user_story_async()
+            if selected:
                 return await respond(f"그럼 내가 해줄게! {selected['title']}... {selected['content']}", "complete")
             return await respond("아직 들려줄 이야기가 없어. 너가 하나 말해줄래?", "awaiting_choice")
 
@@ -70,29 +58,8 @@ async def handle_story_interaction(text: str, session_state: str, username: str
         topic = story_data.get("topic", "기타")
 
         try:
-            db = next(get_db())
-
-            # SummaryNote 저장
-            note = SummaryNote(
-                sum_title=title,
-                content=cleaned,
-                username=username,
-                region=region,
-                topic=topic
-            )
-            db.add(note)
-
-            # OtherUserRecord 저장
-            record = OtherUserRecord(
-                title=title,
-                content=cleaned,
-                author=username,
-                region=region,
-                topic=topic
-            )
-            db.add(record)
-
-            db.commit()
+            # SummaryNote + OtherUserRecord 저장
+            await save_user_story_async(username, title, cleaned, region, topic)
             print("✅ DB 저장 성공 (summary_notes + other_user_records)")
 
         except Exception as e:
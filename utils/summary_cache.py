@@ -0,0 +1,217 @@
+# 요약 결과 영구 캐시 (SQLite)
+# utils/summary_cache.py
+
+import os
+import time
+import pickle
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", "summary_cache.db")
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", str(7 * 24 * 3600)))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "20000"))
+# 다른 워커가 쓰는 중일 때 잠금을 기다리는 최대 시간(초) → 넘기면 캐시 미스로 처리
+SUMMARY_CACHE_BUSY_TIMEOUT = float(os.getenv("SUMMARY_CACHE_BUSY_TIMEOUT", "2"))
+LEGACY_PICKLE_PATH = "summary_cache.pkl"
+
+# 몇 번 쓸 때마다 만료/용량 정리를 할지
+_EVICT_EVERY = 100
+
+
+class SummaryCache:
+    """
+    key → 요약 문자열을 저장하는 SQLite 캐시
+    - 한 건씩 upsert (전체 파일 재작성 없음)
+    - TTL 만료 + 최대 개수 초과 시 가장 오래 안 쓰인 항목부터 삭제(LRU)
+    - 첫 사용 시점에 연결(지연 로딩), WAL 모드로 여러 uvicorn 워커가 함께 사용
+    - 비동기 코드에서는 aget/aget_many/aset/aset_many 사용: SQLite 호출(잠금 대기 포함)을
+      전용 스레드 하나에서 실행해 이벤트 루프를 막지 않음
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = SUMMARY_CACHE_TTL,
+        max_entries: int = SUMMARY_CACHE_MAX_ENTRIES,
+        legacy_pickle: str | None = None
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.legacy_pickle = legacy_pickle
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ── 연결 관리 ──
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=SUMMARY_CACHE_BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(SUMMARY_CACHE_BUSY_TIMEOUT * 1000)}")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_schema(conn)
+                    self._initialized = True
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed "
+            "ON summary_cache(accessed_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_summary_cache_created "
+            "ON summary_cache(created_at)"
+        )
+        self._import_legacy_pickle(conn)
+
+    def _import_legacy_pickle(self, conn: sqlite3.Connection):
+        """기존 summary_cache.pkl 이 있으면 비어 있는 DB로 한 번만 옮겨옴"""
+        if not self.legacy_pickle or not os.path.exists(self.legacy_pickle):
+            return
+        if conn.execute("SELECT 1 FROM summary_cache LIMIT 1").fetchone():
+            return
+        try:
+            with open(self.legacy_pickle, "rb") as f:
+                legacy = pickle.load(f)
+            now = time.time()
+            conn.executemany(
+                "INSERT OR IGNORE INTO summary_cache VALUES (?, ?, ?, ?)",
+                [(str(k), str(v), now, now) for k, v in legacy.items()]
+            )
+            print(f"📂 기존 pickle 캐시 이전 완료: {len(legacy)}개")
+        except Exception as e:
+            print(f"❗ pickle 캐시 이전 실패: {e}")
+
+    # ── 조회/저장 ──
+    def get(self, key: str) -> str | None:
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM summary_cache WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE summary_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+        except sqlite3.Error as e:
+            print(f"❗ 캐시 조회 실패: {e}")
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str):
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                """
+                INSERT INTO summary_cache (key, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, value, now, now)
+            )
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            print(f"❗ 캐시 저장 실패: {e}")
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    # ── 비동기 조회/저장 (전용 스레드) ──
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._init_lock:
+                if self._executor is None:
+                    # 스레드 하나 → 연결 하나, 쓰기도 이 프로세스 안에서는 순서대로
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary-cache")
+        return self._executor
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+
+    async def aget(self, key: str) -> str | None:
+        return await self._run(self.get, key)
+
+    async def aget_many(self, keys: list[str]) -> list[str | None]:
+        """여러 키를 스레드 왕복 한 번에 조회 (입력 순서대로)"""
+        return await self._run(lambda: [self.get(key) for key in keys])
+
+    async def aset(self, key: str, value: str):
+        await self._run(self.set, key, value)
+
+    async def aset_many(self, items: list[tuple[str, str]]):
+        await self._run(lambda: [self.set(key, value) for key, value in items])
+
+    # ── 정리 ──
+    def evict(self):
+        """TTL 지난 항목 삭제 후, 최대 개수를 넘으면 LRU 순으로 삭제"""
+        conn = self._connect()
+        conn.execute(
+            "DELETE FROM summary_cache WHERE created_at < ?", (time.time() - self.ttl,)
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                """
+                DELETE FROM summary_cache WHERE key IN (
+                    SELECT key FROM summary_cache ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+
+    def __len__(self) -> int:
+        (count,) = self._connect().execute("SELECT COUNT(*) FROM summary_cache").fetchone()
+        return count
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        try:
+            size = len(self)
+        except sqlite3.Error as e:
+            # DB 잠김/손상이어도 지표 조회(/metrics/)는 실패하지 않도록
+            print(f"⚠️ 요약 캐시 크기 조회 실패: {e}")
+            size = None
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+        }
+
+
+# text_processor / news_processor 가 함께 쓰는 공유 인스턴스
+SUMMARY_CACHE = SummaryCache(SUMMARY_CACHE_PATH, legacy_pickle=LEGACY_PICKLE_PATH)
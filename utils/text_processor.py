@@ -3,23 +3,13 @@ import os
 from dotenv import load_dotenv
 from openai import OpenAI, AsyncOpenAI
 import re
-import pickle
 
 from utils.keyword_extractor import (
-    extract_keyword_from_text,
+    extract_keyword_from_text_async,
     extract_passages_by_keywords
 )
-
-CACHE_PATH = "summary_cache.pkl"
-SUMMARY_CACHE = {}
-# 서버 시작 시 캐시 로드
-if os.path.exists(CACHE_PATH):
-    try:
-        with open(CACHE_PATH, "rb") as f:
-            SUMMARY_CACHE = pickle.load(f)
-        print(f"📂 캐시 로드 완료: {len(SUMMARY_CACHE)}개")
-    except Exception as e:
-        print(f"❗ 캐시 로드 실패: {e}")
+# news_processor 와 같은 SQLite 캐시를 공유 (첫 조회 시 연결)
+from utils.summary_cache import SUMMARY_CACHE
 
 
 load_dotenv()
@@ -98,18 +88,17 @@ async def summarize_article_pipeline(url: str, text: str, user_query: str, windo
     + 캐시 적용
     """
     cache_key = f"{url}|{user_query}"
-    if cache_key in SUMMARY_CACHE:
-        return SUMMARY_CACHE[cache_key]
+    cached = await SUMMARY_CACHE.aget(cache_key)
+    if cached is not None:
+        return cached
 
-    keywords = extract_keyword_from_text(user_query)
+    keywords = await extract_keyword_from_text_async(user_query)
     filtered = extract_passages_by_keywords(text, keywords, window=window)
 
     short = await long_article_summary(filtered)            
     simplified = await simplify_for_borderline(short)      
 
-    SUMMARY_CACHE[cache_key] = simplified
-    with open(CACHE_PATH, "wb") as f:
-        pickle.dump(SUMMARY_CACHE, f)
+    await SUMMARY_CACHE.aset(cache_key, simplified)
 
     return simplified
 
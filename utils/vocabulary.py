@@ -0,0 +1,224 @@
+# 도메인 어휘 / 의도 키워드 목록과 이를 한 번에 찾는 매처
+# utils/vocabulary.py
+#
+# 목록은 import 시 Aho–Corasick 자동자 하나로 묶어 두고,
+# 입력 분류·검색어 정제·키워드 추출이 모두 이 매처를 사용
+
+import re
+from utils.aho_corasick import AhoCorasick
+
+# 샘플 인물 리스트
+person_keywords = [
+    # 정치 인물
+    '윤석열', '이재명', '김기현', '한동훈', '이낙연', '홍준표', '유승민', '안철수', '오세훈', '원희룡',
+    '추미애', '박지원', '심상정', '조국', '한덕수', '정은경', '박근혜', '문재인', '이명박', '노무현',
+    '전두환', '김대중', '김영삼',
+
+    # 해외 정치인
+    '바이든', '트럼프', '시진핑', '김정은', '김여정', '푸틴', '기시다', '마크롱', '메르켈',
+    '젤렌스키', '나렌드라 모디', '보리스 존슨', '리시 수낙', '올라프 숄츠', '카말라 해리스',
+
+    # 경제계 유명 인사
+    '이재용', '정의선', '최태원', '구광모', '신동빈', '엘론 머스크', '마크 저커버그', '제프 베이조스', 
+    '팀 쿡', '손정의', '워런 버핏', '빌 게이츠', '잭 마',
+
+    # 연예·스포츠 유명 인사
+    '손흥민', '이강인', '김연아', '류현진', '이정후', '임영웅', 'BTS', '블랙핑크', '유재석', 
+    '아이유', '전지현', '송중기', '현빈', '이병헌', '차은우',
+
+    # 기타 사회적으로 유명한 인물
+    '조코비치', '페더러', '메시', '호날두', '박항서', '손석희', '이국종', '백종원', '강형욱',
+    '윤여정', '봉준호', '황선우', '추신수'
+]
+
+# 샘플 지역 리스트
+location_keywords = [
+    '서울', '부산', '대구', '광주', '인천', '울산', '대전', '세종', '수원', '성남',
+    '고양', '용인', '창원', '청주', '전주', '포항', '여수', '천안', '안산', '제주',
+    '강릉', '춘천', '평창', '경주', '군산', '목포', '진주', '김해', '양산',
+    
+    # 북한 주요 지역 (뉴스에 자주 등장)
+    '평양', '개성', '함흥', '신의주',
+
+    # 해외 주요 도시 (자주 등장)
+    '뉴욕', '워싱턴', '베이징', '상하이', '도쿄', '오사카', '런던', '파리', '베를린',
+    '모스크바', '홍콩', '싱가포르', '두바이', '로스앤젤레스', '실리콘밸리'
+]
+
+# 샘플 경제 키워드
+economy_keywords = [
+    # 국내 주요 기업·그룹
+    '삼성', 'LG', '현대자동차', '기아', 'SK하이닉스', '카카오', '네이버', '롯데', '한화', '포스코', '쿠팡', '셀트리온',
+    'CJ', 'KT', '신세계', '아모레퍼시픽', '하나은행', '신한은행', 'KB국민은행',
+
+    # 해외 기업
+    '애플', '테슬라', '엔비디아', '아마존', '구글', '알파벳', '넷플릭스', '메타', '마이크로소프트', '페이스북',
+    '화웨이', '샤오미', '텐센트', '알리바바',
+
+    # 주요 경제지표·분야
+    '코스피', '코스닥', '나스닥', '다우존스', 'S&P500', '주식시장', '증시', '환율', '금리', '물가', '인플레이션',
+    '부동산', '아파트 가격', '전세', '월세', '주택시장', '청약', '분양',
+
+    # 금융·기술 이슈
+    '비트코인', '이더리움', '암호화폐', '가상화폐', 'NFT', '블록체인', '핀테크', '스타트업', '창업', '벤처기업',
+    '유니콘', 'IPO', '공모주', '한국은행', '미국 증시', '중국 경제', '무역수지', '수출입',
+
+    # 글로벌 경제 상황
+    '경제 위기', '침체', '호황', '불황', '구조조정', '실업률', '고용', '경기침체', '반도체', '자동차 산업', '조선업'
+]
+
+environment_keywords = {"미세먼지", "황사", "초미세먼지", "대기질"}
+
+# 경제 전용 지표 키워드 (키워드 추출에서 경제 도메인 감지용)
+ECONOMY_TOPICS = {
+    '금리', '물가', '환율', '실업률', '수출', '수입', '경기침체', '한국은행',
+    '기준금리', '고용', '무역수지', '재정적자', '증시', '코스피', '코스닥',
+    '부동산', '인플레이션', '청약', '분양', '소득', '임금'
+}
+
+# 입력 분류용 의도 키워드
+WEATHER_INTENT_KEYWORDS = [
+    "날씨", "기온", "비", "기상", "온도", "추워", "더워",
+    "눈", "습도", "바람", "태풍", "호우", "소나기", "맑아",
+    "흐려", "구름", "천둥", "번개", "미끄러워", "추운지", "더운지",
+    "덥니", "춥니", "더위", "추위", "쌀쌀", "따뜻", "선선",
+    "습한지", "건조한지", "장마", "우박", "강수량", "일기예보"
+]
+
+NEWS_INTENT_KEYWORDS = [
+    "뉴스", "속보", "기사", "보도", "이슈", "소식", "정보",
+    "헤드라인", "최신 소식", "사건", "사고", "정치", "경제", "사회", "문화",
+    "스포츠", "국제", "사건사고", "사망", "사고 발생", "정책", "공약",
+    "주가", "증시", "부동산", "대통령", "선거", "투표", "전쟁",
+    "갈등", "시위", "집회", "데모", "환경", "오염", "미세먼지",
+    "초미세먼지", "황사", "대기질", "바이러스", "코로나", "확진자",
+    "재난", "사태", "지진", "홍수", "화재", "태풍 피해", "기후변화",
+    "북한", "미국", "중국", "일본", "경제위기", "환율", "물가", "인플레이션"
+]
+
+STORY_INTENT_KEYWORDS = [
+    "얘기", "이야기", "들려줘", "말해줘", "이야기해줄래",
+    "재밌는 얘기", "이야기 하나", "말해줄게", "내가 말할게",
+    "옛날 이야기", "동화", "전설", "옛날 얘기", "무서운 얘기",
+    "슬픈 얘기", "재미있는 이야기", "웃긴 얘기", "감동적인 이야기",
+    "좋은 이야기", "행복한 이야기", "즐거운 이야기", "자기 이야기",
+    "추억 이야기", "경험담", "사연", "스토리", "얘기해줘", "들어줘",
+    "들려줄까", "썰 풀어줘", "썰 풀게", "썰 들어봐", "나 얘기할래",
+    "심심해", "지루해", "놀아줘", "외로워", "한마디 해줘"
+]
+
+# "말해줘", "들려줘"는 너무 일반적이라 단독으로는 이야기 요청으로 보지 않음
+GENERIC_STORY_KEYWORDS = {"말해줘", "들려줘"}
+
+# 규칙만으로 바로 답해도 될 만큼 의도가 분명한 키워드 (분류 캐스케이드의 빠른 경로)
+# - 이 키워드가 한 의도에서만 나오고, 다른 의도의 키워드가 섞여 있지 않을 때만 사용
+# - 어절 단위로 쓰였을 때만 인정 ("뉴스룸", "날씨앱" 같은 부분 문자열은 제외)
+# - 어절 그대로도 뜻이 갈리는 말은 넣지 않음
+#   ("기사" = 운전기사/기사 자격증, "보도" = 인도, "우산" = 물건 이야기)
+STRONG_WEATHER_INTENT_KEYWORDS = [
+    "날씨", "기온", "일기예보", "강수량", "습도"
+]
+
+STRONG_NEWS_INTENT_KEYWORDS = [
+    "뉴스", "속보", "헤드라인"
+]
+
+STRONG_STORY_INTENT_KEYWORDS = [
+    "이야기해줄래", "재밌는 얘기", "재미있는 이야기", "옛날 이야기", "옛날 얘기",
+    "내가 말할게", "말해줄게", "나 얘기할래", "얘기해줘", "얘기해줄게",
+    "심심해", "놀아줘", "외로워", "경험담"
+]
+
+# 강한 키워드가 들어 있는 어절에서 키워드 뒤에 붙어도 되는 조사·어미 ("날씨는요", "뉴스에서")
+INTENT_KEYWORD_SUFFIXES = [
+    "이", "가", "은", "는", "을", "를", "의", "도", "만", "좀", "요",
+    "에", "에서", "에는", "에도", "로", "으로", "랑", "이랑", "하고", "와", "과",
+    "부터", "까지", "나", "이나", "야", "이야", "예요", "이에요"
+]
+
+_SUFFIX_TAIL = re.compile(
+    "(?:" + "|".join(sorted(INTENT_KEYWORD_SUFFIXES, key=len, reverse=True)) + ")*"
+)
+
+# 키워드 추출의 도메인 감지 순서 → 해당 도메인으로 보는 카테고리
+DOMAIN_CATEGORIES = {
+    'economy': {'economy', 'economy_topic'},
+    'person': {'person'},
+    'location': {'location'},
+    'environment': {'environment'},
+}
+
+# 도메인별 키워드 사전 (사전 키워드 + 전용 토픽 합침)
+DOMAIN_VOCABULARY = {
+    'economy': set(economy_keywords) | ECONOMY_TOPICS,
+    'person': set(person_keywords),
+    'location': set(location_keywords),
+    'environment': set(environment_keywords),
+}
+
+
+def _build_matcher() -> tuple[AhoCorasick, dict[str, frozenset]]:
+    matcher = AhoCorasick()
+    matcher.add_all(person_keywords, "person")
+    matcher.add_all(location_keywords, "location")
+    matcher.add_all(economy_keywords, "economy")
+    matcher.add_all(ECONOMY_TOPICS, "economy_topic")
+    matcher.add_all(environment_keywords, "environment")
+    matcher.add_all(NEWS_INTENT_KEYWORDS, "news")
+    matcher.add_all(WEATHER_INTENT_KEYWORDS, "weather")
+    matcher.add_all(
+        [kw for kw in STORY_INTENT_KEYWORDS if kw not in GENERIC_STORY_KEYWORDS], "story"
+    )
+    matcher.add_all(STRONG_WEATHER_INTENT_KEYWORDS, "weather_strong")
+    matcher.add_all(STRONG_NEWS_INTENT_KEYWORDS, "news_strong")
+    matcher.add_all(STRONG_STORY_INTENT_KEYWORDS, "story_strong")
+    matcher.build()
+    index = {word: frozenset(payloads) for word, payloads in matcher._payloads.items()}
+    return matcher, index
+
+
+VOCABULARY_MATCHER, _WORD_CATEGORIES = _build_matcher()
+
+
+def find_vocabulary(text: str) -> list[tuple[int, int, str, str]]:
+    """텍스트를 한 번 훑어 모든 출현을 [(시작, 끝, 단어, 카테고리), ...] 로"""
+    return [
+        (start, end, word, category)
+        for start, end, word, categories in VOCABULARY_MATCHER.iter_matches(text)
+        for category in sorted(categories)
+    ]
+
+
+def vocabulary_categories(text: str) -> set[str]:
+    """텍스트에 등장한 어휘의 카테고리 집합"""
+    return VOCABULARY_MATCHER.payloads_in(text)
+
+
+def _is_eojeol_match(text: str, start: int, end: int) -> bool:
+    """어절 시작에서 시작하고, 같은 어절의 나머지가 조사·어미뿐인지"""
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    tail_end = end
+    while tail_end < len(text) and text[tail_end].isalnum():
+        tail_end += 1
+    return _SUFFIX_TAIL.fullmatch(text, end, tail_end) is not None
+
+
+def strong_intent_categories(text: str) -> set[str]:
+    """
+    어절 단위로 쓰인 강한 의도 키워드의 카테고리 집합 ("weather_strong" 등)
+    ex) "뉴스 알려줘" → {"news_strong"} / "어제 보도블럭에 넘어졌어" → set()
+    """
+    if not any(category.endswith("_strong") for category in vocabulary_categories(text)):
+        return set()
+    found: set[str] = set()
+    for start, end, _, categories in VOCABULARY_MATCHER.iter_matches(text):
+        strong = {category for category in categories if category.endswith("_strong")}
+        if strong and not strong <= found and _is_eojeol_match(text, start, end):
+            found |= strong
+    return found
+
+
+def word_categories(word: str) -> frozenset:
+    """단어 자체가 어휘 목록에 있는지 (정확히 일치) → 카테고리 집합"""
+    return _WORD_CATEGORIES.get(word, frozenset())
@@ -0,0 +1,58 @@
+# 앱 시작 시 무거운 구성 요소(분류 모델·Okt·TTS) 워밍업을 성공할 때까지 백그라운드에서 재시도
+# utils/warmup.py
+#
+# - 워밍업 함수는 블로킹 함수이고 성공하면 True (실패는 스스로 로그를 남기고 False)
+# - 데몬 스레드에서 실행 → 앱 종료 시 끝나지 않은 워밍업(다운로드 등)을 기다리지 않음
+
+import os
+import asyncio
+import threading
+from typing import Callable
+
+# 재시도 대기(초): 처음 값에서 두 배씩 늘려 최대값까지
+WARMUP_RETRY_INITIAL_DELAY = float(os.getenv("WARMUP_RETRY_INITIAL_DELAY", "5"))
+WARMUP_RETRY_MAX_DELAY = float(os.getenv("WARMUP_RETRY_MAX_DELAY", "300"))
+
+
+def _run_in_daemon_thread(fn: Callable[[], bool], name: str) -> asyncio.Future:
+    """fn을 데몬 스레드에서 실행하고 결과를 future로 (종료 시 이 스레드는 join 하지 않음)"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(result: bool | None, exc: BaseException | None):
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _target():
+        result, exc = None, None
+        try:
+            result = fn()
+        except BaseException as e:
+            exc = e
+        try:
+            loop.call_soon_threadsafe(_resolve, result, exc)
+        except RuntimeError:
+            pass  # 이미 이벤트 루프가 닫힘 (앱 종료 후 끝난 워밍업)
+
+    threading.Thread(target=_target, name=f"warmup-{name}", daemon=True).start()
+    return future
+
+
+async def warm_up_until_ready(name: str, warm_up: Callable[[], bool]):
+    """warm_up()이 성공할 때까지 지수 백오프로 재시도 (앱 수명주기에서 create_task로 실행, 종료 시 취소)"""
+    delay = WARMUP_RETRY_INITIAL_DELAY
+    attempt = 1
+    while True:
+        try:
+            if await _run_in_daemon_thread(warm_up, name):
+                return
+        except Exception as e:
+            print(f"❌ {name} 워밍업 중 예외: {e}")
+        print(f"🔁 {name} 워밍업 실패 → {delay:.0f}s 후 다시 시도 ({attempt}회 실패)")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WARMUP_RETRY_MAX_DELAY)
+        attempt += 1